@@ -0,0 +1,63 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Measures what solving on the event loop costs other tasks: the longest
+time a ticking task waits for the loop while a solve runs, and the solve
+time, for different numbers of pivots between yields, against a plain
+Simplex.solve.
+
+Usage: python bench/bench_aio.py [n] [m]
+'''
+import asyncio
+import sys
+import timeit
+
+from linprog import Simplex, Tableau
+from linprog.aio import solve
+
+import problems
+
+EVERY = [1, 10, 100, 1000]
+
+
+async def run(arr, every):
+    loop = asyncio.get_running_loop()
+    waits = []
+
+    async def ticker():
+        while True:
+            t = loop.time()
+            await asyncio.sleep(0)
+            waits.append(loop.time() - t)
+
+    task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0)
+    t = timeit.default_timer()
+    result = await solve(Tableau(arr.copy()), every=every)
+    t = timeit.default_timer() - t
+    task.cancel()
+    # With no yield, the ticker waits out the whole solve
+    return result, t, max(waits, default=t)
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 200
+    m = int(argv[2]) if len(argv) > 2 else 2 * n
+    arr = problems.feasible(n, m)
+    s = Simplex(Tableau(arr.copy()))
+    t = timeit.default_timer()
+    s.solve()
+    t = timeit.default_timer() - t
+    print('{:>6} {:>8} {:>10} {:>14}'.format('every', 'iters', 'seconds',
+                                             'max wait (ms)'))
+    print('{:>6} {:>8} {:>10.4f} {:>14}'.format('-', s.iters, t, '-'))
+    for every in EVERY:
+        result, t, wait = asyncio.run(run(arr, every))
+        print('{:>6} {:>8} {:>10.4f} {:>14.3f}'.format(every, result.iters,
+                                                       t, wait * 1e3))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
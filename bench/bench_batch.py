@@ -0,0 +1,42 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Compares solve_batch against solving the same problems one at a time.
+
+Usage: python bench/bench_batch.py [problems]
+'''
+import sys
+import timeit
+
+import numpy as np
+
+from linprog import Simplex, Tableau
+from linprog.batch import solve_batch
+
+import problems
+
+SIZES = [(5, 10), (10, 20), (20, 40)]
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 1000
+    print('{:>5} {:>5} {:>8} {:>12} {:>12}'.format(
+        'n', 'm', 'problems', 'loop s', 'batch s'))
+    for n, m in SIZES:
+        arrays = np.array([problems.feasible(n, m, seed)
+                           for seed in range(count)])
+        t = timeit.default_timer()
+        for array in arrays:
+            Simplex(Tableau(array.copy())).solve()
+        loop = timeit.default_timer() - t
+        t = timeit.default_timer()
+        solve_batch(arrays)
+        batch = timeit.default_timer() - t
+        print('{:>5} {:>5} {:>8} {:>12.4f} {:>12.4f}'.format(
+            n, m, count, loop, batch))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
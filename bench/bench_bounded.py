@@ -0,0 +1,52 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Compares solving box-constrained LPs with the bounds as rows of a Tableau
+and as native bounds of a BoundedTableau.
+
+Usage: python bench/bench_bounded.py [problems per size]
+'''
+import sys
+import timeit
+
+from linprog import Simplex, Tableau
+from linprog.bounded import BoundedTableau
+
+import problems
+
+SIZES = [(20, 40), (50, 100), (100, 200), (200, 400)]
+
+
+def solve(make):
+    T = make()
+    s = Simplex(T)
+    t = timeit.default_timer()
+    s.solve()
+    return s.iters, timeit.default_timer() - t, T.M.shape, T.z
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 3
+    print('{:>5} {:>5} {:<8} {:>11} {:>8} {:>10}'.format(
+        'n', 'm', 'bounds', 'tableau', 'iters', 'seconds'))
+    for n, m in SIZES:
+        for name in ['rows', 'native']:
+            iters = seconds = 0
+            for seed in range(count):
+                arr, upper = problems.boxed(n, m, seed)
+                if name == 'rows':
+                    make = lambda: Tableau(problems.bound_rows(arr, upper))
+                else:
+                    make = lambda: BoundedTableau(arr.copy(), upper=upper)
+                i, t, shape, _ = solve(make)
+                iters += i
+                seconds += t
+            print('{:>5} {:>5} {:<8} {:>11} {:>8.1f} {:>10.4f}'.format(
+                n, m, name, '%sx%s' % shape, iters / count,
+                seconds / count))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
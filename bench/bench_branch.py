@@ -0,0 +1,62 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Runs branch and bound on random integer LPs of growing size, with each
+node selection and number of workers, and reports node throughput, the
+Simplex iterations per warm started node against those of the cold root
+solve, and the gap reached.
+
+Usage: python bench/bench_branch.py [max nodes] [workers]
+'''
+import sys
+
+import numpy as np
+
+from linprog.branch import BranchAndBound, BEST_BOUND, DEPTH_FIRST
+
+import problems
+
+SIZES = [(10, 20), (20, 40), (40, 80)]
+
+
+def integer_lp(n, m, seed=0):
+    '''
+    A random LP with integer data, all of whose variables are integer.
+    '''
+    rng = np.random.RandomState(seed)
+    A = rng.randint(1, 20, (n, m)).astype(float)
+    b = rng.randint(10 * m, 20 * m, n).astype(float)
+    c = -rng.randint(1, 20, m).astype(float)
+    return problems.tableau_array(A, b, c)
+
+
+def main(argv):
+    max_nodes = int(argv[1]) if len(argv) > 1 else 2000
+    workers = int(argv[2]) if len(argv) > 2 else 4
+    print('{:>4} {:>4} {:<6} {:>7} {:>6} {:>8} {:>9} {:>10} {:>10} '
+          '{:>8} {:>9}'.format('n', 'm', 'select', 'workers', 'nodes',
+                               'nodes/s', 'root its', 'node its',
+                               'first inc', 'seconds', 'gap'))
+    for n, m in SIZES:
+        arr = integer_lp(n, m)
+        for selection in [BEST_BOUND, DEPTH_FIRST]:
+            for w in sorted({1, workers}):
+                bb = BranchAndBound(arr, range(m), selection=selection,
+                                    max_nodes=max_nodes, max_workers=w)
+                bb.solve()
+                root = BranchAndBound(arr, range(m), max_nodes=1)
+                root.solve()
+                first = next((p.seconds for p in bb.progress
+                              if p.z is not None), np.nan)
+                print('{:>4} {:>4} {:<6} {:>7} {:>6} {:>8.0f} {:>9} '
+                      '{:>10.2f} {:>10.4f} {:>8.3f} {:>9.2e}'.format(
+                          n, m, selection, w, bb.nodes, bb.throughput,
+                          root.iters,
+                          (bb.iters - root.iters) / max(bb.nodes - 1, 1),
+                          first, bb.seconds, bb.gap))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,54 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Compares the time to an optimal basic tableau of Simplex with that of the
+interior point method and its crossover, on random feasible LPs of
+growing size.
+
+Usage: python bench/bench_interior.py [problems per size]
+'''
+import sys
+import timeit
+
+from linprog import Simplex, Tableau
+from linprog.interior import InteriorPoint
+
+import problems
+
+SIZES = [(100, 200), (200, 400), (400, 800), (600, 1200)]
+MAX_ITERS = 10 ** 6
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 3
+    print('{:>5} {:>5} {:<9} {:>8} {:>10} {:>10} {:>9}'.format(
+        'n', 'm', 'solver', 'iters', 'crossover', 'seconds', 'z error'))
+    for n, m in SIZES:
+        rows = {'simplex': [0.] * 4, 'interior': [0.] * 4}
+        for seed in range(count):
+            arr = problems.feasible(n, m, seed)
+            T = Tableau(arr.copy())
+            s = Simplex(T, max_iters=MAX_ITERS)
+            t = timeit.default_timer()
+            s.solve()
+            t = timeit.default_timer() - t
+            for k, v in enumerate([s.iters, 0, t, 0]):
+                rows['simplex'][k] += v
+            p = InteriorPoint(arr)
+            t = timeit.default_timer()
+            p.solve()
+            t = timeit.default_timer() - t
+            for k, v in enumerate([p.iters, p.crossover_iters, t,
+                                   abs(p.tableau.z - T.z)]):
+                rows['interior'][k] += v
+        for name, (iters, crossover, seconds, error) in rows.items():
+            print('{:>5} {:>5} {:<9} {:>8.1f} {:>10.1f} {:>10.4f} '
+                  '{:>9.1e}'.format(n, m, name, iters / count,
+                                    crossover / count, seconds / count,
+                                    error / count))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
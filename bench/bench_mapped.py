@@ -0,0 +1,125 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Measures the pivot throughput of a MappedTableau on an .npy file as the
+tableau grows, against a Tableau on the same array loaded into memory,
+for an LP with a feasible slack basis and one whose slack basis is not
+feasible, which starts with Phase 0 subproblem pivots. The file is
+written one block of rows at a time, so the problem is never held in
+memory whole. Sizes larger than the memory budget are only run mapped.
+
+Usage: python bench/bench_mapped.py [pivots] [memory budget in MB]
+'''
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from linprog import Simplex, Tableau
+from linprog.mapped import MappedTableau
+
+SIZES = [(1000, 2000), (2000, 4000), (4000, 8000), (8000, 16000)]
+CHUNK_ROWS = 512
+
+
+def write_feasible(path, n, m, seed=0):
+    '''
+    Writes the tableau array of problems.feasible(n, m) to an .npy file,
+    one block of rows at a time.
+    '''
+    arr = open_memmap(path, mode='w+', dtype=float, shape=(n + 1, n + m + 1))
+    rng = np.random.RandomState(seed)
+    x = rng.uniform(0, 1, m)
+    arr[0, 1:m + 1] = rng.uniform(-1, 0, m)
+    for start in range(0, n, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, n)
+        A = rng.uniform(0, 1, (stop - start, m))
+        arr[start + 1:stop + 1, 1:m + 1] = A
+        arr[start + 1:stop + 1, 0] = A @ x + rng.uniform(0, 1, stop - start)
+        arr[start + 1 + np.arange(stop - start),
+            m + 1 + start + np.arange(stop - start)] = 1
+    arr.flush()
+    del arr
+
+
+def write_infeasible_start(path, n, m, seed=0):
+    '''
+    Writes the tableau array of problems.infeasible_start(n, m) to an .npy
+    file, one block of rows at a time.
+    '''
+    arr = open_memmap(path, mode='w+', dtype=float, shape=(n + 1, n + m + 1))
+    rng = np.random.RandomState(seed)
+    x = rng.uniform(0, 1, m)
+    arr[0, 1:m + 1] = rng.uniform(-1, 1, m)
+    for start in range(0, n, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, n)
+        A = rng.uniform(-1, 1, (stop - start, m))
+        b = A @ x + rng.uniform(0, 0.1, stop - start)
+        if stop == n:
+            # The last row bounds the sum of x
+            A[-1, :] = 1
+            b[-1] = x.sum() + 1
+        arr[start + 1:stop + 1, 1:m + 1] = A
+        arr[start + 1:stop + 1, 0] = b
+        arr[start + 1 + np.arange(stop - start),
+            m + 1 + start + np.arange(stop - start)] = 1
+    arr.flush()
+    del arr
+
+
+KINDS = [('feasible', write_feasible),
+         ('infeasible start', write_infeasible_start)]
+
+
+def pivots(T, count):
+    '''
+    Times count iterations of Simplex, status checks included. Returns the
+    time and the peak memory allocated by them in MB.
+    '''
+    s = Simplex(T)
+    it = iter(s)
+    tracemalloc.start()
+    t = timeit.default_timer()
+    for _ in range(count):
+        next(it, None)
+    t = timeit.default_timer() - t
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return t, peak
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 10
+    budget = float(argv[2]) if len(argv) > 2 else 1024
+    print('{:<16} {:>6} {:>6} {:>9} {:<7} {:>10} {:>9} {:>9}'.format(
+        'kind', 'n', 'm', 'MB', 'tableau', 'pivots/s', 'MB/s', 'peak MB'))
+    with tempfile.TemporaryDirectory() as directory:
+        for n, m in SIZES:
+            for kind, write in KINDS:
+                path = os.path.join(directory, 'tableau.npy')
+                write(path, n, m)
+                mb = (n + 1) * (n + m + 1) * 8 / 2 ** 20
+                runs = [('mapped', lambda: MappedTableau.open(
+                    path, chunk_rows=CHUNK_ROWS))]
+                if mb <= budget:
+                    runs.insert(0, ('memory',
+                                    lambda: Tableau(np.load(path))))
+                for name, make in runs:
+                    T = make()
+                    t, peak = pivots(T, count)
+                    print('{:<16} {:>6} {:>6} {:>9.0f} {:<7} {:>10.2f} '
+                          '{:>9.0f} {:>9.1f}'.format(
+                              kind, n, m, mb, name, count / t,
+                              mb * count / t, peak))
+                    del T
+                os.remove(path)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,39 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Compares solve_many across worker counts against a sequential loop.
+
+Usage: python bench/bench_parallel.py [problems] [n] [m]
+'''
+import os
+import sys
+import timeit
+
+from linprog import Simplex, Tableau
+from linprog.parallel import solve_many
+
+import problems
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 200
+    n = int(argv[2]) if len(argv) > 2 else 50
+    m = int(argv[3]) if len(argv) > 3 else 100
+    arrays = [problems.feasible(n, m, seed) for seed in range(count)]
+    t = timeit.default_timer()
+    for array in arrays:
+        Simplex(Tableau(array.copy())).solve()
+    print('{:>8} {:>10.4f}'.format('loop', timeit.default_timer() - t))
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        t = timeit.default_timer()
+        solve_many(arrays, max_workers=workers)
+        print('{:>8} {:>10.4f}'.format(workers,
+                                       timeit.default_timer() - t))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(sys.argv)
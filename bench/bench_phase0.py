@@ -0,0 +1,54 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Times Simplex's Phase 0 on problems whose slack basis is infeasible, so
+that it takes many subproblem pivots.
+
+Usage: python bench/bench_phase0.py [problems per size]
+'''
+import sys
+import timeit
+
+from linprog import Simplex, Tableau, RevisedTableau
+from linprog.trace import SUBPROBLEM
+
+import problems
+
+SIZES = [(20, 40), (50, 100), (100, 200), (200, 400)]
+TABLEAUS = [('dense', Tableau), ('revised', RevisedTableau)]
+
+
+def bench(n, m, tableau, count):
+    '''
+    Returns the mean Phase 0 iterations, subproblem pivots and seconds.
+    '''
+    iters = subproblem = seconds = 0
+    for seed in range(count):
+        s = Simplex(tableau(problems.infeasible_start(n, m, seed)),
+                    trace=True)
+        t = timeit.default_timer()
+        for _ in s._phase0():
+            pass
+        seconds += timeit.default_timer() - t
+        iters += s.iters
+        subproblem += (s.trace.records['phase'] == SUBPROBLEM).sum()
+    return iters / count, subproblem / count, seconds / count
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 3
+    print('{:<8} {:>5} {:>5} {:>8} {:>11} {:>10} {:>12}'.format(
+        'tableau', 'n', 'm', 'iters', 'subproblem', 'seconds',
+        'sec/pivot'))
+    for name, tableau in TABLEAUS:
+        for n, m in SIZES:
+            iters, subproblem, seconds = bench(n, m, tableau, count)
+            print('{:<8} {:>5} {:>5} {:>8.1f} {:>11.1f} {:>10.4f} {:>12.3g}'
+                  .format(name, n, m, iters, subproblem, seconds,
+                          seconds / max(iters, 1)))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,44 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Times Tableau.pivot on random dense tableaus of growing size.
+
+Usage: python bench/bench_pivot.py [repeats]
+'''
+import sys
+import timeit
+
+import numpy as np
+
+from linprog import Tableau
+
+SIZES = [(10, 20), (100, 200), (500, 1000), (1000, 2000), (2000, 4000)]
+
+
+def random_tableau(n, m, seed=0):
+    rng = np.random.RandomState(seed)
+    return Tableau(rng.uniform(-1, 1, (n, m)) + 2 * np.eye(n, m, 1))
+
+
+def bench_pivot(n, m, repeats):
+    T = random_tableau(n, m)
+    rows = np.arange(repeats) % (n - 1) + 1
+    cols = rows.copy()
+    t = timeit.default_timer()
+    for r, c in zip(rows, cols):
+        T.pivot(r, c)
+    return (timeit.default_timer() - t) / repeats
+
+
+def main(argv):
+    repeats = int(argv[1]) if len(argv) > 1 else 20
+    print('{:>6} {:>6} {:>14}'.format('n', 'm', 'sec/pivot'))
+    for n, m in SIZES:
+        print('{:>6} {:>6} {:>14.6g}'.format(n, m,
+                                             bench_pivot(n, m, repeats)))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,65 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Compares solving random LPs in float64 with solving them in float32 and
+cleaning up in float64 from the final basis, and times a single pivot in
+each dtype.
+
+Usage: python bench/bench_precision.py [problems per size]
+'''
+import sys
+import timeit
+
+import numpy as np
+
+from linprog import Simplex, Tableau
+from linprog.precision import MixedPrecision
+
+import problems
+
+SIZES = [(100, 200), (200, 400), (400, 800)]
+
+
+def pivot_time(arr, dtype, number=20):
+    T = Tableau(arr.copy(), dtype=dtype)
+    j = int(np.argmin(T.c)) + 1
+    i = int(np.argmax(T.A[:, j - 1])) + 1
+    return timeit.timeit(lambda: T.pivot(i, j), number=number) / number
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 3
+    print('{:>5} {:>5} {:<8} {:>11} {:>8} {:>8} {:>10} {:>9}'.format(
+        'n', 'm', 'dtype', 'pivot (ms)', 'iters', 'cleanup', 'seconds',
+        'z error'))
+    for n, m in SIZES:
+        rows = {'float64': [0.] * 5, 'float32': [0.] * 5}
+        for seed in range(count):
+            arr = problems.feasible(n, m, seed)
+            T = Tableau(arr.copy())
+            s = Simplex(T)
+            t = timeit.default_timer()
+            s.solve()
+            t = timeit.default_timer() - t
+            for k, v in enumerate([pivot_time(arr, np.float64), s.iters, 0,
+                                   t, 0]):
+                rows['float64'][k] += v
+            p = MixedPrecision(arr)
+            t = timeit.default_timer()
+            p.solve()
+            t = timeit.default_timer() - t
+            for k, v in enumerate([pivot_time(arr, np.float32), p.iters,
+                                   p.cleanup_iters, t,
+                                   abs(p.tableau.z - T.z)]):
+                rows['float32'][k] += v
+        for name, (pivot, iters, cleanup, seconds, error) in rows.items():
+            print('{:>5} {:>5} {:<8} {:>11.3f} {:>8.1f} {:>8.1f} {:>10.4f} '
+                  '{:>9.1e}'.format(n, m, name, pivot / count * 1e3,
+                                    iters / count, cleanup / count,
+                                    seconds / count, error / count))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,60 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Reports iteration counts and wall time of each pricing rule.
+
+Usage: python bench/bench_pricing.py [problems per size]
+'''
+import sys
+import timeit
+
+from linprog import Simplex, Tableau
+from linprog.simplex import MaxIterationsReachedError
+from linprog.tableau import PivotException
+from linprog.pricing import Dantzig, SteepestEdge, Devex, PartialPricing
+
+import problems
+
+SIZES = [(20, 40), (50, 100), (100, 200), (200, 400)]
+RULES = [('dantzig', Dantzig), ('steepest', SteepestEdge),
+         ('devex', Devex), ('partial', PartialPricing)]
+
+
+def bench(make, rule, count):
+    '''
+    Returns the mean iterations and seconds over the solved problems, and
+    the number of problems that failed numerically or hit max_iters.
+    '''
+    iters = seconds = failed = 0
+    for seed in range(count):
+        s = Simplex(Tableau(make(seed)), pricing=rule())
+        t = timeit.default_timer()
+        try:
+            s.solve()
+        except (PivotException, MaxIterationsReachedError):
+            failed += 1
+            continue
+        seconds += timeit.default_timer() - t
+        iters += s.iters
+    solved = max(count - failed, 1)
+    return iters / solved, seconds / solved, failed
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 3
+    print('{:<11} {:>5} {:>5} {:<9} {:>8} {:>10} {:>7}'.format(
+        'problem', 'n', 'm', 'rule', 'iters', 'seconds', 'failed'))
+    for kind in ['feasible', 'degenerate', 'scaled']:
+        generate = getattr(problems, kind)
+        for n, m in SIZES:
+            for name, rule in RULES:
+                iters, seconds, failed = bench(
+                    lambda seed: generate(n, m, seed), rule, count)
+                print('{:<11} {:>5} {:>5} {:<9} {:>8.1f} {:>10.4f} {:>7}'
+                      .format(kind, n, m, name, iters, seconds, failed))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
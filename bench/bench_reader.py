@@ -0,0 +1,98 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Times reading sparse random LPs from MPS and CPLEX LP files into dense
+and sparse tableau arrays.
+
+Usage: python bench/bench_reader.py [density]
+'''
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+from linprog.reader import read_mps, read_lp
+
+SIZES = [(1000, 2000), (5000, 10000), (20000, 40000)]
+# Largest tableau to build densely, in MB
+DENSE_MB = 512
+
+
+def random_lp(n, m, density, seed=0):
+    '''
+    The non-zeros (i, j, a) of a random sparse A with at least one per
+    column, and b and c.
+    '''
+    rng = np.random.RandomState(seed)
+    nnz = max(int(n * m * density), m)
+    j = np.r_[np.arange(m), rng.randint(0, m, nnz - m)]
+    i = rng.randint(0, n, nnz)
+    order = np.lexsort((i, j))
+    i, j = i[order], j[order]
+    a = np.round(rng.uniform(0, 1, nnz), 6)
+    return i, j, a, np.round(rng.uniform(1, 2, n), 6), \
+        np.round(rng.uniform(-1, 0, m), 6)
+
+
+def write_mps(path, i, j, a, b, c):
+    with open(path, 'w') as f:
+        f.write('NAME bench\nROWS\n N obj\n')
+        f.writelines(' L r%d\n' % k for k in range(len(b)))
+        f.write('COLUMNS\n')
+        starts = np.r_[0, np.flatnonzero(np.diff(j)) + 1]
+        for s, e in zip(starts, np.r_[starts[1:], len(j)]):
+            col = j[s]
+            f.write('    x%d obj %.17g\n' % (col, c[col]))
+            f.writelines('    x%d r%d %.17g\n' % (col, i[k], a[k])
+                         for k in range(s, e))
+        f.write('RHS\n')
+        f.writelines('    rhs r%d %.17g\n' % (k, v) for k, v in enumerate(b))
+        f.write('ENDATA\n')
+
+
+def write_lp(path, i, j, a, b, c):
+    order = np.lexsort((j, i))
+    i, j, a = i[order], j[order], a[order]
+    with open(path, 'w') as f:
+        f.write('Minimize\n obj:')
+        f.writelines(' %+.17g x%d\n' % (v, k) for k, v in enumerate(c))
+        f.write('Subject To\n')
+        starts = np.r_[0, np.flatnonzero(np.diff(i)) + 1]
+        for s, e in zip(starts, np.r_[starts[1:], len(i)]):
+            f.write(' r%d:' % i[s])
+            f.writelines(' %+.17g x%d\n' % (a[k], j[k]) for k in range(s, e))
+            f.write(' <= %.17g\n' % b[i[s]])
+        f.write('End\n')
+
+
+def main(argv):
+    density = float(argv[1]) if len(argv) > 1 else 0.001
+    print('{:>6} {:>6} {:>9} {:<4} {:>8} {:<7} {:>9} {:>11}'.format(
+        'n', 'm', 'nnz', 'file', 'MB', 'array', 'seconds', 'nnz/s'))
+    with tempfile.TemporaryDirectory() as directory:
+        for n, m in SIZES:
+            i, j, a, b, c = random_lp(n, m, density)
+            for name, write, read in [('mps', write_mps, read_mps),
+                                      ('lp', write_lp, read_lp)]:
+                path = os.path.join(directory, 'bench.' + name)
+                write(path, i, j, a, b, c.astype(float))
+                mb = os.path.getsize(path) / 2 ** 20
+                dense_mb = (n + 1) * (n + m + 1) * 8 / 2 ** 20
+                for sparse in [False, True]:
+                    if not sparse and dense_mb > DENSE_MB:
+                        continue
+                    t = timeit.default_timer()
+                    read(path, sparse=sparse)
+                    t = timeit.default_timer() - t
+                    print('{:>6} {:>6} {:>9} {:<4} {:>8.1f} {:<7} {:>9.3f} '
+                          '{:>11.0f}'.format(n, m, len(a), name, mb,
+                                             'sparse' if sparse else 'dense',
+                                             t, len(a) / t))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,91 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Reports iteration counts on badly scaled and on degenerate problems, with
+and without equilibration scaling, relative tolerances and Harris' ratio
+test. Each scaled problem is a rescaling of the well scaled problem from
+the same seed, so its z is checked against the plain solve of that.
+
+Usage: python bench/bench_scaling.py [problems per size]
+'''
+import sys
+import timeit
+from functools import partial
+
+from linprog import Simplex, Tableau
+from linprog.scaling import Scaling
+from linprog.simplex import MaxIterationsReachedError
+from linprog.tableau import PivotException
+
+import problems
+
+SIZES = [(20, 40), (50, 100), (100, 200)]
+# The problems, and the problems their z is checked against
+SETS = [('scaled', problems.scaled, problems.feasible),
+        ('degenerate', problems.degenerate, problems.degenerate)]
+CONFIGS = [('plain', False, {}),
+           ('relative', False, {'relative': True}),
+           ('harris', False, {'harris': True}),
+           ('scaled', True, {}),
+           ('scaled+relative', True, {'relative': True}),
+           ('scaled+harris', True, {'harris': True})]
+
+
+def solve(array, scale, options):
+    '''
+    Returns the z and iterations, or None for z if the solve failed.
+    '''
+    tableau = partial(Tableau, **options)
+    if scale:
+        s = Scaling(array)
+        try:
+            optimal = s.solve(tableau)
+        except (PivotException, MaxIterationsReachedError):
+            return None, s.iters
+        return (s.z if optimal else None), s.iters
+    T = tableau(array)
+    s = Simplex(T)
+    try:
+        s.solve()
+    except (PivotException, MaxIterationsReachedError):
+        return None, s.iters
+    return (T.z if T.optimal else None), s.iters
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 5
+    print('{:<11} {:>5} {:>5} {:<15} {:>8} {:>7} {:>6} {:>10}'.format(
+        'problem', 'n', 'm', 'config', 'iters', 'failed', 'wrong',
+        'seconds'))
+    for kind, generate, original in SETS:
+        for n, m in SIZES:
+            bench(kind, generate, original, n, m, count)
+
+
+def bench(kind, generate, original, n, m, count):
+    reference = []
+    for seed in range(count):
+        T = Tableau(original(n, m, seed))
+        Simplex(T).solve()
+        reference.append(T.z)
+    for name, scale, options in CONFIGS:
+        iters = failed = wrong = 0
+        t = timeit.default_timer()
+        for seed in range(count):
+            z, i = solve(generate(n, m, seed), scale, options)
+            iters += i
+            if z is None:
+                failed += 1
+            elif abs(z - reference[seed]) > 1e-6 * max(
+                    1, abs(reference[seed])):
+                wrong += 1
+        seconds = (timeit.default_timer() - t) / count
+        print('{:<11} {:>5} {:>5} {:<15} {:>8.1f} {:>7} {:>6} {:>10.4f}'
+              .format(kind, n, m, name, iters / count, failed, wrong,
+                      seconds))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,251 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Benchmarks the solver on random feasible, infeasible, unbounded and
+degenerate LPs of growing size. For each kind of problem, size and
+tableau class it times Tableau.pivot, each status property, each stage
+of Simplex (the Phase 0 basis, dual and subproblem pivots, and the primal
+pivots) and a whole Simplex.solve, and fits the growth of the solve time
+with the size.
+
+The results are written as JSON. Given a baseline from an earlier run
+with --compare, it reports the ratio of each time to the baseline, and
+exits with status 1 if any is slower by more than --tolerance.
+
+Usage: python bench/bench_suite.py [-h] [options]
+'''
+import argparse
+import datetime
+import json
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+from linprog import Simplex, Tableau, RevisedTableau
+from linprog.tableau import PivotException
+from linprog.trace import PHASES
+
+import problems
+
+KINDS = {'feasible': problems.feasible,
+         'infeasible': problems.infeasible,
+         'unbounded': problems.unbounded,
+         'degenerate': problems.degenerate}
+SIZES = [(20, 40), (50, 100), (100, 200), (200, 400)]
+STATUSES = ['canonical', 'optimal', 'infeasible', 'unbounded']
+
+
+def tableaus():
+    classes = {'dense': Tableau, 'revised': RevisedTableau}
+    try:
+        from linprog.sparse import SparseTableau
+        classes['sparse'] = SparseTableau
+    except ImportError:
+        pass
+    return classes
+
+
+def time_pivot(tableau, arr, repeats):
+    '''
+    Seconds per Tableau.pivot, cycling the pivot through the rows and the
+    columns of the variables.
+    '''
+    T = tableau(arr.copy())
+    n, m = arr.shape[0] - 1, arr.shape[1] - arr.shape[0]
+    seconds = done = 0
+    for k in range(repeats):
+        t = timeit.default_timer()
+        try:
+            T.pivot(k % n + 1, k % m + 1)
+        except PivotException:
+            continue
+        seconds += timeit.default_timer() - t
+        done += 1
+    return seconds / max(done, 1)
+
+
+def time_status(tableau, arr, repeats):
+    '''
+    Seconds to compute each status property from scratch.
+    '''
+    T = tableau(arr.copy())
+    T.basis
+    out = {}
+    for name in STATUSES:
+        t = timeit.default_timer()
+        for _ in range(repeats):
+            T._reset_status()
+            getattr(T, name)
+        out[name] = (timeit.default_timer() - t) / repeats
+    return out
+
+
+def time_phases(tableau, arr):
+    '''
+    Iterations and seconds of each stage of Simplex.
+    '''
+    s = Simplex(tableau(arr.copy()))
+    iters = dict.fromkeys(PHASES, 0)
+    seconds = dict.fromkeys(PHASES, 0.)
+    it = iter(s)
+    while True:
+        t = timeit.default_timer()
+        try:
+            next(it)
+        except StopIteration:
+            break
+        seconds[PHASES[s.phase]] += timeit.default_timer() - t
+        iters[PHASES[s.phase]] += 1
+    return {name: {'iters': iters[name], 'seconds': seconds[name]}
+            for name in PHASES}
+
+
+def time_solve(tableau, arr):
+    T = tableau(arr.copy())
+    s = Simplex(T)
+    t = timeit.default_timer()
+    s.solve()
+    seconds = timeit.default_timer() - t
+    status = ('optimal' if T.optimal else 'infeasible' if T.infeasible
+              else 'unbounded' if T.unbounded else 'unknown')
+    return {'seconds': seconds, 'iters': s.iters, 'status': status}
+
+
+def mean(records):
+    '''
+    The mean of a list of equally shaped dicts of numbers. Other values
+    are taken from the first record.
+    '''
+    first = records[0]
+    if isinstance(first, dict):
+        return {k: mean([r[k] for r in records]) for k in first}
+    if isinstance(first, str):
+        return first
+    return float(np.mean(records))
+
+
+def run(kinds, sizes, classes, count, repeats):
+    results = []
+    for kind in kinds:
+        for name, tableau in classes.items():
+            for n, m in sizes:
+                runs = []
+                for seed in range(count):
+                    arr = KINDS[kind](n, m, seed)
+                    runs.append({
+                        'pivot': time_pivot(tableau, arr, repeats),
+                        'status': time_status(tableau, arr, repeats),
+                        'phases': time_phases(tableau, arr),
+                        'solve': time_solve(tableau, arr)})
+                record = {'kind': kind, 'tableau': name, 'n': n, 'm': m,
+                          'count': count}
+                record.update(mean(runs))
+                results.append(record)
+                print('{:<11} {:<8} {:>5} {:>5} {:>10} {:>8.1f} {:>10.4f} '
+                      '{:>12.3g}'.format(kind, name, n, m,
+                                         record['solve']['status'],
+                                         record['solve']['iters'],
+                                         record['solve']['seconds'],
+                                         record['pivot']))
+    return results
+
+
+def scaling(results):
+    '''
+    The exponent k of a fit of solve seconds to n^k, for each kind and
+    tableau run at more than one size.
+    '''
+    groups = {}
+    for r in results:
+        key = '%s/%s' % (r['kind'], r['tableau'])
+        groups.setdefault(key, []).append((r['n'], r['solve']['seconds']))
+    out = {}
+    for key, points in groups.items():
+        n, t = np.array(points).T
+        if len(n) > 1 and np.all(t > 0):
+            out[key] = float(np.polyfit(np.log(n), np.log(t), 1)[0])
+    return out
+
+
+def key(record):
+    return record['kind'], record['tableau'], record['n'], record['m']
+
+
+def compare(results, baseline, tolerance):
+    '''
+    Prints the ratio of the solve and pivot times to the baseline, and
+    returns the number of regressions.
+    '''
+    old = {key(r): r for r in baseline['results']}
+    regressions = 0
+    print('{:<11} {:<8} {:>5} {:>5} {:>8} {:>8}'.format(
+        'kind', 'tableau', 'n', 'm', 'solve', 'pivot'))
+    for r in results:
+        b = old.get(key(r))
+        if b is None:
+            continue
+        ratios = [r['solve']['seconds'] / b['solve']['seconds'],
+                  r['pivot'] / b['pivot']]
+        slower = [x > 1 + tolerance for x in ratios]
+        regressions += any(slower)
+        print('{:<11} {:<8} {:>5} {:>5} {:>8.2f} {:>8.2f}{}'.format(
+            *key(r), *ratios, '  slower' if any(slower) else ''))
+    return regressions
+
+
+def parse_sizes(text):
+    return [tuple(int(v) for v in size.split('x'))
+            for size in text.split(',')]
+
+
+def main(argv):
+    classes = tableaus()
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--kinds', default=','.join(KINDS),
+                        help='comma separated kinds of problem')
+    parser.add_argument('--sizes', type=parse_sizes,
+                        default=SIZES, help='for example 20x40,50x100')
+    parser.add_argument('--tableaus', default='dense,revised',
+                        help='of ' + ','.join(classes))
+    parser.add_argument('--count', type=int, default=3,
+                        help='problems per kind and size')
+    parser.add_argument('--repeats', type=int, default=20,
+                        help='timings per pivot and status measurement')
+    parser.add_argument('--output', help='JSON file for the results')
+    parser.add_argument('--compare', help='JSON file of a baseline run')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='slowdown over the baseline that fails')
+    args = parser.parse_args(argv[1:])
+    classes = {name: classes[name] for name in args.tableaus.split(',')}
+    print('{:<11} {:<8} {:>5} {:>5} {:>10} {:>8} {:>10} {:>12}'.format(
+        'kind', 'tableau', 'n', 'm', 'status', 'iters', 'seconds',
+        'sec/pivot'))
+    results = run(args.kinds.split(','), args.sizes, classes, args.count,
+                  args.repeats)
+    exponents = scaling(results)
+    for key, k in sorted(exponents.items()):
+        print('{:<20} solve time ~ n^{:.2f}'.format(key, k))
+    report = {'meta': {'date': datetime.datetime.now().isoformat(),
+                       'python': platform.python_version(),
+                       'numpy': np.__version__,
+                       'machine': platform.machine(),
+                       'platform': platform.platform()},
+              'results': results,
+              'scaling': exponents}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
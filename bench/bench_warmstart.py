@@ -0,0 +1,70 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Compares iterations of warm started re-solves against cold solves after
+perturbing b by up to 2%, perturbing c by up to 5%, and adding a cut
+through the current optimum.
+
+Usage: python bench/bench_warmstart.py [problems per size]
+'''
+import sys
+
+import numpy as np
+
+from linprog import Simplex, Tableau
+from linprog.warmstart import WarmStart
+
+import problems
+
+SIZES = [(20, 40), (50, 100), (100, 200)]
+CHANGES = ['b', 'c', 'cut']
+
+
+def cold_iters(array):
+    s = Simplex(Tableau(array))
+    s.solve()
+    return s.iters
+
+
+def warm_iters(array, change, value):
+    w = WarmStart(array)
+    w.solve()
+    if change == 'b':
+        w.set_b(value)
+    elif change == 'c':
+        w.set_c(value)
+    else:
+        w.add_constraint(*value)
+    w.solve()
+    return w.iters, w.original
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 5
+    rng = np.random.RandomState(0)
+    print('{:>5} {:>5} {:<6} {:>10} {:>10}'.format(
+        'n', 'm', 'change', 'cold', 'warm'))
+    for n, m in SIZES:
+        cold = dict.fromkeys(CHANGES, 0)
+        warm = dict.fromkeys(CHANGES, 0)
+        for seed in range(count):
+            array = problems.feasible(n, m, seed)
+            T = Tableau(array.copy())
+            Simplex(T).solve()
+            a = rng.uniform(0, 1, T.m - 1)
+            values = {'b': array[1:, 0] * rng.uniform(0.98, 1.02, T.n - 1),
+                      'c': array[0, 1:] * rng.uniform(0.95, 1.05, T.m - 1),
+                      'cut': (a, 0.9 * a @ T.x)}
+            for change in CHANGES:
+                iters, original = warm_iters(array, change, values[change])
+                warm[change] += iters
+                cold[change] += cold_iters(original)
+        for change in CHANGES:
+            print('{:>5} {:>5} {:<6} {:>10.1f} {:>10.1f}'.format(
+                n, m, change, cold[change] / count, warm[change] / count))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,129 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Random LPs for the benchmarks, in the tableau layout used by Tableau:
+row 0 is [0, c, 0], the other rows are [b, A, I] with a slack column per
+constraint.
+'''
+import numpy as np
+
+
+def tableau_array(A, b, c):
+    '''
+    Builds the tableau array for min cx subject to Ax <= b, x >= 0.
+    '''
+    n, m = A.shape
+    arr = np.zeros((n + 1, n + m + 1))
+    arr[0, 1:m + 1] = c
+    arr[1:, 0] = b
+    arr[1:, 1:m + 1] = A
+    arr[1:, m + 1:] = np.eye(n)
+    return arr
+
+
+def feasible(n, m, seed=0):
+    '''
+    A bounded, feasible LP with a feasible slack basis.
+    '''
+    rng = np.random.RandomState(seed)
+    A = rng.uniform(0, 1, (n, m))
+    b = A @ rng.uniform(0, 1, m) + rng.uniform(0, 1, n)
+    c = rng.uniform(-1, 0, m)
+    return tableau_array(A, b, c)
+
+
+def degenerate(n, m, seed=0):
+    '''
+    A feasible LP where most of b is 0, so many pivots are degenerate.
+    '''
+    arr = feasible(n, m, seed)
+    rng = np.random.RandomState(seed)
+    arr[1:, 0] *= rng.uniform(0, 1, n) < 0.2
+    return arr
+
+
+def scaled(n, m, seed=0):
+    '''
+    A feasible LP with rows and columns scaled over several orders of
+    magnitude.
+    '''
+    arr = feasible(n, m, seed)
+    rng = np.random.RandomState(seed)
+    rows = 10 ** rng.uniform(-3, 3, n)
+    cols = 10 ** rng.uniform(-3, 3, m)
+    arr[1:, :] *= rows[:, np.newaxis]
+    arr[:, 1:m + 1] *= cols
+    arr[1:, m + 1:] = np.eye(n)
+    return arr
+
+
+def infeasible_start(n, m, seed=0):
+    '''
+    A feasible LP whose slack basis is not feasible: about half of b is
+    negative and c has both signs, so Phase 0 needs subproblem pivots
+    (like M9 in test_simplex.py). The last row bounds the sum of x.
+    '''
+    rng = np.random.RandomState(seed)
+    A = rng.uniform(-1, 1, (n, m))
+    x = rng.uniform(0, 1, m)
+    b = A @ x + rng.uniform(0, 0.1, n)
+    A[-1, :] = 1
+    b[-1] = x.sum() + 1
+    c = rng.uniform(-1, 1, m)
+    return tableau_array(A, b, c)
+
+
+def boxed(n, m, seed=0):
+    '''
+    A feasible LP with an upper bound on every variable of A, most of
+    which are active at the optimum. Returns the tableau array and the
+    upper bounds of its columns.
+    '''
+    arr = feasible(n, m, seed)
+    rng = np.random.RandomState(seed)
+    arr[0, 1:m + 1] *= 10
+    upper = np.r_[rng.uniform(0.1, 1, m), np.full(n, np.inf)]
+    return arr, upper
+
+
+def bound_rows(arr, upper):
+    '''
+    Adds a row and a slack column for each finite upper bound.
+    '''
+    cols = np.flatnonzero(np.isfinite(upper))
+    n, m = arr.shape
+    k = len(cols)
+    out = np.zeros((n + k, m + k))
+    out[:n, :m] = arr
+    out[n + np.arange(k), cols + 1] = 1
+    out[n:, 0] = upper[cols]
+    out[n:, m:] = np.eye(k)
+    return out
+
+
+def infeasible(n, m, seed=0):
+    '''
+    A feasible LP with its last two rows replaced by sum(x) <= 1 and
+    sum(x) >= 2, so that Phase 0 ends infeasible.
+    '''
+    arr = feasible(n, m, seed)
+    arr[-2, 1:m + 1] = 1
+    arr[-2, 0] = 1
+    arr[-1, 1:m + 1] = -1
+    arr[-1, 0] = -2
+    return arr
+
+
+def unbounded(n, m, seed=0):
+    '''
+    A feasible LP with a first variable that improves the objective a
+    little and that no row bounds, so the primal simplex runs until it
+    enters that column.
+    '''
+    arr = feasible(n, m, seed)
+    rng = np.random.RandomState(seed)
+    arr[1:, 1] = -rng.uniform(0, 1, n)
+    arr[0, 1] = -0.01
+    return arr
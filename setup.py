@@ -7,6 +7,7 @@ setup(
     package_dir={'': 'src'},
     packages=['linprog'],
     install_requires=['numpy'],
+    extras_require={'sparse': ['scipy']},
     setup_requires=['nose',
                     'wheel']
 )
@@ -1,2 +1,3 @@
 from linprog.simplex import Simplex
 from linprog.tableau import Tableau
+from linprog.revised import RevisedTableau
@@ -0,0 +1,104 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Solving from asyncio code within a time budget. The solve runs on the
+event loop and gives it back every few pivots, so other tasks keep
+running, and it stops at a deadline with whatever it has reached.
+'''
+import asyncio
+import logging
+from linprog.batch import OPTIMAL, INFEASIBLE, UNBOUNDED, MAX_ITERS, FAILED
+from linprog.simplex import Simplex, MaxIterationsReachedError
+from linprog.tableau import PivotException
+from linprog.trace import PHASES
+
+_logger = logging.getLogger(__name__)
+
+TIMEOUT = 'timeout'
+
+
+class Result:
+    '''
+    The outcome of solve. status is one of the linprog.batch statuses, or
+    TIMEOUT if the deadline came first. tableau is the tableau as the
+    solve left it and iters the iterations taken. phase is the name (see
+    linprog.trace.PHASES) of the phase the solve ended in.
+    A timed out result is partial. If it is feasible, the tableau is
+    canonical, and z and x are those of a feasible basic solution, an
+    upper bound on the optimum. Solving the same tableau again resumes
+    from there.
+    '''
+
+    def __init__(self, status, tableau, iters, phase):
+        self.status = status
+        self.tableau = tableau
+        self.iters = iters
+        self.phase = phase
+
+    @property
+    def done(self):
+        return self.status != TIMEOUT
+
+    @property
+    def feasible(self):
+        return self.status == OPTIMAL or (self.status == TIMEOUT and
+                                          bool(self.tableau.canonical))
+
+    @property
+    def z(self):
+        return self.tableau.z if self.feasible else None
+
+    @property
+    def x(self):
+        return self.tableau.x if self.feasible else None
+
+
+async def solve(tableau, timeout=None, deadline=None, every=10, **kwargs):
+    '''
+    Solves tableau with Simplex, yielding to the event loop after every
+    every iterations. The solve stops after timeout seconds, or at
+    deadline in the time of the running loop (loop.time()), whichever is
+    first, and returns a Result, partial if it timed out. Cancelling the
+    task stops the solve at its next yield, leaving the tableau as it
+    was after the last pivot. every must be at least 1. The other keyword
+    arguments, such as max_iters or anticycling, set up the Simplex that
+    runs the solve.
+    '''
+    if every < 1:
+        raise ValueError('every must be at least 1, got %r' % every)
+    loop = asyncio.get_running_loop()
+    if timeout is not None:
+        end = loop.time() + timeout
+        deadline = end if deadline is None else min(deadline, end)
+    s = Simplex(tableau, **kwargs)
+    iterations = iter(s)
+    status = None
+    try:
+        timed_out = False
+        while not timed_out:
+            for _ in range(every):
+                next(iterations)
+                if deadline is not None and loop.time() >= deadline:
+                    _logger.debug("Deadline reached after %s iterations",
+                                  s.iters)
+                    timed_out = True
+                    break
+            else:
+                await asyncio.sleep(0)
+    except StopIteration:
+        pass
+    except MaxIterationsReachedError:
+        status = MAX_ITERS
+    except PivotException:
+        status = FAILED
+    finally:
+        # Removes any cost perturbation, also on cancellation
+        iterations.close()
+    if status is None:
+        # The last pivot before the deadline may have finished the solve
+        status = (OPTIMAL if tableau.optimal else
+                  INFEASIBLE if tableau.infeasible else
+                  UNBOUNDED if tableau.unbounded else TIMEOUT)
+    return Result(status, tableau, s.iters, PHASES[s.phase])
@@ -0,0 +1,153 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Solves many LPs of the same shape at once. The primal simplex pivots of
+all unfinished problems are done together with whole-array operations on
+a stacked (problems, n, m) array of tableaus, following the same rules as
+Tableau, so each problem ends the way Simplex would leave it.
+'''
+import numpy as np
+import logging
+from linprog.simplex import Simplex, MaxIterationsReachedError
+from linprog.tableau import Tableau, PivotException, EPSILON, eq, geq, leq
+
+_logger = logging.getLogger(__name__)
+
+OPTIMAL = 'optimal'
+INFEASIBLE = 'infeasible'
+UNBOUNDED = 'unbounded'
+MAX_ITERS = 'max_iters'
+FAILED = 'failed'
+
+
+class BatchResult:
+    '''
+    The outcome of solve_batch, one entry per problem.
+    status holds OPTIMAL, INFEASIBLE, UNBOUNDED, MAX_ITERS, or FAILED if
+    a pivot element was numerically zero or Phase 0 found no basis (where
+    Simplex would raise a PivotException).
+    z is NaN and x is all NaN unless the problem was solved to optimality.
+    arrays holds the final tableaus.
+    '''
+
+    def __init__(self, arrays, status, z, x, iters):
+        self.arrays = arrays
+        self.status = status
+        self.z = z
+        self.x = x
+        self.iters = iters
+
+    def __len__(self):
+        return len(self.status)
+
+
+def _bases(arrays):
+    '''
+    The basis of each tableau in a stack, as Tableau.basis finds it.
+    '''
+    P, n, m = arrays.shape
+    arr = arrays[:, :, 1:]
+    zeros = eq(arr, 0)
+    ones = eq(arr, 1)
+    one_rows = ones.argmax(axis=1)
+    is_basic = (np.all(zeros | ones, axis=1) &
+                (ones.sum(axis=1) == 1) & (one_rows > 0))
+    bases = np.zeros((P, n - 1), dtype='int_')
+    # Assign the highest columns first so the first column found wins
+    for j in range(m - 2, -1, -1):
+        hit = np.flatnonzero(is_basic[:, j])
+        bases[hit, one_rows[hit, j] - 1] = j + 1
+    return bases
+
+
+def _phase0(array, max_iters):
+    '''
+    Takes a single problem through Simplex's Phase 0.
+    Returns the tableau, the iterations taken, and the final status if it
+    is already finished or else None.
+    '''
+    tableau = Tableau(array)
+    simplex = Simplex(tableau, max_iters)
+    try:
+        for _ in simplex._phase0():
+            pass
+    except MaxIterationsReachedError:
+        return tableau, simplex.iters, MAX_ITERS
+    except PivotException:
+        _logger.debug("Phase 0 failed")
+        return tableau, simplex.iters, FAILED
+    if tableau.infeasible:
+        return tableau, simplex.iters, INFEASIBLE
+    return tableau, simplex.iters, None
+
+
+def solve_batch(arrays, max_iters=10000):
+    '''
+    Solves a stack of tableaus of shape (problems, n, m).
+    Problems that do not start in canonical form go through Phase 0 one
+    at a time first. Returns a BatchResult. The input is not modified.
+    '''
+    arrays = np.array(arrays, dtype=float)
+    P, n, m = arrays.shape
+    status = np.full(P, '', dtype='<U10')
+    iters = np.zeros(P, dtype='int_')
+    bases = _bases(arrays)
+    canonical = (np.all(bases > 0, axis=1) &
+                 np.all(geq(arrays[:, 1:, 0], 0), axis=1))
+    for k in np.flatnonzero(~canonical):
+        tableau, iters[k], done = _phase0(arrays[k], max_iters)
+        bases[k] = tableau.basis
+        if done:
+            status[k] = done
+    active = np.flatnonzero(status == '')
+    while len(active):
+        _logger.debug("Pivoting %s problems", len(active))
+        T = arrays[active]
+        c = T[:, 0, 1:]
+        A = T[:, 1:, 1:]
+        optimal = np.all(geq(c, 0), axis=1)
+        unbounded = ~optimal & np.any(
+            ~geq(c, 0) & np.all(leq(A, 0, EPSILON), axis=1), axis=1)
+        over = iters[active] > max_iters
+        status[active[optimal]] = OPTIMAL
+        status[active[unbounded]] = UNBOUNDED
+        status[active[over & ~optimal & ~unbounded]] = MAX_ITERS
+        going = ~(optimal | unbounded | over)
+        active, T = active[going], T[going]
+        if not len(active):
+            break
+        k = np.arange(len(active))
+        # Dantzig's rule and the minimum ratio test, per problem
+        j = np.argmin(T[:, 0, 1:], axis=1) + 1
+        col = T[k, 1:, j]
+        pos = ~leq(col, 0, EPSILON)
+        ratios = np.full(col.shape, np.inf)
+        ratios[pos] = T[:, 1:, 0][pos] / col[pos]
+        i = np.argmin(ratios, axis=1) + 1
+        pivot = T[k, i, j]
+        failed = eq(pivot, 0)
+        if np.any(failed):
+            status[active[failed]] = FAILED
+            active, T = active[~failed], T[~failed]
+            k, i, j = k[:len(active)], i[~failed], j[~failed]
+            pivot = pivot[~failed]
+        # Pivot every problem on its (i, j)
+        scale = np.where(eq(pivot, 1), 1, pivot)
+        T[k, i, :] /= scale[:, np.newaxis]
+        col = T[k, :, j]
+        col[k, i] = 0
+        col[np.abs(col) < EPSILON] = 0
+        T -= col[:, :, np.newaxis] * T[k, i, :][:, np.newaxis, :]
+        arrays[active] = T
+        bases[active, i - 1] = j
+        iters[active] += 1
+    z = np.full(P, np.nan)
+    x = np.full((P, m - 1), np.nan)
+    solved = np.flatnonzero(status == OPTIMAL)
+    z[solved] = -arrays[solved, 0, 0]
+    x[solved] = 0
+    rows = np.repeat(solved, n - 1)
+    x[rows, bases[solved].ravel() - 1] = arrays[solved, 1:, 0].ravel()
+    return BatchResult(arrays, status, z, x, iters)
@@ -0,0 +1,211 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+import numpy as np
+import logging
+from linprog.tableau import Tableau, PivotException, geq, leq, harris
+
+_logger = logging.getLogger(__name__)
+
+
+class BoundedTableau(Tableau):
+    '''
+    A tableau with native bounds lower <= x <= upper on each column of A,
+    so that box constraints need no rows or slack columns of their own.
+
+    The variables are shifted by their lower bounds when the tableau is
+    made, so that each one is 0 at its lower bound. A variable at its
+    upper bound is then kept in the tableau as u - x instead of x (it is
+    flipped), so nonbasic variables are always 0 in the tableau and the
+    tableau has its usual form: b and z are those of the shifted and
+    flipped variables, and x maps them back.
+
+    The primal ratio test also stops where a basic variable reaches its
+    upper bound, or where the entering variable does, in which case the
+    entering variable is flipped instead of pivoted in; such a bound flip
+    is a pivot with row 0. A basic variable that leaves at its upper bound
+    is flipped by simplex_pivot or subproblem_pivot just before the pivot.
+    Any other pivot that takes a basic variable over its upper bound flips
+    it, which leaves its b negative for Phase 0 to fix.
+
+    The lower bounds must be finite. The upper bounds may be infinite.
+    '''
+
+    def __init__(self, array, lower=None, upper=None, **kwargs):
+        super().__init__(array, **kwargs)
+        m = self.m - 1
+        lower = np.zeros(m) if lower is None else np.array(lower, float)
+        upper = (np.full(m, np.inf) if upper is None
+                 else np.array(upper, float))
+        if not np.all(np.isfinite(lower)):
+            raise ValueError('Lower bounds must be finite')
+        if np.any(upper < lower):
+            raise ValueError('Upper bounds must not be below lower bounds')
+        self._lower = lower
+        # Upper bounds of the shifted variables
+        self._upper = upper - lower
+        self._flipped = np.zeros(m, dtype=bool)
+        # Row whose basic variable the last ratio test found leaving at
+        # its upper bound
+        self._leaving = None
+        if np.any(lower):
+            arr = self._array
+            arr[:, 0] -= arr[:, 1:] @ lower
+        self._flip_over()
+
+    @property
+    def lower(self):
+        return self._lower
+
+    @property
+    def upper(self):
+        return self._lower + self._upper
+
+    @property
+    def flipped(self):
+        '''
+        Whether each variable is kept in the tableau as u - x.
+        '''
+        return self._flipped
+
+    @property
+    def x(self):
+        x = super().x
+        if x is None:
+            return None
+        return self._lower + np.where(self._flipped, self._upper - x, x)
+
+    def flip(self, column):
+        '''
+        Replaces the variable of column by its distance to its upper bound.
+        '''
+        arr = self._array
+        u = self._upper[column - 1]
+        if not np.isfinite(u):
+            raise PivotException('Cannot flip a variable with no upper bound')
+        arr[:, 0] -= arr[:, column] * u
+        arr[:, column] *= -1
+        self._flipped[column - 1] ^= True
+        if self._basis is None:
+            self.rebuild_basis()
+        row = self._basis_rows[column]
+        if row:
+            # Restore the 1 of the identity column
+            arr[row, :] *= -1
+        self._reset_status()
+        return self
+
+    def _flip_over(self):
+        '''
+        Flips each basic variable that is over its upper bound.
+        '''
+        basis = self.basis
+        basic = basis > 0
+        over = np.zeros(len(basis), dtype=bool)
+        over[basic] = ~leq(self.b[basic], self._upper[basis[basic] - 1],
+                           self.epsilon)
+        for column in basis[over]:
+            self.flip(column)
+
+    def add_costs(self, delta):
+        '''
+        delta is added to the costs of x, so the costs of the flipped
+        variables u - x change by -delta, and the constant parts of the
+        shifted and flipped variables go into z.
+        '''
+        flipped = self._flipped
+        super().add_costs(np.where(flipped, -delta, delta))
+        self._array[0, 0] -= (delta @ self._lower +
+                              delta[flipped] @ self._upper[flipped])
+        return self
+
+    def pivot(self, row, column):
+        '''
+        Pivots on (row, column), or flips column if row is 0.
+        '''
+        if row == 0:
+            self.flip(column)
+            self.last_pivot = row, column
+            return self
+        super().pivot(row, column)
+        self._flip_over()
+        return self
+
+    def _has_unbounded_col(self):
+        A, eps = self.A, self.epsilon
+        finite = np.isfinite(self._upper[self.basis - 1])
+        blocked = (np.any(~leq(A, 0, eps), axis=0) |
+                   np.any(~geq(A, 0, eps) & finite[:, np.newaxis], axis=0))
+        return bool(np.any(~geq(self.c, 0, eps) & np.isinf(self._upper) &
+                           ~blocked))
+
+    def _ratio_row(self, d, rows=None, column=None):
+        '''
+        Also stops where a basic variable reaches its upper bound, which
+        for rows outside the given rows is the only stop, or where the
+        entering variable does. Returns -1 if the entering variable
+        reaches its upper bound first, so that the pivot is (0, column),
+        a bound flip. If the basic variable of the row returned leaves at
+        its upper bound, the row is kept in _leaving, for the pivot to flip
+        it first so that the pivot element is positive.
+        '''
+        self._leaving = None
+        b, u = self.b, self._upper[self.basis - 1]
+        eps = self.epsilon
+        pos = ~leq(d, 0, eps)
+        if rows is not None:
+            pos[np.setdiff1d(np.arange(len(d)), rows)] = False
+        at_upper = ~geq(d, 0, eps) & np.isfinite(u)
+        moving = pos | at_upper
+        # Distance of each basic variable to the bound it moves towards
+        v = np.where(at_upper, u - b, b)
+        ratios = np.full(len(d), np.inf)
+        if self.harris:
+            v = np.maximum(v, 0)
+            relaxed = np.full(len(d), np.inf)
+            relaxed[moving] = (v[moving] + eps) / np.abs(d[moving])
+        ratios[moving] = v[moving] / np.abs(d[moving])
+        i = None
+        if self.harris and not self.bland:
+            i = harris(ratios, relaxed, np.abs(d))
+        if i is None:
+            i = int(np.argmin(ratios))
+            if self.bland:
+                i = self._bland(ratios, self.basis)
+        u_in = np.inf if column is None else self._upper[column - 1]
+        if u_in < np.inf and u_in <= ratios[i]:
+            return -1
+        if np.isinf(ratios[i]):
+            return None
+        if at_upper[i]:
+            self._leaving = i + 1
+        return i
+
+    def _flip_leaving(self, pivot):
+        '''
+        Flips the basic variable of the pivot row if the ratio test found
+        it leaving at its upper bound.
+        '''
+        leaving, self._leaving = self._leaving, None
+        if pivot and pivot[0] and pivot[0] == leaving:
+            self.flip(self.basis[leaving - 1])
+
+    def simplex_pivot(self, pricing=None):
+        self._leaving = None
+        pivot = self.get_simplex_pivot(pricing)
+        if not pivot:
+            return self
+        self._flip_leaving(pivot)
+        if pricing is not None and pivot[0]:
+            pricing.update(self, *pivot)
+        return self.pivot(*pivot)
+
+    def subproblem_pivot(self):
+        self._leaving = None
+        pivot = self.get_subproblem_pivot()
+        if not pivot:
+            return self
+        self._flip_leaving(pivot)
+        return self.pivot(*pivot)
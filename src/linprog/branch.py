@@ -0,0 +1,255 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Branch and bound for LPs in which some variables must be integers.
+
+Each node is a WarmStart holding the optimal tableau of its parent with
+one more bound row, x_j <= floor(v) or x_j >= ceil(v), added in terms of
+the parent's basis. The row leaves c >= 0, so the node LP is re-optimized
+from the parent's basis by dual simplex pivots instead of being solved
+from scratch. Nodes can be solved across a pool of worker processes.
+'''
+import numpy as np
+import copy
+import heapq
+import logging
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from linprog.batch import OPTIMAL, INFEASIBLE, UNBOUNDED, MAX_ITERS, FAILED
+from linprog.simplex import MaxIterationsReachedError
+from linprog.tableau import PivotException
+from linprog.warmstart import WarmStart
+
+_logger = logging.getLogger(__name__)
+
+# Node selection
+BEST_BOUND = 'best'
+DEPTH_FIRST = 'depth'
+
+# Distance from an integer within which a value counts as one
+INTEGRALITY = 1e-6
+
+Progress = namedtuple('Progress', ['seconds', 'nodes', 'z', 'bound', 'gap'])
+
+
+def _solve_node(warm):
+    '''
+    Re-optimizes a node. Returns the node and its LP status.
+    '''
+    try:
+        if warm.solve():
+            return warm, OPTIMAL
+    except MaxIterationsReachedError:
+        _logger.debug("Node LP ran out of iterations")
+        return warm, MAX_ITERS
+    except PivotException:
+        _logger.debug("Node LP failed")
+        return warm, FAILED
+    return warm, UNBOUNDED if warm.tableau.unbounded else INFEASIBLE
+
+
+def _gap(z, bound):
+    if z is None:
+        return np.inf
+    return max(z - bound, 0) / max(1., abs(z))
+
+
+class BranchAndBound:
+    '''
+    Minimizes the LP of a tableau array with the columns of x listed in
+    integer (indices into x, as Tableau.x has them) restricted to integer
+    values.
+
+    selection is BEST_BOUND, which explores the open node with the lowest
+    LP bound next, or DEPTH_FIRST, which dives into the newest node and so
+    finds incumbents early with few open nodes. With max_workers above 1,
+    up to that many open nodes are solved at a time in a process pool.
+    The search stops once the relative gap between the incumbent and the
+    lowest bound of the open nodes is at most gap, or after max_nodes.
+    Further keyword arguments, such as max_iters or pricing, are passed on
+    to WarmStart, which passes all but max_iters on to Simplex. The node
+    tableaus are Tableaus with the default options.
+
+    After solve, status is one of the linprog.batch statuses: MAX_ITERS
+    if max_nodes was reached before the gap closed, FAILED if the gap is
+    left open by node LPs that could not be solved. z and x are the
+    incumbent or None, bound is the lowest bound on z, nodes the number of
+    node LPs solved, failed the number that could not be solved and iters
+    the Simplex iterations of all of them. The subtree of a node that
+    could not be solved is not searched, so it keeps the bound of its
+    parent.
+    progress is a list of Progress records of the seconds, nodes, z, bound
+    and gap, one per new incumbent and one every log_every nodes.
+    '''
+
+    def __init__(self, array, integer, selection=BEST_BOUND, gap=1e-6,
+                 max_nodes=100000, max_workers=1, log_every=100, **kwargs):
+        if selection not in (BEST_BOUND, DEPTH_FIRST):
+            raise ValueError('Unknown node selection %r' % selection)
+        self.array = np.array(array, dtype=float)
+        self.integer = np.asarray(integer, dtype='int_')
+        self.selection = selection
+        self.max_gap = gap
+        self.max_nodes = max_nodes
+        self.max_workers = max_workers
+        self.log_every = log_every
+        self.kwargs = kwargs
+        self.status = None
+        self.z = self.x = None
+        self.bound = -np.inf
+        self.nodes = 0
+        self.failed = 0
+        self.iters = 0
+        self.progress = []
+        self.seconds = 0.
+        self._open = []
+        self._count = 0
+        # The lowest bound of the nodes that could not be solved
+        self._unsolved = np.inf
+
+    @property
+    def gap(self):
+        return _gap(self.z, self.bound)
+
+    @property
+    def throughput(self):
+        '''
+        Nodes solved per second.
+        '''
+        return self.nodes / self.seconds if self.seconds else 0.
+
+    def solve(self):
+        '''
+        Runs the search, and returns true if an integer solution was found.
+        '''
+        start = perf_counter()
+        self._open = []
+        self._unsolved = np.inf
+        self.progress = []
+        self.nodes = self.failed = 0
+        self.z = self.x = None
+        root, status = _solve_node(WarmStart(self.array, **self.kwargs))
+        self.nodes, self.iters = 1, root.iters
+        if status != OPTIMAL:
+            self.status = status
+            self.bound = np.inf if status == INFEASIBLE else -np.inf
+            self.seconds = perf_counter() - start
+            return False
+        self.bound = float(root.tableau.z)
+        self._branch(root, start)
+        pool = (ProcessPoolExecutor(self.max_workers)
+                if self.max_workers > 1 else None)
+        try:
+            while self._open and self.nodes < self.max_nodes:
+                self.bound = self._lowest()
+                if self.gap <= self.max_gap:
+                    break
+                bounds, nodes = self._pop(min(self.max_workers,
+                                              self.max_nodes - self.nodes))
+                results = (pool.map(_solve_node, nodes) if pool is not None
+                           else map(_solve_node, nodes))
+                for bound, (warm, status) in zip(bounds, results):
+                    self._visit(warm, status, bound, start)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self.seconds = perf_counter() - start
+        self.bound = self._lowest()
+        if self.z is not None:
+            self.bound = min(self.bound, self.z)
+        if self.z is not None and self.gap <= self.max_gap:
+            self.status = OPTIMAL
+        elif self.z is None and self.bound == np.inf:
+            self.status = INFEASIBLE
+        else:
+            self.status = MAX_ITERS if self._open else FAILED
+        self._log(start)
+        return self.z is not None
+
+    def _lowest(self):
+        '''
+        The lowest bound of the open nodes and of the subtrees of the
+        nodes that could not be solved.
+        '''
+        return min(min((bound for bound, *_ in self._open), default=np.inf),
+                   self._unsolved)
+
+    def _pop(self, k):
+        '''
+        Takes up to k open nodes that can still improve on the incumbent.
+        Returns their bounds and the nodes.
+        '''
+        bounds, nodes = [], []
+        while self._open and len(nodes) < k:
+            if self.selection == BEST_BOUND:
+                bound, _, warm = heapq.heappop(self._open)
+            else:
+                bound, _, warm = self._open.pop()
+            if self.z is None or _gap(self.z, bound) > self.max_gap:
+                bounds.append(bound)
+                nodes.append(warm)
+        return bounds, nodes
+
+    def _push(self, bound, warm):
+        # The count breaks ties, in the order the nodes were made
+        self._count += 1
+        if self.selection == BEST_BOUND:
+            heapq.heappush(self._open, (bound, self._count, warm))
+        else:
+            self._open.append((bound, self._count, warm))
+
+    def _visit(self, warm, status, bound, start):
+        self.nodes += 1
+        self.iters += warm.iters
+        if status in (MAX_ITERS, FAILED):
+            self.failed += 1
+            self._unsolved = min(self._unsolved, bound)
+        elif status == OPTIMAL and (self.z is None or
+                                    _gap(self.z, warm.tableau.z) >
+                                    self.max_gap):
+            self._branch(warm, start)
+        if self.nodes % self.log_every == 0:
+            self._log(start)
+
+    def _branch(self, warm, start):
+        '''
+        Makes the children of an optimal node, or makes it the incumbent
+        if it is integral.
+        '''
+        T = warm.tableau
+        x = T.x[:len(self.array[0]) - 1]
+        values = x[self.integer]
+        fraction = np.abs(values - np.round(values))
+        if np.all(fraction <= INTEGRALITY):
+            if self.z is None or T.z < self.z:
+                self.z, self.x = float(T.z), x.copy()
+                _logger.debug("New incumbent %s after %s nodes", self.z,
+                              self.nodes)
+                self._log(start)
+            return
+        # Branch on the most fractional variable
+        k = int(np.argmax(fraction))
+        j, v = int(self.integer[k]), float(values[k])
+        down, up = warm, copy.deepcopy(warm)
+        a = np.zeros(len(warm.original[0]) - 1)
+        a[j] = 1
+        down.add_constraint(a, np.floor(v))
+        up.add_constraint(-a, -np.ceil(v))
+        # The child on the side v is nearer to is explored first when
+        # diving
+        children = [(up, down), (down, up)][int(v - np.floor(v) > 0.5)]
+        for child in children:
+            self._push(float(T.z), child)
+
+    def _log(self, start):
+        if self._open or self._unsolved < np.inf:
+            bound = self._lowest()
+            if self.z is not None:
+                bound = min(bound, self.z)
+        else:
+            bound = self.bound
+        self.progress.append(Progress(perf_counter() - start, self.nodes,
+                                      self.z, bound, _gap(self.z, bound)))
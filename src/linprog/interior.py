@@ -0,0 +1,212 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+A primal-dual interior point method for the LP of a tableau array, with a
+crossover to an optimal basic Tableau. Each iteration factors the normal
+equations once, so its cost is set by the number of rows rather than by
+the number of pivots a simplex solve would take.
+'''
+import numpy as np
+import logging
+from linprog.precision import from_basis
+from linprog.simplex import solve_counted
+from linprog.tableau import Tableau
+
+_logger = logging.getLogger(__name__)
+
+try:
+    from scipy.linalg import cho_factor, cho_solve
+except ImportError:
+    cho_factor = cho_solve = None
+
+# Fraction of the way to the boundary taken by each step
+STEP = 0.99
+
+
+def _factor(M):
+    '''
+    A function solving M y = r for the symmetric positive definite M, by
+    its Cholesky factorization. Raises numpy.linalg.LinAlgError if M is
+    not positive definite.
+    '''
+    if cho_factor is not None:
+        factor = cho_factor(M, check_finite=False)
+        return lambda r: cho_solve(factor, r, check_finite=False)
+    L = np.linalg.cholesky(M)
+    return lambda r: np.linalg.solve(L.T, np.linalg.solve(L, r))
+
+
+def _step(v, dv):
+    '''
+    The largest step up to 1 along dv that keeps v non-negative.
+    '''
+    neg = dv < 0
+    if not np.any(neg):
+        return 1.
+    return min(1., float(np.min(-v[neg] / dv[neg])))
+
+
+def independent_columns(A, order, epsilon):
+    '''
+    Picks linearly independent columns of A, taking them greedily in the
+    given order, by Gaussian elimination on as few of the columns as
+    needed. Returns the indices of the columns picked, at most one per
+    row of A.
+    '''
+    n = A.shape[0]
+    k = min(len(order), 2 * n)
+    while True:
+        R = A[:, order[:k]].copy()
+        free = np.ones(n, dtype=bool)
+        picked = []
+        tol = epsilon * max(1., np.abs(R).max(initial=0))
+        for j in range(k):
+            col = np.where(free, R[:, j], 0)
+            i = int(np.argmax(np.abs(col)))
+            if abs(col[i]) <= tol:
+                continue
+            picked.append(j)
+            if len(picked) == n:
+                return order[picked]
+            free[i] = False
+            # Eliminate row i from the remaining columns
+            R[:, j + 1:] -= np.outer(R[:, j] / R[i, j], R[i, j + 1:])
+        if k == len(order):
+            return order[picked]
+        k = min(len(order), 2 * k)
+
+
+class InteriorPoint:
+    '''
+    Solves min cx subject to Ax = b, x >= 0, from the tableau layout of
+    Tableau (row 0 is [-z0, c], the other rows [b, A]), with Mehrotra's
+    predictor-corrector method on the normal equations A D A^T, where
+    D = X / S.
+
+    The crossover takes the columns with the largest x that are linearly
+    independent as a basis, computes the tableau for that basis from the
+    original array, and finishes with Simplex from there. Near the
+    optimum that basis is usually optimal, or a few pivots from it. If the
+    LP is infeasible or unbounded the iterates do not converge, and the
+    crossover leaves it to Simplex to find out which. Without a full set
+    of independent columns, Simplex starts from the original array.
+
+    x, y and s are the primal, dual and slack iterates when solve
+    returns, iters the number of interior point iterations and
+    crossover_iters the number of Simplex iterations after them.
+    '''
+
+    def __init__(self, array, max_iters=100, tol=1e-8):
+        self.original = np.array(array, dtype=float)
+        self.max_iters = max_iters
+        self.tol = tol
+        self.tableau = None
+        self.x = self.y = self.s = None
+        self.converged = False
+        self.iters = 0
+        self.crossover_iters = 0
+
+    def solve(self, tableau=Tableau, **kwargs):
+        '''
+        Solves the LP, and returns true if it is optimal. The basic
+        tableau is left in tableau. The keyword arguments only set up the
+        Simplex of the crossover, so max_iters among them limits the
+        crossover pivots and not the barrier iterations.
+        '''
+        self.converged = self._barrier()
+        self.tableau = tableau(self._crossover_array())
+        return solve_counted(self, 'crossover_iters', self.tableau, **kwargs)
+
+    def _start(self, A, b, c):
+        '''
+        Mehrotra's starting point: the least squares solutions of Ax = b
+        and A^T y + s = c, shifted to be positive.
+        '''
+        solve = _factor(A @ A.T + 1e-12 * np.eye(len(b)))
+        x = A.T @ solve(b)
+        y = solve(A @ c)
+        s = c - A.T @ y
+        x += max(-1.5 * x.min(initial=0), 0)
+        s += max(-1.5 * s.min(initial=0), 0)
+        xs = x @ s
+        if xs <= 0:
+            # As when b or c is 0
+            return np.maximum(x, 1.), y, np.maximum(s, 1.)
+        return x + 0.5 * xs / s.sum(), y, s + 0.5 * xs / x.sum()
+
+    def _barrier(self):
+        '''
+        Runs the interior point iterations, and returns true if they
+        converged.
+        '''
+        arr = self.original
+        A, b, c = arr[1:, 1:], arr[1:, 0], arr[0, 1:]
+        m = A.shape[1]
+        x, y, s = self._start(A, b, c)
+        bnorm, cnorm = 1 + np.linalg.norm(b), 1 + np.linalg.norm(c)
+        self.iters = 0
+        converged = False
+        while self.iters < self.max_iters:
+            rb = A @ x - b
+            rc = A.T @ y + s - c
+            mu = x @ s / m
+            cx = c @ x
+            if (np.linalg.norm(rb) / bnorm < self.tol and
+                    np.linalg.norm(rc) / cnorm < self.tol and
+                    abs(cx - b @ y) / (1 + abs(cx)) < self.tol):
+                converged = True
+                break
+            if not np.isfinite(mu) or max(np.abs(x).max(),
+                                          np.abs(y).max(initial=0)) > 1e15:
+                _logger.debug("Interior point iterates diverged")
+                break
+            self.iters += 1
+            d = x / s
+            M = (A * d) @ A.T
+            try:
+                solve = _factor(M)
+            except np.linalg.LinAlgError:
+                # Regularize the normal equations of dependent rows
+                reg = 1e-10 * max(1., float(np.trace(M)) / len(M))
+                solve = _factor(M + reg * np.eye(len(M)))
+
+            def direction(rxs):
+                dy = solve(-rb + A @ (rxs / s - d * rc))
+                ds = -rc - A.T @ dy
+                return -(rxs + x * ds) / s, dy, ds
+
+            # Predictor: the affine scaling direction
+            dx, dy, ds = direction(x * s)
+            ap, ad = _step(x, dx), _step(s, ds)
+            mu_aff = (x + ap * dx) @ (s + ad * ds) / m
+            sigma = (mu_aff / mu) ** 3
+            # Corrector, centred by sigma
+            dx, dy, ds = direction(x * s + dx * ds - sigma * mu)
+            ap = min(1., STEP * _step(x, dx))
+            ad = min(1., STEP * _step(s, ds))
+            x = x + ap * dx
+            y = y + ad * dy
+            s = s + ad * ds
+            _logger.debug("Interior point iteration %s: mu %s", self.iters,
+                          mu)
+        self.x, self.y, self.s = x, y, s
+        return converged
+
+    def _crossover_array(self):
+        '''
+        The tableau array for the basis picked from x, or the original
+        array if there is no full basis.
+        '''
+        A = self.original[1:, 1:]
+        # Rank the columns by how clearly x is away from its bound
+        order = np.argsort(-self.x / (self.x + self.s), kind='stable')
+        cols = independent_columns(A, order, 1e-9)
+        if len(cols) == A.shape[0]:
+            try:
+                return from_basis(self.original, np.sort(cols) + 1)
+            except np.linalg.LinAlgError:
+                pass
+        _logger.debug("No basis from the interior point, starting over")
+        return self.original.copy()
@@ -0,0 +1,155 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+import numpy as np
+import logging
+from linprog.tableau import Tableau, PivotException, eq, neq, geq, leq
+
+_logger = logging.getLogger(__name__)
+
+
+class MappedTableau(Tableau):
+    '''
+    A tableau for arrays larger than memory, such as a numpy.memmap, or an
+    .npy file opened with open.
+
+    pivot, the status checks, the columns read by pricing and Phase 0,
+    and add_costs work through the array chunk_rows rows at a time, so
+    that only one chunk of rows, plus single rows and columns, is in
+    memory at once. pivot writes each chunk back in place. The array
+    is never copied, so its dtype cannot be changed.
+    '''
+
+    def __init__(self, array, chunk_rows=1024, epsilon=None, relative=False,
+                 **kwargs):
+        dtype = kwargs.pop('dtype', None)
+        if dtype is not None and array.dtype != dtype:
+            raise ValueError('Cannot change the dtype of a mapped tableau')
+        self.chunk_rows = chunk_rows
+        super().__init__(array, epsilon=epsilon, **kwargs)
+        if relative:
+            largest = max(np.abs(self._array[start:stop, 1:]).max()
+                          for start, stop in self._chunks(1))
+            self.epsilon *= max(largest, 1.)
+
+    @classmethod
+    def open(cls, path, mode='r+', **kwargs):
+        '''
+        Opens the .npy file at path as a memory map. With mode 'c' the
+        pivots are not written back to the file.
+        '''
+        return cls(np.load(path, mmap_mode=mode), **kwargs)
+
+    def flush(self):
+        '''
+        Writes any changes still in memory to the file.
+        '''
+        if isinstance(self._array, np.memmap):
+            self._array.flush()
+
+    def _chunks(self, first=0):
+        '''
+        The (start, stop) row ranges of the chunks from row first on.
+        '''
+        for start in range(first, self.n, self.chunk_rows):
+            yield start, min(start + self.chunk_rows, self.n)
+
+    def _columns(self, col_indices):
+        col_indices = np.asarray(col_indices)
+        out = np.empty((self.n - 1, len(col_indices)), dtype=self._array.dtype)
+        for start, stop in self._chunks(1):
+            out[start - 1:stop - 1] = self._array[start:stop, col_indices]
+        return out
+
+    def _positive_cols(self, col_indices, rows):
+        positive = np.zeros(len(col_indices), dtype=bool)
+        for start, stop in self._chunks(1):
+            mask = rows[start - 1:stop - 1]
+            block = self._array[start:stop, col_indices][mask]
+            positive |= np.any(~leq(block, 0, self.epsilon), axis=0)
+        return positive
+
+    def add_costs(self, delta):
+        arr = self._array
+        basis = self.basis
+        cost = np.array(arr[0, :])
+        cost[1:] += delta
+        # Prices out the basic columns one chunk of rows at a time
+        for start, stop in self._chunks(1):
+            cols = basis[start - 1:stop - 1]
+            basic = np.flatnonzero(cols)
+            if len(basic):
+                cost -= delta[cols[basic] - 1] @ arr[start:stop][basic]
+        cost[basis[basis > 0]] = 0
+        arr[0, :] = cost
+        self._reset_status()
+        return self
+
+    def _has_infeasible_row(self):
+        b, eps = self.b, self.epsilon
+        rows = np.flatnonzero((self.basis == 0) | ~geq(b, 0, eps))
+        for k in range(0, len(rows), self.chunk_rows):
+            chunk = rows[k:k + self.chunk_rows]
+            A, b_k = self._rows(chunk), b[chunk]
+            empty = ~eq(b_k, 0, eps) & np.all(eq(A, 0, eps), axis=1)
+            too_low = ~geq(b_k, 0, eps) & np.all(geq(A, 0, eps), axis=1)
+            too_high = ~leq(b_k, 0, eps) & np.all(leq(A, 0, eps), axis=1)
+            if np.any(empty | too_low | too_high):
+                return True
+        return False
+
+    def _has_unbounded_col(self):
+        improving = np.flatnonzero(~geq(self.c, 0, self.epsilon)) + 1
+        blocked = np.zeros(len(improving), dtype=bool)
+        for start, stop in self._chunks(1):
+            blocked |= np.any(~leq(self._array[start:stop, improving], 0,
+                                   self.epsilon), axis=0)
+        return not np.all(blocked)
+
+    def _basic_cols(self):
+        eps = self.epsilon
+        m = self.m - 1
+        other = np.zeros(m, dtype=bool)
+        ones = np.zeros(m, dtype='int_')
+        one_rows = np.zeros(m, dtype='int_')
+        for start, stop in self._chunks():
+            block = self._array[start:stop, 1:]
+            is_one = eq(block, 1, eps)
+            other |= ~np.all(eq(block, 0, eps) | is_one, axis=0)
+            first = is_one.any(axis=0) & (ones == 0)
+            one_rows[first] = start + is_one.argmax(axis=0)[first]
+            ones += is_one.sum(axis=0)
+        # Exactly one 1, everything else 0, and the 1 is not in the c row
+        is_basic = ~other & (ones == 1) & (one_rows > 0)
+        col_indices = np.flatnonzero(is_basic)
+        return col_indices + 1, one_rows[col_indices]
+
+    def pivot(self, row, column):
+        r, c = row, column
+        arr = self._array
+        if r <= 0 or c <= 0:
+            raise PivotException('Invalid pivot! Must pivot in A!')
+        pivot_row = np.array(arr[r, :])
+        pivot = pivot_row[c]
+        if eq(pivot, 0, self.epsilon):
+            raise PivotException('Pivot must be non-zero!')
+        if neq(pivot, 1, self.epsilon):
+            pivot_row /= pivot
+            arr[r, :] = pivot_row
+        # Eliminate column c one chunk at a time, skipping rows that are
+        # already zero in that column
+        for start, stop in self._chunks():
+            col = np.array(arr[start:stop, c])
+            if start <= r < stop:
+                col[r - start] = 0
+            rows = np.flatnonzero(np.abs(col) >= self.epsilon)
+            if len(rows):
+                block = arr[start:stop]
+                block[rows, :] -= np.outer(col[rows], pivot_row)
+        self._reset_status()
+        if self._basis is not None:
+            self._update_basis(r, c)
+        self.last_pivot = r, c
+        return self
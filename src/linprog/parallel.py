@@ -0,0 +1,135 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Solves independent LPs across a pool of worker processes.
+
+The tableau arrays are copied once into a single shared memory block.
+Workers are sent chunks of (index, offset, shape) triples instead of the
+arrays themselves, solve each problem in place in the shared block, and
+send back only the status, z, x and iteration count. The final tableaus
+are read back from the shared block.
+'''
+import numpy as np
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import os
+from linprog.batch import OPTIMAL, INFEASIBLE, UNBOUNDED, MAX_ITERS, FAILED
+from linprog.simplex import Simplex, MaxIterationsReachedError
+from linprog.tableau import Tableau, PivotException
+
+_logger = logging.getLogger(__name__)
+
+
+class Solution:
+    '''
+    The outcome of solving one problem with solve_many.
+    status is one of the linprog.batch statuses. z and x are None unless
+    the problem was solved to optimality. array is the final tableau.
+    '''
+
+    def __init__(self, status, z, x, iters, array=None):
+        self.status = status
+        self.z = z
+        self.x = x
+        self.iters = iters
+        self.array = array
+
+
+def _solve(array, tableau, max_iters):
+    T = tableau(array)
+    s = Simplex(T, max_iters)
+    try:
+        s.solve()
+    except MaxIterationsReachedError:
+        return Solution(MAX_ITERS, None, None, s.iters), T
+    except PivotException:
+        return Solution(FAILED, None, None, s.iters), T
+    if T.optimal:
+        return Solution(OPTIMAL, T.z, T.x, s.iters), T
+    return Solution(INFEASIBLE if T.infeasible else UNBOUNDED,
+                    None, None, s.iters), T
+
+
+def _solve_chunk(name, chunk, tableau, max_iters):
+    '''
+    Solves a chunk of problems in the shared block with the given name.
+    Returns a list of (index, Solution) without the arrays.
+    '''
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        results = []
+        for index, offset, shape in chunk:
+            array = np.ndarray(shape, dtype=float, buffer=shm.buf,
+                               offset=offset)
+            solution, T = _solve(array, tableau, max_iters)
+            final = T.M
+            if final is not array:
+                # Engines that do not pivot in place
+                array[...] = (final.toarray() if hasattr(final, 'toarray')
+                              else final)
+            del array, final, T
+            results.append((index, solution))
+        return results
+    finally:
+        shm.close()
+
+
+def _chunks(specs, chunksize):
+    for start in range(0, len(specs), chunksize):
+        yield specs[start:start + chunksize]
+
+
+def iter_solve_many(arrays, max_workers=None, chunksize=None,
+                    tableau=Tableau, max_iters=10000):
+    '''
+    Solves each tableau array in arrays with Simplex across a process pool,
+    yielding (index, Solution) pairs as chunks of problems finish.
+    tableau is the Tableau class to solve with. The arrays are not
+    modified.
+    '''
+    arrays = [np.asarray(array, dtype=float) for array in arrays]
+    if not arrays:
+        return
+    max_workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, -(-len(arrays) // (4 * max_workers)))
+    specs, offset = [], 0
+    for index, array in enumerate(arrays):
+        specs.append((index, offset, array.shape))
+        offset += array.nbytes
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    try:
+        for (index, start, shape), array in zip(specs, arrays):
+            np.ndarray(shape, dtype=float, buffer=shm.buf,
+                       offset=start)[...] = array
+        with ProcessPoolExecutor(max_workers) as pool:
+            futures = [pool.submit(_solve_chunk, shm.name, chunk, tableau,
+                                   max_iters)
+                       for chunk in _chunks(specs, chunksize)]
+            for future in as_completed(futures):
+                for index, solution in future.result():
+                    _, start, shape = specs[index]
+                    solution.array = np.ndarray(
+                        shape, dtype=float, buffer=shm.buf,
+                        offset=start).copy()
+                    yield index, solution
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def solve_many(arrays, max_workers=None, chunksize=None, tableau=Tableau,
+               max_iters=10000):
+    '''
+    Solves each tableau array in arrays with Simplex across a process pool.
+    Returns a list of Solutions in the same order as arrays.
+    '''
+    arrays = list(arrays)
+    solutions = [None] * len(arrays)
+    for index, solution in iter_solve_many(arrays, max_workers, chunksize,
+                                           tableau, max_iters):
+        solutions[index] = solution
+    return solutions
@@ -0,0 +1,83 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Solves an LP in a low precision dtype, such as float32, which halves the
+memory and bandwidth of each pivot, and then cleans the solution up in
+float64 from the basis the low precision solve ended with.
+'''
+import numpy as np
+import logging
+from linprog.simplex import solve_counted, MaxIterationsReachedError
+from linprog.tableau import Tableau, PivotException
+
+_logger = logging.getLogger(__name__)
+
+
+def from_basis(array, basis):
+    '''
+    The tableau array of the LP in array with the given basis column for
+    each row, computed directly from the original array. Raises
+    numpy.linalg.LinAlgError if the basis matrix is singular.
+    '''
+    arr = np.array(array, dtype=float)
+    arr[1:, :] = np.linalg.solve(arr[1:, basis], arr[1:, :])
+    # Exact identity columns, so that the basis is found again
+    arr[1:, basis] = np.eye(len(basis))
+    arr[0, :] -= arr[0, basis] @ arr[1:, :]
+    arr[0, basis] = 0
+    return arr
+
+
+class MixedPrecision:
+    '''
+    Solves array in dtype, then recomputes the tableau in float64 from the
+    final basis and finishes the solve in float64 from there. Usually the
+    basis is already optimal, or a few pivots away from it. If there is no
+    full basis, it is singular in float64, or the low precision solve
+    found no usable pivot, the cleanup solve starts from the original
+    array instead. If the low precision solve runs out of iterations, the
+    cleanup solve continues from the basis it reached.
+    iters is the number of iterations in dtype and cleanup_iters the
+    number in float64.
+    '''
+
+    def __init__(self, array, dtype=np.float32):
+        self.original = np.array(array, dtype=float)
+        self.dtype = dtype
+        self.low = None
+        self.tableau = None
+        self.iters = 0
+        self.cleanup_iters = 0
+
+    def solve(self, tableau=Tableau, **kwargs):
+        '''
+        Solves the LP, and returns true if it is optimal. The low precision
+        tableau is left in low and the float64 one in tableau. The keyword
+        arguments set up both the low precision and the cleanup Simplex,
+        so max_iters among them limits each of the two solves.
+        '''
+        self.low = tableau(self.original.copy(), dtype=self.dtype)
+        try:
+            solve_counted(self, 'iters', self.low, **kwargs)
+            array = self._cleanup_array()
+        except MaxIterationsReachedError:
+            _logger.debug("Out of iterations in %s, cleaning up",
+                          np.dtype(self.dtype))
+            array = self._cleanup_array()
+        except PivotException:
+            _logger.debug("No pivot in %s, cleaning up from scratch",
+                          np.dtype(self.dtype))
+            array = self.original.copy()
+        self.tableau = tableau(array)
+        return solve_counted(self, 'cleanup_iters', self.tableau, **kwargs)
+
+    def _cleanup_array(self):
+        basis = self.low.basis
+        if np.all(basis):
+            try:
+                return from_basis(self.original, basis)
+            except np.linalg.LinAlgError:
+                _logger.debug("Singular basis, cleaning up from scratch")
+        return self.original.copy()
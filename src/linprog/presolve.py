@@ -0,0 +1,275 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Presolve shrinks an LP in the tableau layout (min cx subject to Ax = b,
+x >= 0) before Simplex starts, and postsolve maps the solution of the
+reduced LP back to the original variables.
+
+Fixed columns are substituted into b and the objective, and substituted
+columns are eliminated with a row operation on the c row, so the reduced
+tableau has the same z as the original.
+'''
+import numpy as np
+import logging
+from linprog.simplex import solve_counted
+from linprog.tableau import Tableau, eq, geq, leq
+
+_logger = logging.getLogger(__name__)
+
+
+class Presolve:
+    '''
+    Applies the following reductions until none applies:
+
+    - empty rows are dropped, or show the LP is infeasible if b != 0;
+    - singleton rows a x_j = b fix x_j = b / a;
+    - forced rows, whose entries all have the same sign and b = 0, fix
+      every variable in them to 0, and show the LP is infeasible if the
+      sign of b cannot be reached;
+    - empty columns with c >= 0 are fixed to 0;
+    - duplicate rows, which are multiples of another row, are dropped, or
+      show the LP is infeasible if their b does not match;
+    - dominated columns, which are positive multiples of another column
+      with a cost at least as high relative to it, are fixed to 0;
+    - singleton columns whose row implies that they are non-negative are
+      substituted out together with their row.
+
+    rows and cols are masks of the rows and columns of the original array
+    that are kept in array. infeasible is true if the reductions showed
+    that the LP is infeasible, in which case array is not meaningful.
+    '''
+
+    def __init__(self, array):
+        self.original = np.array(array, dtype=float)
+        n, m = self.original.shape
+        self._array = self.original.copy()
+        self.rows = np.ones(n, dtype=bool)
+        self.cols = np.ones(m, dtype=bool)
+        self.infeasible = False
+        # Values of the fixed columns, and the substituted columns with
+        # their rows at the time, in the order they were substituted
+        self._values = np.zeros(m - 1)
+        self._substituted = []
+        self.tableau = None
+        self.iters = 0
+        self.x = None
+        self.z = None
+        self._reduce()
+
+    @property
+    def array(self):
+        '''
+        The reduced tableau array.
+        '''
+        return self._array[np.ix_(self.rows, self.cols)]
+
+    def _reduce(self):
+        rules = [self._empty_rows, self._singleton_rows, self._forced_rows,
+                 self._empty_cols, self._duplicate_rows,
+                 self._dominated_cols, self._singleton_cols]
+        changed = True
+        while changed and not self.infeasible:
+            changed = False
+            for rule in rules:
+                if self.infeasible:
+                    break
+                changed |= bool(rule(self._nonzeros()))
+        _logger.debug("Presolve kept %s of %s rows and %s of %s columns",
+                      self.rows.sum() - 1, len(self.rows) - 1,
+                      self.cols.sum() - 1, len(self.cols) - 1)
+
+    def _nonzeros(self):
+        '''
+        The non-zeros of the kept part of A, as a mask over the array.
+        '''
+        nz = ~eq(self._array, 0)
+        nz[~self.rows, :] = False
+        nz[:, ~self.cols] = False
+        nz[0, :] = False
+        nz[:, 0] = False
+        return nz
+
+    def _fix(self, cols, value):
+        '''
+        Fixes the given columns at value and moves them into b.
+        '''
+        arr = self._array
+        if value:
+            arr[:, 0] -= arr[:, cols] @ np.broadcast_to(value, len(cols))
+        self._values[cols - 1] = value
+        self.cols[cols] = False
+
+    def _set_infeasible(self, reason):
+        _logger.debug("Presolve found the LP infeasible: %s", reason)
+        self.infeasible = True
+
+    def _kept_rows(self, nz):
+        rows = self.rows & nz.any(axis=1)
+        rows[0] = False
+        return np.flatnonzero(rows)
+
+    def _kept_cols(self, nz):
+        cols = self.cols & nz.any(axis=0)
+        cols[0] = False
+        return np.flatnonzero(cols)
+
+    def _empty_rows(self, nz):
+        empty = self.rows & ~nz.any(axis=1)
+        empty[0] = False
+        if np.any(~eq(self._array[empty, 0], 0)):
+            self._set_infeasible('empty row with b != 0')
+            return 0
+        self.rows[empty] = False
+        return int(empty.sum())
+
+    def _singleton_rows(self, nz):
+        arr = self._array
+        count = 0
+        for i in np.flatnonzero(nz.sum(axis=1) == 1):
+            j = int(np.argmax(nz[i]))
+            if not self.cols[j]:
+                # Fixed by an earlier row, which leaves this row empty
+                continue
+            value = arr[i, 0] / arr[i, j]
+            if not geq(value, 0):
+                self._set_infeasible('singleton row fixes x < 0')
+                return count
+            self._fix(np.array([j]), max(value, 0))
+            self.rows[i] = False
+            count += 1
+        return count
+
+    def _forced_rows(self, nz):
+        arr = self._array
+        rows = self._kept_rows(nz)
+        nz, A, b = nz[rows], arr[rows], arr[rows, 0]
+        nonneg = ~np.any(nz & (A < 0), axis=1)
+        nonpos = ~np.any(nz & (A > 0), axis=1)
+        if np.any((nonneg & ~geq(b, 0)) | (nonpos & ~leq(b, 0))):
+            self._set_infeasible('row cannot reach b with x >= 0')
+            return 0
+        forced = (nonneg | nonpos) & eq(b, 0)
+        if not np.any(forced):
+            return 0
+        self._fix(np.flatnonzero(np.any(nz[forced], axis=0)), 0)
+        self.rows[rows[forced]] = False
+        return int(forced.sum())
+
+    def _empty_cols(self, nz):
+        empty = self.cols & ~nz.any(axis=0) & geq(self._array[0, :], 0)
+        empty[0] = False
+        cols = np.flatnonzero(empty)
+        self._fix(cols, 0)
+        return len(cols)
+
+    def _duplicate_rows(self, nz):
+        arr = self._array
+        rows, cols = self._kept_rows(nz), self._kept_cols(nz)
+        if not len(rows):
+            return 0
+        A = arr[np.ix_(rows, cols)]
+        first = A[np.arange(len(rows)), np.argmax(nz[np.ix_(rows, cols)],
+                                                  axis=1)]
+        b = arr[rows, 0] / first
+        groups = _groups(A / first[:, np.newaxis])
+        count = 0
+        for group in groups:
+            keep, drop = group[0], group[1:]
+            if not np.all(eq(b[drop], b[keep])):
+                self._set_infeasible('duplicate rows with different b')
+                return count
+            self.rows[rows[drop]] = False
+            count += len(drop)
+        return count
+
+    def _dominated_cols(self, nz):
+        arr = self._array
+        rows, cols = self._kept_rows(nz), self._kept_cols(nz)
+        if not len(rows):
+            return 0
+        A = arr[np.ix_(rows, cols)]
+        first = A[np.argmax(nz[np.ix_(rows, cols)], axis=0),
+                  np.arange(len(cols))]
+        scale = np.abs(first)
+        c = arr[0, cols] / scale
+        count = 0
+        for group in _groups((A / scale).T):
+            # Keep the cheapest column, which can stand in for the others
+            keep = group[np.argmin(c[group])]
+            drop = group[group != keep]
+            self._fix(cols[drop], 0)
+            count += len(drop)
+        return count
+
+    def _singleton_cols(self, nz):
+        arr = self._array
+        count = 0
+        for j in np.flatnonzero(nz.sum(axis=0) == 1):
+            i = int(np.argmax(nz[:, j]))
+            if not self.rows[i]:
+                # Substituted out with an earlier column in this row
+                continue
+            others = nz[i].copy()
+            others[j] = False
+            a, b, row = arr[i, j], arr[i, 0], arr[i, others]
+            # x_j = (b - sum a_k x_k) / a is then never negative
+            if a > 0:
+                implied = geq(b, 0) and np.all(leq(row, 0))
+            else:
+                implied = leq(b, 0) and np.all(geq(row, 0))
+            if not implied:
+                continue
+            saved = arr[i].copy()
+            saved[~self.cols] = 0
+            self._substituted.append((j, saved))
+            arr[0, :] -= arr[0, j] / a * arr[i, :]
+            self.rows[i] = False
+            self.cols[j] = False
+            count += 1
+        return count
+
+    def postsolve(self, x):
+        '''
+        Maps x of the reduced LP to x of the original LP.
+        '''
+        values = self._values.copy()
+        values[self.cols[1:]] = x
+        for j, row in reversed(self._substituted):
+            values[j - 1] = (row[0] - row[1:] @ values) / row[j]
+        return values
+
+    def solve(self, tableau=Tableau, **kwargs):
+        '''
+        Solves the reduced LP with Simplex, and returns true if it is
+        optimal. The reduced tableau is left in tableau, and the solution
+        of the original LP in x and z. The keyword arguments, such as
+        max_iters or pricing, set up the Simplex of the reduced LP. No
+        Simplex runs if presolve already found the LP infeasible.
+        '''
+        if self.infeasible:
+            return False
+        self.tableau = tableau(self.array)
+        if not solve_counted(self, 'iters', self.tableau, **kwargs):
+            return False
+        self.x = self.postsolve(self.tableau.x)
+        self.z = self.tableau.z
+        return True
+
+
+def _groups(vectors, decimals=9):
+    '''
+    The groups of (numerically) equal rows of vectors, as arrays of row
+    indices in increasing order, leaving out rows equal to no other.
+    '''
+    if not len(vectors):
+        return []
+    # Adding 0 turns -0 into 0
+    keys = np.round(vectors, decimals) + 0.
+    _, inverse, counts = np.unique(keys, axis=0, return_inverse=True,
+                                   return_counts=True)
+    inverse = inverse.ravel()
+    order = np.argsort(inverse, kind='stable')
+    groups = np.split(order, np.cumsum(counts)[:-1])
+    return [group for group in groups if len(group) > 1]
@@ -0,0 +1,132 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Pricing rules choose the entering column of a primal simplex pivot.
+Pass one to Simplex, or to Tableau.simplex_pivot, in place of the
+default most negative c rule.
+'''
+import numpy as np
+from linprog.tableau import geq
+
+
+class Pricing:
+    '''
+    Base class for pricing rules.
+    choose is only called on a tableau that is canonical and not optimal,
+    so some column has c < 0. update is called just before each pivot the
+    rule chose, so rules that keep weights can update them.
+    '''
+
+    def reset(self):
+        pass
+
+    def choose(self, tableau):
+        '''
+        Returns the zero-based index into c of the entering column.
+        '''
+        raise NotImplementedError()
+
+    def update(self, tableau, row, column):
+        pass
+
+
+class Dantzig(Pricing):
+    '''
+    Enters the column with the most negative c.
+    '''
+
+    def choose(self, tableau):
+        return int(np.argmin(tableau.c))
+
+
+class Bland(Pricing):
+    '''
+    Enters the first column with c < 0 (Bland's rule). With the smallest
+    index tie break in the ratio test (Tableau.bland) the simplex method
+    cannot cycle, though it usually takes many more pivots.
+    '''
+
+    def choose(self, tableau):
+        return int(np.argmax(~geq(tableau.c, 0, tableau.epsilon)))
+
+
+class SteepestEdge(Pricing):
+    '''
+    Enters the column with the most negative c relative to the length of
+    its edge, c_j^2 / (1 + |A_j|^2). The edge lengths are computed exactly
+    from the candidate columns on each call.
+    '''
+
+    def choose(self, tableau):
+        c = tableau.c
+        candidates = np.flatnonzero(~geq(c, 0, tableau.epsilon))
+        A = tableau._columns(candidates + 1)
+        scores = c[candidates] ** 2 / (1 + np.sum(A ** 2, axis=0))
+        return int(candidates[np.argmax(scores)])
+
+
+class Devex(Pricing):
+    '''
+    Approximate steepest edge with reference weights (Forrest and
+    Goldfarb). The weights start at 1 and are updated from the pivot row
+    on each pivot instead of being recomputed.
+    '''
+
+    def __init__(self):
+        self.weights = None
+
+    def reset(self):
+        self.weights = None
+
+    def _weights(self, tableau):
+        if self.weights is None or len(self.weights) != tableau.m - 1:
+            self.weights = np.ones(tableau.m - 1)
+        return self.weights
+
+    def choose(self, tableau):
+        c = tableau.c
+        scores = np.where(~geq(c, 0, tableau.epsilon),
+                          c ** 2 / self._weights(tableau), -1)
+        return int(np.argmax(scores))
+
+    def update(self, tableau, row, column):
+        w = self._weights(tableau)
+        q = column - 1
+        alpha = tableau._rows([row - 1])[0]
+        w_q = w[q]
+        ratios = (alpha / alpha[q]) ** 2
+        nonbasic = tableau._basis_rows[1:] == 0
+        w[nonbasic] = np.maximum(w[nonbasic], ratios[nonbasic] * w_q)
+        leaving = tableau.basis[row - 1]
+        if leaving:
+            w[leaving - 1] = max(w_q / alpha[q] ** 2, 1)
+
+
+class PartialPricing(Pricing):
+    '''
+    Scans one block of block_size columns at a time, starting from the
+    block the last entering column came from, and enters the most
+    negative c in the first block that has one.
+    '''
+
+    def __init__(self, block_size=64):
+        self.block_size = block_size
+        self.start = 0
+
+    def reset(self):
+        self.start = 0
+
+    def choose(self, tableau):
+        c = tableau.c
+        size = len(c)
+        start = self.start % size
+        for _ in range(-(-size // self.block_size)):
+            block = np.arange(start, start + self.block_size) % size
+            j = block[np.argmin(c[block])]
+            if not geq(c[j], 0, tableau.epsilon):
+                self.start = start
+                return int(j)
+            start = (start + self.block_size) % size
+        return int(np.argmin(c))
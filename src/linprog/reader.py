@@ -0,0 +1,574 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Readers for LPs in MPS and CPLEX LP files. Each reads the file in one
+pass, keeping the coefficients in typed arrays of C doubles and ints
+rather than lists of Python floats, and then builds the tableau array in
+one step, dense or as a scipy.sparse CSR matrix.
+
+The tableau is for min cx subject to Ax = b, x >= 0, so the LP of the
+file is brought into that form:
+
+- A <= row gets a slack column. A >= row is negated and gets a slack
+  column, so both start with a basic column. An = row gets none, and
+  Simplex finds it a basic column in Phase 0. A row with both a lower
+  and an upper limit (an MPS range) becomes two rows.
+- A variable with a finite lower bound l is shifted to x - l. A variable
+  with no lower bound is split into x+ - x-, with x- as an extra column
+  after the columns of the file's variables.
+- A finite upper bound becomes a <= row of its own. Read with
+  bounds_as_rows false to leave those rows out and keep the bounds in
+  Problem.column_upper instead, for BoundedTableau(problem.array,
+  upper=problem.column_upper). The upper bound of a split variable stays
+  a row either way.
+- A maximization is solved as the minimization of -cx.
+
+Integer variables are relaxed to continuous ones.
+'''
+import gzip
+import re
+from array import array as carray
+
+import numpy as np
+
+# Row kinds in an MPS file
+_E, _L, _G, _N = 0, 1, 2, 3
+_KINDS = {'E': _E, 'L': _L, 'G': _G, 'N': _N}
+
+# Codes of the rows that are not constraints
+_OBJECTIVE = -1
+_FREE = -2
+
+# Bound types that take a value
+_VALUED = {'UP', 'LO', 'FX', 'LI', 'UI'}
+
+
+def _lines(source):
+    '''
+    The lines of a path, a gzipped path ending in .gz, or an open file.
+    '''
+    if hasattr(source, 'read'):
+        yield from source
+        return
+    opener = gzip.open if str(source).endswith('.gz') else open
+    with opener(source, 'rt') as f:
+        yield from f
+
+
+class Problem:
+    '''
+    An LP read from a file.
+    array is the tableau array, a numpy array or a scipy.sparse CSR matrix.
+    columns and rows are the names of the variables and constraints of the
+    file, and lower and upper the bounds of the variables, in the order
+    they were first seen. If maximize is true, the tableau minimizes -cx.
+    column_upper is None if the upper bounds are rows of the tableau,
+    otherwise the upper bounds of its columns of A. Their lower bounds
+    are 0.
+    '''
+
+    def __init__(self, array, columns, rows, lower, upper, maximize, free,
+                 column_upper=None):
+        self.array = array
+        self.columns = columns
+        self.rows = rows
+        self.lower = lower
+        self.upper = upper
+        self.maximize = maximize
+        self._free = free
+        self.column_upper = column_upper
+
+    def postsolve(self, x):
+        '''
+        Maps x of the tableau to the variables of the file.
+        '''
+        k = len(self.columns)
+        out = np.where(np.isinf(self.lower), 0, self.lower) + x[:k]
+        out[self._free] -= x[k:k + len(self._free)]
+        return out
+
+    def objective(self, z):
+        '''
+        Maps z of the tableau to the objective of the file.
+        '''
+        return -z if self.maximize else z
+
+
+class _Builder:
+    '''
+    Collects an LP as it is read, and builds its tableau.
+    '''
+
+    def __init__(self):
+        self.rows = {}
+        self.cols = {}
+        # Triplets of the constraint matrix
+        self.i = carray('q')
+        self.j = carray('q')
+        self.a = carray('d')
+        # Pairs of the objective
+        self.cj = carray('q')
+        self.c = carray('d')
+        self.offset = 0.
+        self.lower = {}
+        self.upper = {}
+        self.maximize = False
+
+    def row(self, name):
+        i = self.rows.get(name)
+        if i is None:
+            i = self.rows[name] = len(self.rows)
+        return i
+
+    def col(self, name):
+        j = self.cols.get(name)
+        if j is None:
+            j = self.cols[name] = len(self.cols)
+        return j
+
+    def build(self, lo, hi, sparse=False, bounds_as_rows=True):
+        '''
+        Builds the tableau, given the lower and upper limits of each row.
+        '''
+        k = len(self.cols)
+        lower, upper = np.zeros(k), np.full(k, np.inf)
+        lower[list(self.lower)] = list(self.lower.values())
+        upper[list(self.upper)] = list(self.upper.values())
+        i = np.array(self.i, dtype=np.int64)
+        j = np.array(self.j, dtype=np.int64)
+        a = np.array(self.a, dtype=float)
+        c = np.bincount(np.array(self.cj, dtype=np.int64),
+                        np.array(self.c, dtype=float), minlength=k)
+        if self.maximize:
+            c, offset = -c, -self.offset
+        else:
+            offset = self.offset
+        # Shift by the finite lower bounds
+        free = np.flatnonzero(np.isinf(lower))
+        shift = np.where(np.isinf(lower), 0, lower)
+        moved = np.bincount(i, a * shift[j], minlength=len(lo))
+        lo, hi = lo - moved, hi - moved
+        offset += c @ shift
+        upper = upper - shift
+        # Split the free variables
+        neg = np.full(k, -1)
+        neg[free] = k + np.arange(len(free))
+        split = neg[j] >= 0
+        i = np.r_[i, i[split]]
+        j = np.r_[j, neg[j[split]]]
+        a = np.r_[a, -a[split]]
+        c = np.r_[c, -c[free]]
+        m = k + len(free)
+        # Constraint rows: each row in its own sense, then the lower
+        # limits of the ranged rows
+        equal = lo == hi
+        has_hi = np.isfinite(hi)
+        has_lo = np.isfinite(lo) & ~equal
+        ranged = has_hi & has_lo & ~equal
+        first = np.full(len(lo), -1)
+        kept = np.flatnonzero(has_hi | has_lo)
+        first[kept] = np.arange(len(kept))
+        second = np.full(len(lo), -1)
+        second[ranged] = len(kept) + np.arange(ranged.sum())
+        negate = ~has_hi
+        rows = [first[i], second[i]]
+        ok = rows[0] >= 0
+        ti = [rows[0][ok]]
+        tj = [j[ok]]
+        ta = [np.where(negate[i[ok]], -a[ok], a[ok])]
+        ok = rows[1] >= 0
+        ti.append(rows[1][ok])
+        tj.append(j[ok])
+        ta.append(-a[ok])
+        b = np.r_[np.where(negate, -lo, hi)[kept], -lo[ranged]]
+        slack = np.r_[~equal[kept], np.ones(ranged.sum(), dtype=bool)]
+        # Upper bound rows
+        bounded = np.flatnonzero(np.isfinite(upper))
+        if not bounds_as_rows:
+            # Only the bound of a split variable is not on one column
+            bounded = bounded[neg[bounded] >= 0]
+        bound_rows = len(b) + np.arange(len(bounded))
+        ti.append(bound_rows)
+        tj.append(bounded)
+        ta.append(np.ones(len(bounded)))
+        both = neg[bounded] >= 0
+        ti.append(bound_rows[both])
+        tj.append(neg[bounded[both]])
+        ta.append(-np.ones(both.sum()))
+        b = np.r_[b, upper[bounded]]
+        slack = np.r_[slack, np.ones(len(bounded), dtype=bool)]
+        # Slack columns
+        slack_rows = np.flatnonzero(slack)
+        ti.append(slack_rows)
+        tj.append(m + np.arange(len(slack_rows)))
+        ta.append(np.ones(len(slack_rows)))
+        n = len(b)
+        shape = (n + 1, m + len(slack_rows) + 1)
+        # The tableau, with row 0 as [-z0, c] and column 0 as b
+        ti = np.r_[np.concatenate(ti) + 1, np.zeros(m, dtype=np.int64),
+                   np.arange(1, n + 1), 0]
+        tj = np.r_[np.concatenate(tj) + 1, np.arange(1, m + 1),
+                   np.zeros(n, dtype=np.int64), 0]
+        ta = np.r_[np.concatenate(ta), c, b, -offset]
+        if sparse:
+            import scipy.sparse as sp
+            array = sp.csr_matrix((ta, (ti, tj)), shape=shape)
+        else:
+            array = np.zeros(shape)
+            np.add.at(array, (ti, tj), ta)
+        column_upper = None
+        if not bounds_as_rows:
+            column_upper = np.full(shape[1] - 1, np.inf)
+            column_upper[:k] = np.where(neg >= 0, np.inf, upper)
+        return Problem(array, list(self.cols), list(self.rows),
+                       lower, upper + shift, self.maximize, free,
+                       column_upper)
+
+
+def read_mps(source, sparse=False, bounds_as_rows=True):
+    '''
+    Reads an LP from an MPS file, in fixed or free format as long as no
+    name has a space in it. source is a path, or an open file. The first
+    N row is the objective and any other N rows are dropped. A constant in
+    the objective is given as the negative of the objective's RHS.
+    '''
+    builder = _Builder()
+    codes = {}
+    kinds = carray('b')
+    rhs = carray('d')
+    ranges = {}
+    section = objective = None
+    last_name, j = None, None
+    for line in _lines(source):
+        if not line.strip() or line[0] == '*':
+            continue
+        fields = line.split()
+        if not line[0].isspace():
+            section = fields[0].upper()
+            if section == 'OBJSENSE' and len(fields) > 1:
+                builder.maximize = fields[1].upper().startswith('MAX')
+            if section == 'ENDATA':
+                break
+            continue
+        if section == 'COLUMNS':
+            if len(fields) > 2 and fields[1] == "'MARKER'":
+                continue
+            name = fields[0]
+            if name != last_name:
+                last_name, j = name, builder.col(name)
+            for f in range(1, len(fields) - 1, 2):
+                i = codes[fields[f]]
+                if i >= 0:
+                    builder.i.append(i)
+                    builder.j.append(j)
+                    builder.a.append(float(fields[f + 1]))
+                elif i == _OBJECTIVE:
+                    builder.cj.append(j)
+                    builder.c.append(float(fields[f + 1]))
+        elif section == 'ROWS':
+            kind, name = _KINDS[fields[0].upper()], fields[1]
+            if kind != _N:
+                codes[name] = builder.row(name)
+                kinds.append(kind)
+                rhs.append(0.)
+            elif objective:
+                codes[name] = _FREE
+            else:
+                codes[name] = _OBJECTIVE
+                objective = name
+        elif section in ('RHS', 'RANGES'):
+            for f in range(len(fields) % 2, len(fields) - 1, 2):
+                i, value = codes[fields[f]], float(fields[f + 1])
+                if section == 'RANGES':
+                    ranges[i] = value
+                elif i >= 0:
+                    rhs[i] = value
+                elif i == _OBJECTIVE:
+                    builder.offset = -value
+        elif section == 'BOUNDS':
+            kind = fields[0].upper()
+            if len(fields) > (3 if kind in _VALUED else 2):
+                # Drop the name of the bound set
+                fields = fields[:1] + fields[2:]
+            j = builder.col(fields[1])
+            value = float(fields[2]) if len(fields) > 2 else 0.
+            if kind in ('UP', 'UI'):
+                builder.upper[j] = value
+                if value < 0 and builder.lower.get(j, 0.) == 0:
+                    builder.lower[j] = -np.inf
+            elif kind in ('LO', 'LI'):
+                builder.lower[j] = value
+            elif kind == 'FX':
+                builder.lower[j] = builder.upper[j] = value
+            elif kind == 'FR':
+                builder.lower[j], builder.upper[j] = -np.inf, np.inf
+            elif kind == 'MI':
+                builder.lower[j] = -np.inf
+            elif kind == 'PL':
+                builder.upper[j] = np.inf
+            elif kind == 'BV':
+                builder.lower[j], builder.upper[j] = 0., 1.
+        elif section == 'OBJSENSE':
+            builder.maximize = fields[0].upper().startswith('MAX')
+    kinds = np.array(kinds, dtype=np.int8)
+    rhs = np.array(rhs, dtype=float)
+    lo = np.where(kinds != _L, rhs, -np.inf)
+    hi = np.where(kinds != _G, rhs, np.inf)
+    for i, r in ranges.items():
+        if i < 0:
+            continue
+        if kinds[i] == _L or kinds[i] == _E and r < 0:
+            lo[i] = rhs[i] - abs(r)
+        if kinds[i] == _G or kinds[i] == _E and r > 0:
+            hi[i] = rhs[i] + abs(r)
+    return builder.build(lo, hi, sparse, bounds_as_rows)
+
+
+_SECTION = re.compile(
+    r'\s*(minimi[sz]e|minimum|min|maximi[sz]e|maximum|max|subject\s+to|'
+    r'such\s+that|s\.t\.|st|bounds?|generals?|gen|integers?|int|'
+    r'binar(?:y|ies)|bin|semi-continuous|semis?|sos|end)(?=\s|$)', re.I)
+_TOKEN = re.compile(r'((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|'
+                    r'(<=|>=|=<|=>|[<>=])|([+-])|(:)|'
+                    r'([^\s+\-*^<>=:\[\]\\]+)')
+_INFINITY = {'inf', 'infinity'}
+# Each comparison as one of <, > and =
+_OPS = {'<=': '<', '=<': '<', '<': '<', '>=': '>', '=>': '>', '>': '>',
+        '=': '='}
+
+
+class _LPReader:
+    '''
+    Reads the statements of a CPLEX LP file token by token, so that a
+    statement may span lines.
+    '''
+
+    def __init__(self):
+        self.builder = _Builder()
+        self.lo = carray('d')
+        self.hi = carray('d')
+        self.section = None
+        self._start()
+
+    def _start(self):
+        '''
+        Starts a new statement.
+        '''
+        self.name = None
+        self.sign = 1.
+        self.coef = None
+        self.op = None
+        self.range_op = None
+        self.range_value = None
+        self.row = None
+        self.terms = 0
+        self.constant = 0.
+
+    def _close(self):
+        '''
+        Ends the statement at the end of a section.
+        '''
+        self._flush()
+        if self.section == 'objective':
+            self.builder.offset += self.constant
+        self._start()
+
+    def _new_row(self):
+        '''
+        Adds an unnamed constraint.
+        '''
+        rows = self.builder.rows
+        name = 'R%d' % len(rows)
+        while name in rows:
+            name += "'"
+        return self.builder.row(name)
+
+    def _term(self, name):
+        '''
+        Adds a variable term to the statement.
+        '''
+        builder = self.builder
+        j = builder.col(name)
+        value = self.sign * (1. if self.coef is None else self.coef)
+        if self.section == 'objective':
+            builder.cj.append(j)
+            builder.c.append(value)
+        else:
+            if self.row is None:
+                self.row = self._new_row()
+            self.terms += 1
+            builder.i.append(self.row)
+            builder.j.append(j)
+            builder.a.append(value)
+        self.sign, self.coef = 1., None
+
+    def _flush(self):
+        '''
+        Adds a pending name as a term and a pending number as a constant.
+        '''
+        if self.name is not None:
+            name, self.name = self.name, None
+            self._term(name)
+        elif self.coef is not None:
+            self.constant += self.sign * self.coef
+            self.sign, self.coef = 1., None
+
+    def _label(self, name):
+        if self.section == 'constraints':
+            self.row = self.builder.row(name)
+
+    def _constraint(self, value):
+        '''
+        Ends a constraint at its right hand side.
+        '''
+        if self.row is None:
+            self.row = self._new_row()
+        value -= self.constant
+        lo, hi = -np.inf, np.inf
+        if self.op in '<=':
+            hi = value
+        if self.op in '>=':
+            lo = value
+        if self.range_op is not None:
+            # range_value op expression
+            limit = self.range_value - self.constant
+            if self.range_op in '<=':
+                lo = limit
+            if self.range_op in '>=':
+                hi = limit
+        self.lo.append(lo)
+        self.hi.append(hi)
+        self._start()
+
+    def feed(self, line):
+        '''
+        Reads one line of the file.
+        '''
+        line = line.split('\\', 1)[0]
+        match = _SECTION.match(line)
+        if match:
+            self._close()
+            keyword = match.group(1).lower()
+            if keyword.startswith('max'):
+                self.section = 'objective'
+                self.builder.maximize = True
+            elif keyword.startswith('min'):
+                self.section = 'objective'
+            elif keyword in ('subject to', 'such that', 's.t.', 'st') or \
+                    keyword.split()[0] in ('subject', 'such'):
+                self.section = 'constraints'
+            elif keyword.startswith('bound'):
+                self.section = 'bounds'
+            elif keyword.startswith('bin'):
+                self.section = 'binaries'
+            elif keyword == 'end':
+                self.section = 'end'
+            else:
+                self.section = 'ignored'
+            line = line[match.end():]
+        if self.section in ('objective', 'constraints'):
+            self._statement(line)
+        elif self.section == 'bounds':
+            self._bound(line)
+        elif self.section == 'binaries':
+            builder = self.builder
+            for name in line.split():
+                j = builder.col(name)
+                builder.lower[j], builder.upper[j] = 0., 1.
+
+    def _statement(self, line):
+        for number, op, sign, colon, name in _TOKEN.findall(line):
+            if colon:
+                self._label(self.name)
+                self.name = None
+                continue
+            if self.name is not None:
+                name_, self.name = self.name, None
+                self._term(name_)
+            if number:
+                value = float(number)
+                if self.op is not None:
+                    self._constraint(self.sign * value)
+                else:
+                    self.coef = value
+            elif name:
+                if name.lower() in _INFINITY and self.coef is None:
+                    self.coef = np.inf
+                else:
+                    self.name = name
+            elif sign:
+                if self.coef is not None:
+                    self._flush()
+                if sign == '-':
+                    self.sign = -self.sign
+            elif op:
+                op = _OPS[op]
+                if self.coef is not None and not self.terms and \
+                        self.op is None:
+                    # A range: number op expression op number
+                    self.range_op = op
+                    self.range_value = self.sign * self.coef
+                    self.sign, self.coef = 1., None
+                else:
+                    self._flush()
+                    self.op = op
+                    self.sign = 1.
+
+    def _bound(self, line):
+        tokens = []
+        sign = 1.
+        for number, op, s, colon, name in _TOKEN.findall(line):
+            if s:
+                sign = -sign if s == '-' else sign
+            elif number or name.lower() in _INFINITY:
+                tokens.append(sign * (float(number) if number else np.inf))
+                sign = 1.
+            elif name:
+                tokens.append(name)
+            elif op:
+                tokens.append(_OPS[op])
+        if not tokens:
+            return
+        builder = self.builder
+        if len(tokens) == 2 and str(tokens[1]).lower() == 'free':
+            j = builder.col(tokens[0])
+            builder.lower[j], builder.upper[j] = -np.inf, np.inf
+            return
+        if not isinstance(tokens[0], str):
+            # number op name [op number]
+            value, op, name = tokens[:3]
+            op = {'<': '>', '>': '<', '=': '='}[op]
+            self._set_bound(builder.col(name), op, value)
+            tokens = tokens[2:]
+        if len(tokens) == 3:
+            name, op, value = tokens
+            self._set_bound(builder.col(name), op, value)
+
+    def _set_bound(self, j, op, value):
+        builder = self.builder
+        if op in '<=':
+            builder.upper[j] = value
+        if op in '>=':
+            builder.lower[j] = value
+
+    def build(self, sparse, bounds_as_rows):
+        self._close()
+        lo = np.array(self.lo, dtype=float)
+        hi = np.array(self.hi, dtype=float)
+        return self.builder.build(lo, hi, sparse, bounds_as_rows)
+
+
+def read_lp(source, sparse=False, bounds_as_rows=True):
+    '''
+    Reads an LP from a CPLEX LP file. source is a path, or an open file.
+    Keywords are only recognized at the start of a line. Unnamed
+    constraints are named R0, R1, and so on.
+    '''
+    reader = _LPReader()
+    for line in _lines(source):
+        reader.feed(line)
+        if reader.section == 'end':
+            break
+    return reader.build(sparse, bounds_as_rows)
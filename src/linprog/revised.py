@@ -0,0 +1,232 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+import numpy as np
+import logging
+import warnings
+from linprog.tableau import Tableau, PivotException, eq, geq, leq
+
+_logger = logging.getLogger(__name__)
+
+try:
+    from scipy.linalg import lu_factor as _lu_factor, lu_solve as _lu_solve
+except ImportError:
+    _lu_factor = _lu_solve = None
+
+
+def lu_factor(a):
+    '''
+    Factors a square matrix for lu_solve, in the dtype of a, at least
+    float32, or in float64 if a is not floating. With scipy this is an LU
+    factorization with partial pivoting, otherwise the inverse. Raises
+    numpy.linalg.LinAlgError if the matrix is singular.
+    '''
+    a = np.array(a, dtype=np.result_type(a, np.float32))
+    if _lu_factor is None:
+        return np.linalg.inv(a), None
+    with warnings.catch_warnings():
+        # A zero pivot is reported below
+        warnings.simplefilter('ignore')
+        lu, piv = _lu_factor(a, check_finite=False)
+    if np.any(eq(np.diag(lu), 0)):
+        raise np.linalg.LinAlgError('Matrix is singular')
+    return lu, piv
+
+
+def lu_solve(factors, v, trans=False):
+    '''
+    Solves Ax = v, or A^T x = v if trans is true, given the factors of A
+    from lu_factor. v may be a vector or a matrix of right hand sides.
+    '''
+    lu, piv = factors
+    v = np.asarray(v, dtype=lu.dtype)
+    if piv is None:
+        return (lu.T if trans else lu) @ v
+    return _lu_solve(factors, v, trans=int(trans), check_finite=False)
+
+
+class RevisedTableau(Tableau):
+    '''
+    A tableau for the revised simplex method.
+
+    The original array is never modified. Instead the basis matrix is kept
+    as an LU factorization plus a product-form eta file, one eta per pivot,
+    and the parts of the tableau a pivot rule needs are computed from it on
+    demand. Rows that have not been pivoted yet keep a unit column in the
+    basis matrix. The factorization is recomputed from scratch every
+    refactor_every pivots.
+
+    Can be used anywhere a Tableau can, in particular with Simplex.
+    A, M and __str__ form the whole current tableau, so they are slow.
+    '''
+
+    def __init__(self, array, refactor_every=50, **kwargs):
+        super().__init__(array, **kwargs)
+        self.refactor_every = refactor_every
+        self._factors = None
+        self._etas = []
+        super().rebuild_basis()
+        self.refactor()
+
+    def __str__(self):
+        return str(self.M)
+
+    def __repr__(self):
+        return repr(self.M)
+
+    def _reset_status(self):
+        super()._reset_status()
+        self._b = None
+        self._duals = None
+        self._c = None
+        self._entering = None
+
+    def refactor(self):
+        '''
+        Factors the current basis matrix and clears the eta file.
+        '''
+        _logger.debug("Refactoring basis")
+        basis = self._basis
+        basic = basis > 0
+        B = np.eye(self.n - 1, dtype=self._array.dtype)
+        B[:, basic] = self._array[1:, basis[basic]]
+        self._factors = lu_factor(B)
+        self._etas = []
+        self._reset_status()
+
+    def rebuild_basis(self):
+        '''
+        The basis of a revised tableau is exactly the set of columns
+        pivoted in, so this only refactors the basis matrix.
+        '''
+        self.refactor()
+        return self._basis
+
+    def _ftran(self, v):
+        '''
+        Solves Bx = v for the current basis matrix B.
+        '''
+        x = lu_solve(self._factors, v)
+        for r, d in self._etas:
+            x_r = x[r] / d[r]
+            x -= np.multiply.outer(d, x_r)
+            x[r] = x_r
+        return x
+
+    def _btran(self, v):
+        '''
+        Solves B^T x = v for the current basis matrix B.
+        '''
+        v = np.array(v, dtype=self._array.dtype)
+        for r, d in reversed(self._etas):
+            v[r] = (v[r] - (d @ v - d[r] * v[r])) / d[r]
+        return lu_solve(self._factors, v, trans=True)
+
+    def _snap(self, v):
+        '''
+        Zeroes entries within epsilon of zero. Values recomputed from the
+        factorization carry rounding noise that elimination in place
+        would have cancelled exactly.
+        '''
+        v[eq(v, 0, self.epsilon)] = 0
+        return v
+
+    def _multipliers(self):
+        '''
+        The simplex multipliers: the c row is the original c row minus
+        these times the original rows of A.
+        '''
+        if self._duals is None:
+            basis = self._basis
+            basic = basis > 0
+            costs = np.zeros(self.n - 1, dtype=self._array.dtype)
+            costs[basic] = self._array[0, basis[basic]]
+            self._duals = self._btran(costs)
+        return self._duals
+
+    def _column(self, col_index):
+        '''
+        The current column col_index of A.
+        '''
+        if self._entering is not None and self._entering[0] == col_index:
+            return self._entering[1]
+        return self._snap(self._ftran(self._array[1:, col_index]))
+
+    def _columns(self, col_indices):
+        return self._snap(self._ftran(self._array[1:, col_indices]))
+
+    def _rows(self, row_indices):
+        '''
+        The current rows of A with the given (zero-based) indices.
+        '''
+        E = np.zeros((self.n - 1, len(row_indices)),
+                     dtype=self._array.dtype)
+        E[row_indices, np.arange(len(row_indices))] = 1
+        return self._snap(self._btran(E).T @ self._array[1:, 1:])
+
+    @property
+    def A(self):
+        return self._snap(self._ftran(self._array[1:, 1:]))
+
+    @property
+    def b(self):
+        if self._b is None:
+            self._b = self._snap(self._ftran(self._array[1:, 0]))
+        return self._b
+
+    @property
+    def c(self):
+        if self._c is None:
+            c = self._array[0, 1:] - self._multipliers() @ self._array[1:, 1:]
+            basis = self._basis
+            c[basis[basis > 0] - 1] = 0
+            self._c = self._snap(c)
+        return self._c
+
+    def _objective(self):
+        return -(self._array[0, 0] -
+                 self._multipliers() @ self._array[1:, 0])
+
+    @property
+    def M(self):
+        arr = self._array
+        top = arr[0, :] - self._multipliers() @ arr[1:, :]
+        top[1:] = self.c
+        return np.r_[top.reshape(1, self.m),
+                     np.c_[self.b, self.A]]
+
+    def _has_unbounded_col(self):
+        # Only the column Dantzig's rule would enter is checked
+        c = self.c
+        j = int(np.argmin(c))
+        if geq(c[j], 0, self.epsilon):
+            return False
+        d = self._column(j + 1)
+        self._entering = (j + 1, d)
+        return bool(np.all(leq(d, 0, self.epsilon)))
+
+    def add_costs(self, delta):
+        '''
+        The c row is priced out from the original costs on demand, so
+        only those change.
+        '''
+        self._array[0, 1:] += delta
+        self._reset_status()
+        return self
+
+    def pivot(self, row, column):
+        r, c = row, column
+        if r <= 0 or c <= 0:
+            raise PivotException('Invalid pivot! Must pivot in A!')
+        d = self._column(c)
+        if eq(d[r - 1], 0, self.epsilon):
+            raise PivotException('Pivot must be non-zero!')
+        self._etas.append((r - 1, d))
+        self._update_basis(r, c)
+        self._reset_status()
+        self.last_pivot = r, c
+        if len(self._etas) >= self.refactor_every:
+            self.refactor()
+        return self
@@ -0,0 +1,87 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Row and column scaling of a tableau array before it is solved.
+
+The rows of [b A] are scaled by R and the columns of [c A] by C, so that
+the scaled LP is min (cC)x' subject to (RAC)x' = Rb, x' >= 0, with
+x = Cx'. z is unchanged. A column with a single non-zero, such as a
+slack column, is scaled back to a unit column, so the identity columns of
+the array stay identity columns.
+'''
+import numpy as np
+from linprog.simplex import solve_counted
+from linprog.tableau import Tableau
+
+
+def _geometric(A, axis):
+    '''
+    The factors that scale the largest and smallest non-zero magnitude
+    along axis to reciprocals of each other.
+    '''
+    nz = A != 0
+    big = np.max(np.where(nz, A, 0), axis=axis)
+    small = np.min(np.where(nz, A, np.inf), axis=axis)
+    return np.where(big > 0, 1 / np.sqrt(big * small), 1.)
+
+
+def _pow2(factors):
+    '''
+    Rounds factors to powers of 2, so that scaling is exact.
+    '''
+    return np.exp2(np.round(np.log2(factors)))
+
+
+class Scaling:
+    '''
+    Equilibrates a tableau array with passes of geometric mean scaling of
+    the rows and columns of A, followed by scaling each column to a
+    largest magnitude of 1. The factors are powers of 2.
+    array is the scaled array and rows and cols are R and C.
+    '''
+
+    def __init__(self, array, passes=4):
+        array = np.array(array, dtype=float)
+        A = np.abs(array[1:, 1:])
+        n, m = A.shape
+        rows, cols = np.ones(n), np.ones(m)
+        for _ in range(passes):
+            r = _geometric(A, 1)
+            rows *= r
+            A *= r[:, np.newaxis]
+            c = _geometric(A, 0)
+            cols *= c
+            A *= c
+        c = 1 / np.where(A.any(axis=0), A.max(axis=0), 1.)
+        cols *= c
+        self.rows, self.cols = _pow2(rows), _pow2(cols)
+        array[1:, :] *= self.rows[:, np.newaxis]
+        array[:, 1:] *= self.cols
+        self.array = array
+        self.tableau = None
+        self.iters = 0
+        self.x = None
+        self.z = None
+
+    def unscale(self, x):
+        '''
+        Maps x of the scaled LP to x of the original LP.
+        '''
+        return self.cols * x
+
+    def solve(self, tableau=Tableau, **kwargs):
+        '''
+        Solves the scaled LP with Simplex, and returns true if it is
+        optimal. The scaled tableau is left in tableau, and the solution
+        of the original LP in x and z. The keyword arguments, such as
+        max_iters or pricing, set up the Simplex, which works on the
+        scaled tableau, so its tolerances apply to the scaled values.
+        '''
+        self.tableau = tableau(self.array.copy())
+        if not solve_counted(self, 'iters', self.tableau, **kwargs):
+            return False
+        self.x = self.unscale(self.tableau.x)
+        self.z = self.tableau.z
+        return True
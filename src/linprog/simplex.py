@@ -3,39 +3,179 @@ Created on May 22, 2016
 
 @author: Gudmundur Heimisson
 '''
+import numpy as np
+from time import perf_counter
+from linprog.pricing import Bland
+from linprog.stats import Stats
+from linprog.tableau import eq, geq
+from linprog.trace import Trace, BASIS, DUAL, SUBPROBLEM, PRIMAL
 
 
 class MaxIterationsReachedError(Exception):
     pass
 
 
+# Anti-cycling strategies
+BLAND = 'bland'
+PERTURB = 'perturb'
+
+# Size of the cost perturbation, relative to 1 + |c|
+PERTURBATION = 1e-5
+
+
 class Simplex:
 
-    def __init__(self, tableau, max_iters=10000):
+    def __init__(self, tableau, max_iters=10000, pricing=None, trace=False,
+                 anticycling=None, stall=50, seed=None, stats=False):
+        '''
+        tableau may be a Tableau or any of its subclasses.
+        pricing is an optional rule from linprog.pricing that chooses the
+        entering column of the primal simplex pivots.
+        If trace is true, each iteration is recorded in a linprog.trace.Trace
+        kept in trace.
+        If stats is true, or a linprog.stats.Stats to add to, the time
+        spent in each phase and operation is measured in a Stats kept in
+        stats.
+        An iteration that leaves the objective unchanged is degenerate.
+        After stall degenerate iterations in a row, anticycling switches
+        strategy: BLAND falls back to Bland's rule until the objective
+        changes, and PERTURB adds a random perturbation, seeded by seed, to
+        the costs. The perturbation is removed once the perturbed LP is
+        solved, and the solve carries on from there, with Bland's rule if
+        it stalls again.
+        degenerate counts the degenerate iterations and stalls the number
+        of times the strategy was switched.
+        '''
+        if anticycling not in (None, BLAND, PERTURB):
+            raise ValueError('Unknown anticycling strategy %r' % anticycling)
         self.max_iters = max_iters
         self.iters = 0
         self.tableau = tableau
+        self.pricing = pricing
+        if pricing is not None:
+            pricing.reset()
+        self.trace = Trace() if trace else None
+        if stats is True:
+            stats = Stats()
+        self.stats = stats or None
+        self.phase = BASIS
+        self.anticycling = anticycling
+        self.stall = stall
+        self.degenerate = 0
+        self.stalls = 0
+        self._run = 0
+        self._rng = np.random.RandomState(seed)
+        self._bland = None
+        self._perturbation = None
 
     def _do_until(self, do, until):
+        tableau = self.tableau
+        stats = self.stats
+        if stats is not None:
+            until = stats.timed('status', until)
+        z = tableau._objective()
         while self.iters <= self.max_iters:
             if not until():
                 self.iters += 1
-                yield do()
+                tableau.last_pivot = None
+                if stats is not None:
+                    start = perf_counter()
+                result = do()
+                if stats is not None:
+                    seconds = perf_counter() - start
+                last = z
+                z = tableau._objective()
+                pivoted = tableau.last_pivot is not None
+                degenerate = pivoted and eq(z, last, tableau.epsilon)
+                if self.trace is not None:
+                    self.trace.record(self.phase, tableau.last_pivot, z)
+                if pivoted:
+                    self._progress(degenerate)
+                if stats is not None:
+                    stats.record(self.phase, seconds, pivoted, degenerate)
+                yield result
             else:
-                raise StopIteration()
+                return
         else:
             raise MaxIterationsReachedError()
 
+    def _progress(self, degenerate):
+        '''
+        Counts a pivot, and switches strategy when the objective stalls
+        or Bland's rule is no longer needed.
+        '''
+        if not degenerate:
+            self._run = 0
+            if self._bland is not None:
+                self._bland = None
+                self.tableau.bland = False
+            return
+        self.degenerate += 1
+        self._run += 1
+        if self.anticycling is None or self._run < self.stall:
+            return
+        self._run = 0
+        if self._bland is not None:
+            return
+        self.stalls += 1
+        if self.anticycling == PERTURB and self._perturbation is None:
+            self._perturb()
+        else:
+            self._bland = Bland()
+            self.tableau.bland = True
+
+    def _perturb(self):
+        '''
+        Adds a small random cost to each nonbasic column.
+        '''
+        tableau = self.tableau
+        c = tableau.c
+        scale = self._rng.uniform(.5, 1, len(c))
+        delta = PERTURBATION * (1 + np.abs(c)) * scale
+        delta[tableau.basis - 1] = 0
+        tableau.add_costs(delta)
+        self._perturbation = delta
+
+    def _unperturb(self):
+        '''
+        Removes the cost perturbation, if there is one. Returns true if
+        there was.
+        '''
+        if self._perturbation is None or not len(self._perturbation):
+            return False
+        self.tableau.add_costs(-self._perturbation)
+        # An empty perturbation keeps PERTURB from being used again
+        self._perturbation = self._perturbation[:0]
+        return True
+
     def __iter__(self):
+        if self.stats is not None:
+            self.stats.start(self.tableau)
+        try:
+            yield from self._solve()
+        finally:
+            # Leave the tableau with the costs of the LP however the solve
+            # ends
+            self._unperturb()
+            self.tableau.bland = False
+            if self.stats is not None:
+                self.stats.stop(self.tableau)
+
+    def _solve(self):
         tableau = self.tableau
         if not tableau.canonical:
             yield from self._phase0()
         # After phase 0, tableau is either canonical or infeasible
         if tableau.infeasible:
-            raise StopIteration()
+            return
         else:
             done = lambda: tableau.optimal or tableau.unbounded
-            yield from self._do_until(tableau.simplex_pivot, done)
+            pivot = lambda: tableau.simplex_pivot(self._bland or
+                                                  self.pricing)
+            self.phase = PRIMAL
+            yield from self._do_until(pivot, done)
+            if self._unperturb():
+                yield from self._do_until(pivot, done)
 
     def _phase0(self):
         '''
@@ -43,14 +183,20 @@ class Simplex:
         '''
         tableau = self.tableau
         # Acquire a basis
-        have_basis = lambda: all(tableau.basis) or tableau.infeasible
+        have_basis = lambda: np.all(tableau.basis) or tableau.infeasible
+        self.phase = BASIS
         yield from self._do_until(tableau.basis_pivot, have_basis)
         # Get to canonical form
-        canonical_pivot = lambda: (tableau.dual_simplex_pivot()
-                                   if all(tableau.c >= 0)
-                                   else tableau.subproblem_pivot())
         is_canonical = lambda: tableau.canonical or tableau.infeasible
-        yield from self._do_until(canonical_pivot, is_canonical)
+        yield from self._do_until(self._canonical_pivot, is_canonical)
+
+    def _canonical_pivot(self):
+        tableau = self.tableau
+        if np.all(geq(tableau.c, 0, tableau.epsilon)):
+            self.phase = DUAL
+            return tableau.dual_simplex_pivot()
+        self.phase = SUBPROBLEM
+        return tableau.subproblem_pivot()
 
     def solve(self):
         '''
@@ -62,3 +208,17 @@ class Simplex:
         for _ in self:
             pass
         return self.tableau.optimal
+
+
+def solve_counted(owner, attribute, tableau, **kwargs):
+    '''
+    Solves tableau with a Simplex made with the keyword arguments, and
+    sets the given attribute of owner to the iterations taken, also when
+    the solve raises. Returns true if the tableau ends optimal.
+    '''
+    s = Simplex(tableau, **kwargs)
+    try:
+        s.solve()
+    finally:
+        setattr(owner, attribute, s.iters)
+    return tableau.optimal
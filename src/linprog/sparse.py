@@ -0,0 +1,184 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+import numpy as np
+import scipy.sparse as sp
+import logging
+from linprog.tableau import Tableau, PivotException, eq, neq, geq, leq
+
+_logger = logging.getLogger(__name__)
+
+
+def _count(matrix, where, axis):
+    '''
+    Counts the stored entries of a sparse matrix for which where is true,
+    per row (axis=1) or per column (axis=0).
+    '''
+    coo = matrix.tocoo()
+    hit = where(coo.data)
+    index = coo.row if axis == 1 else coo.col
+    return np.bincount(index[hit], minlength=matrix.shape[1 - axis])
+
+
+def _replace_rows(matrix, rows, lengths, indices, data):
+    '''
+    Replaces the rows of the CSR matrix at the given sorted indices, in
+    place, with rows of the given lengths whose entries are in indices and
+    data, row after row. The other rows are copied as the runs of entries
+    between the replaced ones.
+    '''
+    old = matrix.indptr
+    counts = np.diff(old)
+    counts[rows] = lengths
+    indptr = np.zeros(len(old), dtype=old.dtype)
+    np.cumsum(counts, out=indptr[1:])
+    offsets = np.r_[0, np.cumsum(lengths)]
+    new_indices, new_data = [], []
+    last = 0
+    for k, row in enumerate(rows):
+        new_indices += [matrix.indices[last:old[row]],
+                        indices[offsets[k]:offsets[k + 1]]]
+        new_data += [matrix.data[last:old[row]],
+                     data[offsets[k]:offsets[k + 1]]]
+        last = old[row + 1]
+    new_indices.append(matrix.indices[last:])
+    new_data.append(matrix.data[last:])
+    matrix.indices = np.concatenate(new_indices).astype(old.dtype,
+                                                        copy=False)
+    matrix.data = np.concatenate(new_data)
+    matrix.indptr = indptr
+
+
+class SparseTableau(Tableau):
+    '''
+    A tableau stored as a scipy.sparse CSR matrix.
+
+    The status checks and pivot rules work on the stored entries only,
+    and Phase 0 checks the improving columns of its subproblem without
+    forming them densely. pivot only computes the rows with a non-zero in
+    the pivot column, but splicing them in copies the stored arrays once,
+    so a pivot takes time in proportion to the non-zeros of the tableau.
+    b and c, and single rows or columns of A, are formed as dense vectors.
+    A and M are returned as sparse matrices.
+    '''
+
+    def __init__(self, array, dtype=float, **kwargs):
+        super().__init__(sp.csr_matrix(array, dtype=dtype), **kwargs)
+
+    @property
+    def A(self):
+        return self._array[1:, 1:]
+
+    @property
+    def b(self):
+        return self._array[1:, 0].toarray().ravel()
+
+    @property
+    def c(self):
+        return self._array[0, 1:].toarray().ravel()
+
+    def _column(self, col_index):
+        return self._array[1:, col_index].toarray().ravel()
+
+    def _columns(self, col_indices):
+        return self._array[1:, col_indices].toarray()
+
+    def _rows(self, row_indices):
+        return self.A[row_indices, :].toarray()
+
+    def _has_infeasible_row(self):
+        A, b, eps = self.A, self.b, self.epsilon
+        empty = ~eq(b, 0, eps) & (_count(A, lambda a: ~eq(a, 0, eps), 1) == 0)
+        too_low = ~geq(b, 0, eps) & (_count(A, lambda a: ~geq(a, 0, eps),
+                                            1) == 0)
+        too_high = ~leq(b, 0, eps) & (_count(A, lambda a: ~leq(a, 0, eps),
+                                             1) == 0)
+        return bool(np.any(empty | too_low | too_high))
+
+    def _has_unbounded_col(self):
+        eps = self.epsilon
+        positive = _count(self.A, lambda a: ~leq(a, 0, eps), 0)
+        return bool(np.any(~geq(self.c, 0, self.epsilon) &
+                           (positive == 0)))
+
+    def _basic_cols(self):
+        coo = self._array[:, 1:].tocoo()
+        nonzero = ~eq(coo.data, 0, self.epsilon)
+        ones = eq(coo.data, 1, self.epsilon)
+        m = self.m - 1
+        one_rows = np.zeros(m, dtype='int_')
+        one_rows[coo.col[ones]] = coo.row[ones]
+        # Exactly one non-zero, it is a 1, and it is not in the c row
+        is_basic = ((np.bincount(coo.col[nonzero], minlength=m) == 1) &
+                    (np.bincount(coo.col[ones], minlength=m) == 1) &
+                    (one_rows > 0))
+        col_indices = np.flatnonzero(is_basic)
+        return col_indices + 1, one_rows[col_indices]
+
+    def add_costs(self, delta):
+        arr = self._array
+        basis = self.basis
+        rows = np.flatnonzero(basis) + 1
+        top = np.r_[0, delta] - delta[basis[rows - 1] - 1] @ arr[rows, :]
+        top[basis[rows - 1]] = 0
+        arr = sp.vstack([sp.csr_matrix(arr[0, :] + top), arr[1:, :]])
+        arr = arr.tocsr()
+        arr.eliminate_zeros()
+        self._array = arr
+        self._reset_status()
+        return self
+
+    def _positive_cols(self, col_indices, rows):
+        D = self._array[np.flatnonzero(rows) + 1, :][:, col_indices]
+        eps = self.epsilon
+        return _count(D, lambda a: ~leq(a, 0, eps), 0) > 0
+
+    def pivot(self, row, column):
+        r, c = row, column
+        arr = self._array
+        if r <= 0 or c <= 0:
+            raise PivotException('Invalid pivot! Must pivot in A!')
+        pivot = arr[r, c]
+        if eq(pivot, 0, self.epsilon):
+            raise PivotException('Pivot must be non-zero!')
+        if neq(pivot, 1, self.epsilon):
+            arr.data[arr.indptr[r]:arr.indptr[r + 1]] /= pivot
+        # Eliminate column c from the rows with a non-zero in it. Only
+        # those rows are rebuilt, from their entries and those of the
+        # pivot row times their entry in column c, and spliced back in.
+        indptr, indices, data = arr.indptr, arr.indices, arr.data
+        pivot_cols = indices[indptr[r]:indptr[r + 1]]
+        pivot_row = data[indptr[r]:indptr[r + 1]]
+        hit = np.flatnonzero(indices == c)
+        rows = np.searchsorted(indptr, hit, side='right') - 1
+        values = data[hit]
+        keep = (rows != r) & (np.abs(values) >= self.epsilon)
+        rows, values = rows[keep], values[keep]
+        if len(rows):
+            k = len(rows)
+            lengths = indptr[rows + 1] - indptr[rows]
+            entries = np.concatenate([np.arange(indptr[i], indptr[i + 1])
+                                      for i in rows])
+            owner = np.concatenate([np.repeat(np.arange(k), lengths),
+                                    np.repeat(np.arange(k), len(pivot_cols))])
+            cols = np.concatenate([indices[entries], np.tile(pivot_cols, k)])
+            vals = np.concatenate([data[entries],
+                                   -np.outer(values, pivot_row).ravel()])
+            # Sum the entries that fall on the same row and column
+            order = np.lexsort((cols, owner))
+            owner, cols, vals = owner[order], cols[order], vals[order]
+            first = np.ones(len(owner), dtype=bool)
+            first[1:] = (owner[1:] != owner[:-1]) | (cols[1:] != cols[:-1])
+            vals = np.add.reduceat(vals, np.flatnonzero(first))
+            owner, cols = owner[first], cols[first]
+            nonzero = vals != 0
+            owner, cols, vals = owner[nonzero], cols[nonzero], vals[nonzero]
+            _replace_rows(arr, rows, np.bincount(owner, minlength=k), cols,
+                          vals)
+        self._reset_status()
+        if self._basis is not None:
+            self._update_basis(r, c)
+        self.last_pivot = r, c
+        return self
@@ -0,0 +1,145 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+Where the time of a solve goes. Enable it with Simplex(tableau, stats=True),
+or pass a Stats to keep across solves; nothing is timed when it is off.
+'''
+import json
+import sys
+import tracemalloc
+from time import perf_counter
+
+from linprog.trace import PHASES
+
+try:
+    import resource
+except ImportError:  # Not on Windows
+    resource = None
+
+# The operations timed, apart from pricing, which is the time of an
+# iteration not spent in the ratio test or the pivot
+OPERATIONS = ('pricing', 'ratio', 'pivot', 'status')
+
+
+class Stats:
+    '''
+    Per phase (see linprog.trace.PHASES), the iterations, pivots,
+    degenerate pivots and seconds spent in Simplex iterations, and per
+    operation, the cumulative seconds spent in choosing the pivot
+    (pricing), in the ratio tests, in pivoting and in checking the status
+    of the tableau between iterations.
+    peak_memory is the largest number of bytes allocated by Python during
+    the solves if memory is true, which traces every allocation with
+    tracemalloc and so slows the solve down, and None otherwise.
+    max_rss is the peak resident memory of the process in bytes, where
+    the platform reports it.
+    '''
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.clear()
+
+    def clear(self):
+        self.iters = dict.fromkeys(PHASES, 0)
+        self.pivots = dict.fromkeys(PHASES, 0)
+        self.degenerate = dict.fromkeys(PHASES, 0)
+        self.phase_seconds = dict.fromkeys(PHASES, 0.)
+        self.seconds = dict.fromkeys(OPERATIONS, 0.)
+        self.peak_memory = None
+        self.max_rss = None
+
+    def timed(self, operation, f):
+        '''
+        Wraps f so that its calls are added to the seconds of operation.
+        '''
+        seconds = self.seconds
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                seconds[operation] += perf_counter() - start
+        return timed
+
+    def record(self, phase, seconds, pivoted, degenerate):
+        '''
+        Counts an iteration of phase that took seconds.
+        '''
+        name = PHASES[phase]
+        self.iters[name] += 1
+        self.pivots[name] += bool(pivoted)
+        self.degenerate[name] += bool(degenerate)
+        self.phase_seconds[name] += seconds
+        self.seconds['pricing'] += seconds
+
+    def start(self, tableau):
+        '''
+        Starts timing the ratio tests and pivots of tableau, by wrapping
+        those methods on the instance, and tracing memory if asked to.
+        '''
+        self._wrapped = {}
+        for operation, names in [('ratio', ('_ratio_row', '_dual_ratio')),
+                                 ('pivot', ('pivot',))]:
+            for name in names:
+                self._wrapped[name] = tableau.__dict__.get(name)
+                setattr(tableau, name,
+                        self.timed(operation, getattr(tableau, name)))
+        self._tracing = self.memory and not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+        elif self.memory:
+            tracemalloc.reset_peak()
+        # Iteration time includes the ratio tests and pivots, so stop takes
+        # them out of pricing
+        self._before = self.seconds['ratio'] + self.seconds['pivot']
+
+    def stop(self, tableau):
+        '''
+        Undoes start.
+        '''
+        for name, method in self._wrapped.items():
+            if method is None:
+                del tableau.__dict__[name]
+            else:
+                setattr(tableau, name, method)
+        self.seconds['pricing'] -= (self.seconds['ratio'] +
+                                    self.seconds['pivot'] - self._before)
+        if self.memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peak_memory = max(self.peak_memory or 0, peak)
+            if self._tracing:
+                tracemalloc.stop()
+        if resource is not None:
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # Reported in bytes on macOS and in kB elsewhere
+            self.max_rss = rss if sys.platform == 'darwin' else rss * 1024
+
+    def to_dict(self):
+        return {'iters': dict(self.iters),
+                'pivots': dict(self.pivots),
+                'degenerate': dict(self.degenerate),
+                'phase_seconds': dict(self.phase_seconds),
+                'seconds': dict(self.seconds),
+                'peak_memory': self.peak_memory,
+                'max_rss': self.max_rss}
+
+    def to_json(self, **kwargs):
+        '''
+        kwargs are passed to json.dumps.
+        '''
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def __str__(self):
+        return '\n'.join(
+            ['%-10s %8s %8s %10s %10s' % ('phase', 'iters', 'pivots',
+                                          'degenerate', 'seconds')] +
+            ['%-10s %8d %8d %10d %10.4g' % (name, self.iters[name],
+                                            self.pivots[name],
+                                            self.degenerate[name],
+                                            self.phase_seconds[name])
+             for name in PHASES] +
+            ['%-10s %10.4g' % (name, self.seconds[name])
+             for name in OPERATIONS])
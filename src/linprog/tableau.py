@@ -5,6 +5,7 @@ Created on May 21, 2016
 '''
 import numpy as np
 import logging
+from functools import lru_cache
 
 _logger = logging.getLogger(__name__)
 
@@ -17,27 +18,99 @@ class InvalidBranchException(Exception):
     pass
 
 
+# Tolerance for float64
 EPSILON = 1e-7
 
 
-def eq(lhs, rhs, epsilon=EPSILON):
-    return np.abs(lhs - rhs) < EPSILON
+@lru_cache()
+def tolerance(dtype):
+    '''
+    The tolerance for comparisons in dtype: EPSILON for float64, scaled by
+    the square root of the ratio of machine epsilons for other floating
+    types, so about 2e-3 for float32.
+    '''
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        return EPSILON
+    return EPSILON * float(np.sqrt(np.finfo(dtype).eps /
+                                   np.finfo(np.float64).eps))
 
 
-def neq(lhs, rhs, epsilon=EPSILON):
+def eq(lhs, rhs, epsilon=None):
+    if epsilon is None:
+        epsilon = tolerance(np.result_type(lhs, rhs))
+    return np.abs(lhs - rhs) < epsilon
+
+
+def neq(lhs, rhs, epsilon=None):
     return not eq(lhs, rhs, epsilon)
 
 
-class Tableau:
+def geq(lhs, rhs, epsilon=None):
+    if epsilon is None:
+        epsilon = tolerance(np.result_type(lhs, rhs))
+    return lhs > rhs - epsilon
+
+
+def leq(lhs, rhs, epsilon=None):
+    if epsilon is None:
+        epsilon = tolerance(np.result_type(lhs, rhs))
+    return lhs < rhs + epsilon
 
-    def __init__(self, array):
+
+def harris(ratios, relaxed, weights):
+    '''
+    Harris' two-pass ratio test. The first pass finds the smallest of the
+    relaxed ratios, which are the ratios with the values allowed to go
+    past their bounds by the tolerance. The second pass picks, of the
+    ratios no larger than that, the one with the largest weight (the
+    magnitude of its pivot element). Returns its index, or None if every
+    ratio is infinite.
+    '''
+    bound = np.min(relaxed)
+    if np.isinf(bound):
+        return None
+    return int(np.argmax(np.where(ratios <= bound, weights, -np.inf)))
+
+
+class Tableau:
+    '''
+    If dtype is given and differs from the array's, the tableau works on a
+    copy of the array in dtype. Otherwise it works on the array in place.
+    epsilon is the tolerance the tableau's comparisons are made with, by
+    default the tolerance for the array's dtype (see tolerance). If
+    relative is true it is taken relative to the largest magnitude in A
+    instead, which is only useful if A is well scaled (see
+    linprog.scaling). If harris is true, the primal and dual ratio tests are
+    Harris' two-pass ratio test, which prefers larger pivot elements among
+    nearly tied ratios.
+    If bland is set, the ratio tests break ties by the smallest basic
+    column index instead, which with Bland's pricing rule (see
+    linprog.pricing) cannot cycle. Simplex sets it while it has fallen
+    back to Bland's rule.
+    '''
+
+    def __init__(self, array, epsilon=None, relative=False, harris=False,
+                 dtype=None):
+        if dtype is not None and array.dtype != dtype:
+            array = array.astype(dtype)
+        if epsilon is None:
+            epsilon = tolerance(array.dtype)
         self._canonical = None
         self._optimal = None
         self._infeasible = None
         self._unbounded = None
         self._basis = None
+        self._basis_rows = None
         self._vars = None
         self._array = array
+        # The (row, column) of the most recent pivot
+        self.last_pivot = None
+        if relative:
+            epsilon *= max(abs(array[1:, 1:]).max(), 1.)
+        self.epsilon = epsilon
+        self.harris = harris
+        self.bland = False
 
     def __str__(self):
         return str(self._array)
@@ -67,7 +140,14 @@ class Tableau:
 
     @property
     def z(self):
-        return -self._array[0, 0] if self.canonical else None
+        return self._objective() if self.canonical else None
+
+    def _objective(self):
+        '''
+        The objective value of the current basic solution, whether or not
+        the tableau is canonical.
+        '''
+        return -self._array[0, 0]
 
     @property
     def M(self):
@@ -76,19 +156,16 @@ class Tableau:
     @property
     def x(self):
         if self._vars is None and self.canonical:
-            _logger.debug("Checking vars")
             # Initialize to zeros
             self._vars = np.zeros(self.m - 1)
-            for col_index, b in zip(self.basis_cols, self.b):
-                self._vars[col_index - 1] = b
+            self._vars[self.basis - 1] = self.b
         return self._vars
 
     @property
     def canonical(self):
         if self._canonical is None:
-            _logger.debug("Checking if canonical.")
             # Check for identity columns
-            if (all(self.basis) and all(b >= 0 for b in self.b)):
+            if np.all(self.basis) and np.all(geq(self.b, 0, self.epsilon)):
                 self._canonical = True
             else:
                 self._canonical = False
@@ -97,8 +174,8 @@ class Tableau:
     @property
     def optimal(self):
         if self._optimal is None:
-            _logger.debug("Checking if optimal.")
-            self._optimal = self.canonical and all(c >= 0 for c in self.c)
+            self._optimal = bool(self.canonical and
+                                 np.all(geq(self.c, 0, self.epsilon)))
             if self._optimal:
                 self._infeasible = self._unbounded = False
         return self._optimal
@@ -106,15 +183,7 @@ class Tableau:
     @property
     def infeasible(self):
         if self._infeasible is None:
-            _logger.debug("Checking if infeasible.")
-            for i, b in enumerate(self.b):
-                if ((neq(b, 0) and all(eq(a, 0) for a in self.A[i, :]))
-                        or (b < 0 and all(a >= 0 for a in self.A[i, :]))
-                        or (b > 0 and all(a <= 0 for a in self.A[i, :]))):
-                    self._infeasible = True
-                    break
-            else:
-                self._infeasible = False
+            self._infeasible = self._has_infeasible_row()
             if self._infeasible:
                 self._optimal = self._unbounded = False
         return self._infeasible
@@ -122,178 +191,323 @@ class Tableau:
     @property
     def unbounded(self):
         if self._unbounded is None:
-            _logger.debug("Checking if unbounded")
             if not self.canonical:
                 self._unbounded = False
             else:
-                self._unbounded = any(c < 0 and
-                                      all(a <= 0 for a in self.A[:, i])
-                                      for i, c in enumerate(self.c))
+                self._unbounded = self._has_unbounded_col()
             if self._unbounded:
                 self._optimal = self._infeasible = False
         return self._unbounded
 
+    def _has_infeasible_row(self):
+        '''
+        Checks for a row that cannot be satisfied by any x >= 0.
+        '''
+        b = self.b
+        # A row with a basic column and b >= 0 can always be satisfied
+        rows = np.flatnonzero((self.basis == 0) | ~geq(b, 0, self.epsilon))
+        A, b = self._rows(rows), b[rows]
+        eps = self.epsilon
+        empty = ~eq(b, 0, eps) & np.all(eq(A, 0, eps), axis=1)
+        too_low = ~geq(b, 0, eps) & np.all(geq(A, 0, eps), axis=1)
+        too_high = ~leq(b, 0, eps) & np.all(leq(A, 0, eps), axis=1)
+        return bool(np.any(empty | too_low | too_high))
+
+    def _has_unbounded_col(self):
+        '''
+        Checks for an improving column with no positive entry.
+        '''
+        eps = self.epsilon
+        return bool(np.any(~geq(self.c, 0, eps) &
+                           np.all(leq(self.A, 0, eps), axis=0)))
+
     @property
     def basis(self):
+        '''
+        The index of the basic column for each row of A, or 0 if the row
+        has no basic column. Found by scanning the tableau on first access
+        and then kept up to date by pivot.
+        '''
         if self._basis is None:
-            _logger.debug("Finding basis")
-            cols = np.zeros(self.n - 1, dtype='int_')
-            for col_index in range(1, self.m):
-                is_basic, x_index = self._is_basic_col(col_index)
-                if is_basic and not cols[x_index - 1]:
-                    cols[x_index - 1] = col_index
-            self._basis = cols
+            self.rebuild_basis()
         return self._basis
 
-    def _is_basic_col(self, col_index):
-        '''
-        Checks whether the corresponding column is an identity column
-        (i.e., the corresponding variable is basic).
-        Returns a tuple.
-        If the column is an identity column,
-        returns true and the index of the 1 in the column.
-        If the column is not an identity column, returns false and None
-        '''
-        one_index = None
-        for row_index, val in enumerate(self._array[:, col_index]):
-            if neq(val, 0) and neq(val, 1):
-                return False, None
-            elif eq(val, 1):
-                if one_index is not None:
-                    return False, None
-                else:
-                    one_index = row_index
-        if one_index is None:  # All elements are 0
-            return False, None
-        return True, one_index
-
-    def _del_empty_rcs(self):
-        arr = self._array
-        rows = neq(np.abs(arr).sum(0), 0)
-        cols = neq(np.abs(arr).sum(1), 0)
-        self._array = arr[np.ix_(rows, cols)]
+    def rebuild_basis(self):
+        '''
+        Rescans the tableau for identity columns to find the basis.
+        Only needed if the array was modified other than through pivot.
+        '''
+        _logger.debug("Finding basis")
+        cols = np.zeros(self.n - 1, dtype='int_')
+        col_indices, row_indices = self._basic_cols()
+        # Keep the first identity column found for each row
+        rows, first = np.unique(row_indices, return_index=True)
+        cols[rows - 1] = col_indices[first]
+        self._basis = cols
+        # Reverse index from column to the row it is basic in, or 0
+        self._basis_rows = np.zeros(self.m, dtype='int_')
+        self._basis_rows[cols[cols > 0]] = np.flatnonzero(cols) + 1
+        return self._basis
+
+    def _update_basis(self, row, column):
+        '''
+        Updates the basis after pivoting on (row, column): column becomes
+        basic in row, and whichever column was basic there leaves.
+        '''
+        basis, basis_rows = self._basis, self._basis_rows
+        leaving = basis[row - 1]
+        if leaving:
+            basis_rows[leaving] = 0
+        if basis_rows[column]:
+            basis[basis_rows[column] - 1] = 0
+        basis[row - 1] = column
+        basis_rows[column] = row
+
+    def _basic_cols(self):
+        '''
+        Finds the identity columns (i.e., the columns of basic variables).
+        Returns a tuple of two arrays: the indices of the identity columns,
+        in increasing order, and the index of the row holding the 1 in
+        each of them.
+        '''
+        arr = self._array[:, 1:]
+        zeros = eq(arr, 0, self.epsilon)
+        ones = eq(arr, 1, self.epsilon)
+        one_rows = ones.argmax(axis=0)
+        # Exactly one 1, everything else 0, and the 1 is not in the c row
+        is_basic = (np.all(zeros | ones, axis=0) &
+                    (ones.sum(axis=0) == 1) & (one_rows > 0))
+        col_indices = np.flatnonzero(is_basic)
+        return col_indices + 1, one_rows[col_indices]
 
     def pivot(self, row, column):
-        _logger.debug("Pivoting on %s, %s" % (row, column))
         r, c = row, column
         arr = self._array
         if r <= 0 or c <= 0:
             raise PivotException('Invalid pivot! Must pivot in A!')
         pivot = arr[r, c]
-        if eq(pivot, 0):
+        if eq(pivot, 0, self.epsilon):
             raise PivotException('Pivot must be non-zero!')
-        if neq(pivot, 1):
+        if neq(pivot, 1, self.epsilon):
             arr[r, :] /= pivot
-        for i in range(self.n):
-            if i == r:
-                continue
-            a_ic = arr[i, c]
-            if neq(a_ic, 0):
-                arr[i, :] -= a_ic * arr[r, :]
+        # Eliminate column c from every other row with a single rank-1
+        # update, skipping rows that are already zero in that column.
+        col = arr[:, c].copy()
+        col[r] = 0
+        rows = np.abs(col) >= self.epsilon
+        arr[rows, :] -= np.outer(col[rows], arr[r, :])
+        self._reset_status()
+        if self._basis is not None:
+            self._update_basis(r, c)
+        self.last_pivot = r, c
+        return self
+
+    def add_costs(self, delta):
+        '''
+        Adds delta to the costs c of the LP, then prices out the basic
+        columns so that the tableau keeps its basis.
+        '''
+        arr = self._array
+        basis = self.basis
+        rows = np.flatnonzero(basis) + 1
+        arr[0, 1:] += delta
+        arr[0, :] -= delta[basis[rows - 1] - 1] @ arr[rows, :]
+        arr[0, basis[rows - 1]] = 0
+        self._reset_status()
+        return self
+
+    def _reset_status(self):
+        '''
+        Clears the cached status flags and solution after the tableau
+        has changed.
+        '''
         self._canonical = None
         self._optimal = None
         self._infeasible = None
         self._unbounded = None
-        self._basis = None
         self._vars = None
-        return self
 
-    def get_simplex_pivot(self):
-        _logger.debug("Computing simplex pivot")
+    def _column(self, col_index):
+        '''
+        The current column col_index of A.
+        '''
+        return self._array[1:, col_index]
+
+    def _columns(self, col_indices):
+        '''
+        The current columns of A with the given indices, as a dense array.
+        '''
+        return self._array[1:, col_indices]
+
+    def _positive_cols(self, col_indices, rows):
+        '''
+        Whether each of the current columns of A with the given indices
+        has an entry above epsilon in the rows of the boolean mask rows.
+        '''
+        D = self._columns(col_indices)[rows, :]
+        return np.any(~leq(D, 0, self.epsilon), axis=0)
+
+    def _rows(self, row_indices):
+        '''
+        The current rows of A with the given (zero-based) indices.
+        '''
+        return self.A[row_indices, :]
+
+    def _ratio_row(self, d, rows=None, column=None):
+        '''
+        Minimum ratio test of b against column d, over the given
+        (zero-based) rows or all rows. Returns the zero-based row index,
+        or None if no row has a positive entry.
+        column is the index of the entering column d was taken from.
+        '''
+        b, basis = self.b, self.basis
+        if rows is not None:
+            b, d, basis = b[rows], d[rows], basis[rows]
+        if self.harris and not self.bland:
+            i = self._harris(b, d)
+        else:
+            pos = ~leq(d, 0, self.epsilon)
+            if not np.any(pos):
+                return None
+            ratios = np.full(len(d), np.inf)
+            ratios[pos] = b[pos] / d[pos]
+            i = int(np.argmin(ratios))
+            if self.bland:
+                i = self._bland(ratios, basis)
+        if i is None:
+            return None
+        return i if rows is None else int(rows[i])
+
+    def _harris(self, v, d):
+        '''
+        Harris' ratio test of v against d over d > epsilon. v may have
+        been pushed below 0 by up to epsilon, which is treated as 0.
+        '''
+        eps = self.epsilon
+        pos = d > eps
+        v = np.maximum(v[pos], 0)
+        ratios = np.full(len(d), np.inf)
+        relaxed = np.full(len(d), np.inf)
+        ratios[pos] = v / d[pos]
+        relaxed[pos] = (v + eps) / d[pos]
+        return harris(ratios, relaxed, np.abs(d))
+
+    def _bland(self, ratios, basis):
+        '''
+        Of the rows tied within epsilon for the minimum ratio, the one
+        whose basic column has the smallest index (Bland's rule).
+        '''
+        ties = np.flatnonzero(ratios <= np.min(ratios) + self.epsilon)
+        return int(ties[np.argmin(basis[ties])])
+
+    def get_simplex_pivot(self, pricing=None):
+        '''
+        Finds a primal simplex pivot. The entering column is the one with
+        the most negative c (Dantzig's rule), unless a pricing rule from
+        linprog.pricing is given.
+        '''
         if not self.canonical:
             raise PivotException("Must be in canonical form.")
         if self.unbounded:
             raise PivotException("Tableau is unbounded.")
         if self.optimal:
             return None
-        # Find column with most negative c
-        j, _ = min(enumerate(self.c), key=lambda t: t[1])
+        if pricing is None:
+            # Find column with most negative c
+            j = int(np.argmin(self.c))
+        else:
+            j = pricing.choose(self)
         # Find minimum ratio row
-        i, _ = min(((i, b / a)
-                    for i, (a, b) in enumerate(zip(self.A[:, j], self.b))
-                    if a > 0),
-                   key=lambda x: x[1])
+        i = self._ratio_row(self._column(j + 1), column=j + 1)
+        if i is None:
+            # The entering column has no positive entry
+            self._unbounded = True
+            self._optimal = self._infeasible = False
+            return None
         return i + 1, j + 1
 
     def get_dual_simplex_pivot(self):
-        _logger.debug("Computing dual simplex pivot")
-        if not all(c >= 0 for c in self.c):
+        if not np.all(geq(self.c, 0, self.epsilon)):
             raise PivotException("Must have c >= 0 to dual simplex pivot")
-        if not all(self.basis):
+        if not np.all(self.basis):
             raise PivotException('Must have full set of basis columns')
         if self.optimal or self.infeasible:
             return None
         # Get row with most negative b
-        i, _ = min(((i, b) for i, b in enumerate(self.b) if b < 0),
-                   key=lambda t: t[1])
-        # Find maximum ratio column
-        j, _ = min(((j, c / a)
-                    for j, (a, c) in enumerate(zip(self.A[i, :], self.c))
-                    if a < 0),
-                   key=lambda t: t[1])
+        i = int(np.argmin(self.b))
+        # Find the column that keeps c non-negative
+        j = self._dual_ratio(self._rows([i])[0])
         return i + 1, j + 1
 
+    def _dual_ratio(self, a):
+        '''
+        The ratio test of the dual simplex on the leaving row a: the
+        column with the smallest ratio c / |a| over a < -epsilon.
+        '''
+        if self.harris:
+            j = self._harris(self.c, -a)
+            if j is None:
+                # No a < -epsilon, so the row is infeasible
+                j = int(np.argmin(a))
+            return j
+        neg = ~geq(a, 0, self.epsilon)
+        if not np.any(neg):
+            # The row is infeasible
+            return int(np.argmin(a))
+        ratios = np.full(len(a), np.inf)
+        ratios[neg] = self.c[neg] / -a[neg]
+        return int(np.argmin(ratios))
+
     def get_basis_pivot(self):
-        _logger.debug("Computing basis pivot")
-        # Find out which basis rows are missing, and which cols do not
-        # already contain a basis
-        cols = list(range(1, self.m))
-        for basis_index, col_index in enumerate(self.basis):
-            if col_index:
-                cols.remove(col_index)
-            else:
-                row = basis_index + 1
-                break
-        else:
+        # Find the first row missing a basis column
+        missing = np.flatnonzero(self.basis == 0)
+        if not len(missing):
             # Already have basis
             return None
-        for c in cols:
-            if neq(self._array[row, c], 0):
-                return row, c
-        else:
+        row = int(missing[0]) + 1
+        # Pivot on a non-zero in that row in a column not already basic
+        a = self._rows([row - 1])[0]
+        cols = np.flatnonzero((self._basis_rows[1:] == 0) &
+                              ~eq(a, 0, self.epsilon))
+        if not len(cols):
             raise PivotException('Impossible to establish basis.')
+        return row, int(cols[0]) + 1
 
     def get_subproblem_pivot(self):
-        _logger.debug("Computing subproblem pivot")
+        '''
+        Takes the first row with b < 0 as the objective of a subproblem
+        over the rows with b >= 0, which is canonical with the same basis,
+        and finds its primal simplex pivot. The subproblem is worked on in
+        place through the rows and columns of the parent tableau, without
+        copying it.
+        '''
         if any(self.basis == 0):
             raise PivotException("Must have full basis")
         if self.canonical or self.infeasible:
             return None
-        arr = self._array[1:, :]
-        b_negs = self.b < 0
-        i_b = next(i for i, b in enumerate(b_negs) if b)
-        # Form a subproblem with one of the b's
-        sub_c = arr[i_b, :].reshape(1, self.m)
-        sub_bA = arr[~b_negs, :]
-        sub_M = Tableau(np.r_[sub_c, sub_bA])
-        if sub_M.unbounded:
-            r = i_b + 1
-            c = next(j + 1 for j, a in enumerate(self.A[i_b, :]) if a < 0)
-            return r, c
-        sub_pivot = sub_M.get_simplex_pivot()
-        if not sub_pivot:
-            # Subproblem is either unbounded or optimal
-            if sub_M.optimal:
-                # Original tableau is infeasible
-                self._infeasible = True
-                self._optimal = self._unbounded = False
-                return None
-            else:
-                r = i_b + 1
-                c = next(j + 1 for j, a in enumerate(self.A[i_b, :]) if a < 0)
-                pivot = r, c
-        else:
-            sub_r, c = sub_pivot
-            r = next(i_b + 1 for i_subM, i_b
-                     in enumerate(i_b for b, i_b
-                                  in enumerate(~b_negs) if b)
-                     if i_subM == sub_r)
-            pivot = r, c
-        return pivot
-
-    def simplex_pivot(self):
-        pivot = self.get_simplex_pivot()
+        b_negs = ~geq(self.b, 0, self.epsilon)
+        i_b = int(np.argmax(b_negs))
+        sub_c = self._rows([i_b])[0]
+        negs = np.flatnonzero(~geq(sub_c, 0, self.epsilon))
+        if not len(negs):
+            # Subproblem is optimal, so the original is infeasible
+            self._infeasible = True
+            self._optimal = self._unbounded = False
+            return None
+        # Only the columns that improve the subproblem are needed
+        unbounded = ~self._positive_cols(negs + 1, ~b_negs)
+        if np.any(unbounded):
+            # Subproblem is unbounded along that column
+            return i_b + 1, int(negs[np.argmax(unbounded)]) + 1
+        col = int(negs[np.argmin(sub_c[negs])]) + 1
+        i = self._ratio_row(self._column(col), np.flatnonzero(~b_negs), col)
+        return i + 1, col
+
+    def simplex_pivot(self, pricing=None):
+        pivot = self.get_simplex_pivot(pricing)
         if pivot:
+            if pricing is not None:
+                pricing.update(self, *pivot)
             self.pivot(*pivot)
             # Simplex pivot preserves canonicity
             self._canonical = True
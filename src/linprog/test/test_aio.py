@@ -0,0 +1,95 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import asyncio
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog.test.test_precision import random_lp
+from linprog import Tableau, Simplex
+from linprog.aio import solve, TIMEOUT
+from linprog.batch import OPTIMAL
+from linprog.precision import from_basis
+from linprog.simplex import PERTURB
+
+
+class AsyncSolveTest(LoggingTest):
+
+    def test_homework(self):
+        for T, S in zip(homework_tableaus(), homework_tableaus()):
+            result = asyncio.run(solve(T, every=1))
+            Simplex(S).solve()
+            self.assertTrue(result.done)
+            self.assertEqual(result.status == OPTIMAL, S.optimal)
+            if S.optimal:
+                self.assertAlmostEqual(result.z, S.z)
+
+    def test_timeout(self):
+        T = Tableau(random_lp(40, 80, offset=1))
+        result = asyncio.run(solve(T, timeout=0))
+        self.assertEqual(result.status, TIMEOUT)
+        self.assertFalse(result.done)
+        self.assertEqual(result.iters, 1)
+        # The slack basis is feasible, so the partial result is too
+        self.assertTrue(result.feasible)
+        z = result.z
+        # Solving again resumes from the partial result
+        finished = asyncio.run(solve(T))
+        S = Tableau(random_lp(40, 80, offset=1))
+        s = Simplex(S)
+        s.solve()
+        self.assertEqual(finished.status, OPTIMAL)
+        self.assertAlmostEqual(finished.z, S.z)
+        self.assertLess(S.z, z)
+        self.assertEqual(result.iters + finished.iters, s.iters)
+
+    def test_interleaving(self):
+        # Other tasks run while the solve yields
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(ticker())
+            result = await solve(Tableau(random_lp(40, 80, offset=1)), every=5)
+            task.cancel()
+            return result
+
+        result = asyncio.run(main())
+        self.assertEqual(result.status, OPTIMAL)
+        self.assertGreaterEqual(len(ticks), result.iters // 5)
+
+    def test_cancel(self):
+        # Degenerate, so that the costs are perturbed after a pivot
+        array = random_lp(40, 80, offset=1)
+        array[2:, 0] = 0
+        T = Tableau(array.copy())
+
+        async def main():
+            task = asyncio.ensure_future(
+                solve(T, every=1, anticycling=PERTURB, stall=1))
+            for _ in range(3):
+                await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        # The tableau is left as it was after the last pivot, with the
+        # costs of the LP and without Bland's rule
+        self.assertGreater(T.last_pivot[0], 0)
+        self.assertFalse(T.bland)
+        expected = from_basis(array, T.basis)
+        self.assertAlmostEqual(np.abs(T.M - expected).max(), 0)
+
+    def test_every(self):
+        T = Tableau(random_lp(40, 80, offset=1))
+        for every in [0, -1]:
+            with self.assertRaises(ValueError):
+                asyncio.run(solve(T, every=every))
@@ -0,0 +1,80 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog import Tableau, Simplex
+from linprog.batch import (solve_batch, OPTIMAL, INFEASIBLE, UNBOUNDED,
+                           FAILED)
+
+
+def random_arrays(count, n, m, seed=0):
+    '''
+    Tableaus for min cx st Ax <= b, x >= 0 with slack columns.
+    Some have negative b, so they need Phase 0.
+    '''
+    rng = np.random.RandomState(seed)
+    arrays = np.zeros((count, n + 1, n + m + 1))
+    arrays[:, 0, 1:m + 1] = rng.uniform(-1, 1, (count, m))
+    arrays[:, 1:, 0] = rng.uniform(-0.5, 1, (count, n))
+    arrays[:, 1:, 1:m + 1] = rng.uniform(-1, 1, (count, n, m))
+    arrays[:, 1:, m + 1:] = np.eye(n)
+    return arrays
+
+
+class BatchTest(LoggingTest):
+
+    def test_solve_batch(self):
+        arrays = random_arrays(40, 4, 5)
+        result = solve_batch(arrays)
+        self.assertEqual(len(result), 40)
+        for k, array in enumerate(arrays):
+            T = Tableau(array.copy())
+            s = Simplex(T)
+            s.solve()
+            self.assertEqual(result.iters[k], s.iters)
+            if T.optimal:
+                self.assertEqual(result.status[k], OPTIMAL)
+                self.assertAlmostEqual(result.z[k], T.z)
+                self.assertAlmostEqual(np.abs(result.x[k] - T.x).sum(), 0)
+            elif T.infeasible:
+                self.assertEqual(result.status[k], INFEASIBLE)
+            else:
+                self.assertEqual(result.status[k], UNBOUNDED)
+        self.assertEqual(set(result.status),
+                         {OPTIMAL, INFEASIBLE, UNBOUNDED})
+
+    def test_near_zero(self):
+        # Entries within epsilon of 0 count as 0, as in Tableau
+        arrays = np.array([[[0., -1., 0., 0., 0.],
+                            [1., 1., 0., 1., 0.],
+                            [1e-13, 1e-12, 0., 0., 1.]],
+                           [[0., -1., -1., 0., 0.],
+                            [1., 1., 0., 1., 0.],
+                            [1., 0., 1e-12, 0., 1.]]])
+        result = solve_batch(arrays)
+        self.assertListEqual(list(result.status), [OPTIMAL, UNBOUNDED])
+        self.assertAlmostEqual(result.z[0], -1)
+        for k, array in enumerate(arrays):
+            T = Tableau(array.copy())
+            s = Simplex(T)
+            s.solve()
+            self.assertEqual(result.iters[k], s.iters)
+        self.assertTrue(T.unbounded)
+
+    def test_failed(self):
+        # Repeating a row leaves it with no basic column in Phase 0
+        arrays = random_arrays(3, 4, 5)
+        arrays[1, 2] = arrays[1, 1]
+        result = solve_batch(arrays)
+        self.assertEqual(result.status[1], FAILED)
+        self.assertTrue(np.isnan(result.z[1]))
+        for k in [0, 2]:
+            T = Tableau(arrays[k].copy())
+            Simplex(T).solve()
+            self.assertNotEqual(result.status[k], FAILED)
+            if T.optimal:
+                self.assertAlmostEqual(result.z[k], T.z)
@@ -0,0 +1,106 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog import Tableau, Simplex
+from linprog.bounded import BoundedTableau
+
+
+def bound_rows(array, lower, upper):
+    '''
+    The same LP with the bounds as rows and slack columns, and the
+    variables shifted by their lower bounds.
+    '''
+    n, m = array.shape
+    cols = np.flatnonzero(np.isfinite(upper))
+    k = len(cols)
+    out = np.zeros((n + k, m + k))
+    out[:n, :m] = array
+    out[:, 0] -= out[:, 1:m] @ lower
+    out[n + np.arange(k), cols + 1] = 1
+    out[n:, 0] = (upper - lower)[cols]
+    out[n:, m:] = np.eye(k)
+    return out
+
+
+class BoundedTableauTest(LoggingTest):
+
+    def test_bound_flip(self):
+        # min -2 x1 - x2 with x1 + x2 <= 4 and x1 <= 1
+        array = np.array([[0., -2., -1., 0.],
+                          [4., 1., 1., 1.]])
+        T = BoundedTableau(array, upper=[1, np.inf, np.inf])
+        # x1 reaches its upper bound before the slack leaves
+        self.assertTupleEqual(T.get_simplex_pivot(), (0, 1))
+        T.simplex_pivot()
+        self.assertTrue(T.flipped[0])
+        self.assertAlmostEqual(T.b[0], 3)
+        self.assertTupleEqual(T.get_simplex_pivot(), (1, 2))
+        T.simplex_pivot()
+        self.assertTrue(T.optimal)
+        self.assertAlmostEqual(T.z, -5)
+        self.assertAlmostEqual(np.abs(T.x - [1, 3, 0]).max(), 0)
+
+    def test_leave_at_upper(self):
+        # min -x1 with s - x1 = 0.5 and s <= 2: s leaves at its upper bound
+        array = np.array([[0., -1., 0.],
+                          [0.5, -1., 1.]])
+        T = BoundedTableau(array, upper=[np.inf, 2])
+        M = T.M.copy()
+        self.assertTupleEqual(T.get_simplex_pivot(), (1, 1))
+        # Finding the pivot leaves the tableau as it was
+        self.assertAlmostEqual(np.abs(T.M - M).max(), 0)
+        self.assertFalse(T.flipped[1])
+        T.simplex_pivot()
+        self.assertTrue(T.flipped[1])
+        self.assertTrue(T.optimal)
+        self.assertAlmostEqual(np.abs(T.x - [1.5, 2]).max(), 0)
+
+    def test_lower_bounds(self):
+        array = np.array([[0., 1., 1., 0.],
+                          [4., 1., 1., 1.]])
+        T = BoundedTableau(array, lower=[1, 2, 0], upper=[3, 3, np.inf])
+        Simplex(T).solve()
+        self.assertTrue(T.optimal)
+        self.assertAlmostEqual(T.z, 3)
+        self.assertAlmostEqual(np.abs(T.x - [1, 2, 1]).max(), 0)
+
+    def test_bad_bounds(self):
+        array = np.array([[0., 1., 0.],
+                          [4., 1., 1.]])
+        with self.assertRaises(ValueError):
+            BoundedTableau(array.copy(), upper=[-1, np.inf])
+        with self.assertRaises(ValueError):
+            BoundedTableau(array.copy(), lower=[-np.inf, 0])
+
+    def test_random(self):
+        rng = np.random.RandomState(1)
+        for _ in range(100):
+            n, m = rng.randint(1, 6), rng.randint(2, 6)
+            array = np.zeros((n + 1, n + m + 1))
+            array[0, 1:m + 1] = rng.uniform(-1, 1, m)
+            array[1:, 0] = rng.uniform(-1, 2, n)
+            array[1:, 1:m + 1] = rng.uniform(-1, 1, (n, m))
+            array[1:, m + 1:] = np.eye(n)
+            lower = np.r_[np.where(rng.rand(m) < .3,
+                                   rng.uniform(-1, 1, m), 0), np.zeros(n)]
+            upper = lower + np.r_[np.where(rng.rand(m) < .7,
+                                           rng.uniform(0, 2, m), np.inf),
+                                  np.full(n, np.inf)]
+            T = BoundedTableau(array.copy(), lower, upper)
+            Simplex(T).solve()
+            R = Tableau(bound_rows(array, lower, upper))
+            Simplex(R).solve()
+            self.assertEqual(T.optimal, R.optimal)
+            self.assertEqual(T.unbounded, R.unbounded)
+            if T.optimal:
+                self.assertAlmostEqual(T.z, R.z)
+                x = T.x
+                self.assertTrue(np.all(x >= lower - 1e-9))
+                self.assertTrue(np.all(x <= upper + 1e-9))
+                self.assertAlmostEqual(
+                    np.abs(array[1:, 1:] @ x - array[1:, 0]).max(), 0)
@@ -0,0 +1,81 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import itertools
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.batch import OPTIMAL, INFEASIBLE, FAILED
+from linprog.branch import BranchAndBound, BEST_BOUND, DEPTH_FIRST
+
+
+def knapsack(seed, n=3, m=5):
+    '''
+    A random LP in integers 0 <= x <= 3, with the tableau array and the
+    optimum found by enumeration.
+    '''
+    rng = np.random.RandomState(seed)
+    A = rng.randint(1, 10, (n, m)).astype(float)
+    b = rng.randint(10, 30, n).astype(float)
+    c = -rng.randint(1, 10, m).astype(float)
+    best = min(c @ x for x in itertools.product(range(4), repeat=m)
+               if np.all(A @ x <= b))
+    A = np.r_[A, np.eye(m)]
+    b = np.r_[b, np.full(m, 3.)]
+    k = len(b)
+    array = np.zeros((k + 1, k + m + 1))
+    array[0, 1:m + 1] = c
+    array[1:, 0] = b
+    array[1:, 1:m + 1] = A
+    array[1:, m + 1:] = np.eye(k)
+    return array, best
+
+
+class BranchAndBoundTest(LoggingTest):
+
+    def test_knapsack(self):
+        for seed in range(5):
+            array, best = knapsack(seed)
+            for selection in [BEST_BOUND, DEPTH_FIRST]:
+                bb = BranchAndBound(array, range(5), selection=selection)
+                self.assertTrue(bb.solve())
+                self.assertEqual(bb.status, OPTIMAL)
+                self.assertAlmostEqual(bb.z, best)
+                self.assertAlmostEqual(bb.gap, 0)
+                x = bb.x[:5]
+                self.assertAlmostEqual(np.abs(x - np.round(x)).max(), 0)
+                self.assertGreater(bb.throughput, 0)
+                self.assertAlmostEqual(bb.progress[-1].z, best)
+
+    def test_parallel(self):
+        array, best = knapsack(1)
+        bb = BranchAndBound(array, range(5), max_workers=2)
+        self.assertTrue(bb.solve())
+        self.assertAlmostEqual(bb.z, best)
+
+    def test_infeasible(self):
+        # 2 x = 1 has no integer solution
+        array = np.array([[0., 1.],
+                          [1., 2.]])
+        bb = BranchAndBound(array, [0])
+        self.assertFalse(bb.solve())
+        self.assertEqual(bb.status, INFEASIBLE)
+        self.assertIsNone(bb.z)
+
+    def test_failed_node(self):
+        # Two iterations solve the root but not every node, and the
+        # subtrees of the nodes that fail keep their parent's bound
+        array, best = knapsack(0)
+        bb = BranchAndBound(array, range(5), max_iters=2)
+        self.assertTrue(bb.solve())
+        self.assertGreater(bb.failed, 0)
+        self.assertEqual(bb.status, FAILED)
+        self.assertLess(bb.bound, best)
+        self.assertGreater(bb.gap, 0)
+        self.assertLess(bb.progress[-1].bound, best)
+
+    def test_selection(self):
+        with self.assertRaises(ValueError):
+            BranchAndBound(np.eye(2), [0], selection='breadth')
@@ -0,0 +1,57 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog import Tableau, Simplex, RevisedTableau
+from linprog.interior import InteriorPoint, independent_columns
+
+
+def status(T):
+    return T.optimal, T.infeasible, T.unbounded
+
+
+class InteriorPointTest(LoggingTest):
+
+    def test_homework(self):
+        for tableau in [Tableau, RevisedTableau]:
+            for T in homework_tableaus(tableau):
+                p = InteriorPoint(T.M.copy())
+                solved = p.solve(tableau)
+                Simplex(T).solve()
+                self.assertEqual(status(p.tableau), status(T))
+                self.assertEqual(solved, T.optimal)
+                if solved:
+                    self.assertAlmostEqual(p.tableau.z, T.z)
+
+    def test_crossover(self):
+        rng = np.random.RandomState(0)
+        n, m = 30, 60
+        array = np.zeros((n + 1, n + m + 1))
+        array[0, 1:m + 1] = rng.uniform(-1, 0, m)
+        array[1:, 1:m + 1] = rng.uniform(0, 1, (n, m))
+        array[1:, 0] = array[1:, 1:m + 1] @ rng.uniform(0, 1, m)
+        array[1:, m + 1:] = np.eye(n)
+        T = Tableau(array.copy())
+        Simplex(T).solve()
+        p = InteriorPoint(array)
+        self.assertTrue(p.solve())
+        self.assertTrue(p.converged)
+        self.assertLess(abs(p.tableau.z - T.z), 1e-9)
+        # The basis from the interior point is already optimal
+        self.assertEqual(p.crossover_iters, 0)
+        self.assertTrue(np.all(p.tableau.basis))
+        A, b = array[1:, 1:], array[1:, 0]
+        self.assertLess(np.abs(A @ p.tableau.x - b).max(), 1e-9)
+
+    def test_independent_columns(self):
+        A = np.array([[1., 2., 0., 1.],
+                      [1., 2., 0., 0.],
+                      [0., 0., 0., 1.]])
+        # Column 1 is twice column 0, and column 2 is zero
+        cols = independent_columns(A, np.array([1, 0, 2, 3]), 1e-9)
+        self.assertListEqual(cols.tolist(), [1, 3])
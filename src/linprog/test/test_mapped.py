@@ -0,0 +1,80 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import os
+import tempfile
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog import Tableau, Simplex
+from linprog.mapped import MappedTableau
+
+
+class MappedTableauTest(LoggingTest):
+
+    def test_homework(self):
+        for T in homework_tableaus():
+            M = MappedTableau(T.M.copy(), chunk_rows=2)
+            self.assertTrue(np.all(M.basis == T.basis))
+            Simplex(T).solve()
+            Simplex(M).solve()
+            self.assertEqual(T.optimal, M.optimal)
+            self.assertEqual(T.infeasible, M.infeasible)
+            self.assertAlmostEqual(np.abs(T.M - M.M).max(), 0)
+
+    def test_status(self):
+        # Unbounded: column 2 improves and has no positive entries
+        T = MappedTableau(np.array([[0., 0., -1., 0.],
+                                    [1., 1., -2., 0.],
+                                    [2., 0., 0., 1.]]), chunk_rows=1)
+        self.assertTrue(T.unbounded)
+        # Infeasible: second row has b < 0 and no negative entries
+        T = MappedTableau(np.array([[0., 0., 1., 0.],
+                                    [1., 1., 2., 0.],
+                                    [-2., 0., 1., 1.]]), chunk_rows=1)
+        self.assertTrue(T.infeasible)
+        with self.assertRaises(ValueError):
+            MappedTableau(np.eye(2), dtype=np.float32)
+
+    def test_file(self):
+        array = np.array([[0., -6., -5., -3., -7., 0., 0., 0.],
+                          [50., 1., 1., 0., 3., 1., 0., 0.],
+                          [150., 2., 1., 2., 1., 0., 1., 0.],
+                          [80., 1., 1., 1., 4., 0., 0., 1.]])
+        T = Tableau(array.copy())
+        Simplex(T).solve()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tableau.npy')
+            np.save(path, array)
+            M = MappedTableau.open(path, chunk_rows=2)
+            self.assertIsInstance(M.M, np.memmap)
+            Simplex(M).solve()
+            M.flush()
+            self.assertAlmostEqual(M.z, T.z)
+            self.assertAlmostEqual(np.abs(np.load(path) - T.M).max(), 0)
+            del M
+
+    def test_chunked_reads(self):
+        # The columns and cost updates read chunk by chunk match Tableau
+        rng = np.random.RandomState(0)
+        array = np.zeros((8, 15))
+        array[0, 1:8] = rng.uniform(-1, 1, 7)
+        array[1:, 0] = rng.uniform(-1, 1, 7)
+        array[1:, 1:8] = rng.uniform(-1, 1, (7, 7))
+        array[1:, 8:] = np.eye(7)
+        T = Tableau(array.copy())
+        M = MappedTableau(array.copy(), chunk_rows=3)
+        for t in [T, M]:
+            t.pivot(2, 1)
+            t.pivot(5, 3)
+        cols = np.array([1, 4, 9])
+        self.assertAlmostEqual(np.abs(T._columns(cols) -
+                                      M._columns(cols)).max(), 0)
+        delta = rng.uniform(0, 1, 14)
+        T.add_costs(delta)
+        M.add_costs(delta)
+        self.assertAlmostEqual(np.abs(T.M - M.M).max(), 0)
+        self.assertTrue(np.all(M.basis == T.basis))
@@ -0,0 +1,44 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_batch import random_arrays
+from linprog.test.test_simplex import homework_tableaus
+from linprog import Tableau, RevisedTableau, Simplex
+from linprog.batch import OPTIMAL
+from linprog.parallel import solve_many, iter_solve_many
+
+
+class ParallelTest(LoggingTest):
+
+    def test_solve_many(self):
+        arrays = [T.M.copy() for T in homework_tableaus()]
+        arrays += list(random_arrays(20, 3, 4))
+        solutions = solve_many(arrays, max_workers=2, chunksize=3)
+        self.assertEqual(len(solutions), len(arrays))
+        for array, solution in zip(arrays, solutions):
+            T = Tableau(array.copy())
+            s = Simplex(T)
+            s.solve()
+            self.assertEqual(solution.iters, s.iters)
+            self.assertAlmostEqual(np.abs(solution.array - T.M).sum(), 0)
+            if T.optimal:
+                self.assertEqual(solution.status, OPTIMAL)
+                self.assertAlmostEqual(solution.z, T.z)
+        # The inputs are left alone
+        self.assertAlmostEqual(np.abs(arrays[0] - homework_tableaus()[0].M)
+                               .sum(), 0)
+
+    def test_iter_solve_many(self):
+        arrays = random_arrays(10, 3, 4)
+        revised = solve_many(arrays, max_workers=2, tableau=RevisedTableau)
+        seen = set()
+        for index, solution in iter_solve_many(arrays, max_workers=2,
+                                               chunksize=1):
+            seen.add(index)
+            self.assertEqual(solution.status, revised[index].status)
+        self.assertEqual(seen, set(range(10)))
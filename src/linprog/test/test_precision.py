@@ -0,0 +1,91 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog import Tableau, Simplex, RevisedTableau
+from linprog.precision import MixedPrecision, from_basis
+from linprog.tableau import EPSILON, tolerance, eq
+
+
+def random_lp(n=30, m=60, seed=0, offset=0):
+    '''
+    A feasible LP with n rows and m columns plus slacks. offset is added
+    to b, so that the slack basis is not degenerate if it is positive.
+    '''
+    rng = np.random.RandomState(seed)
+    array = np.zeros((n + 1, n + m + 1))
+    array[0, 1:m + 1] = rng.uniform(-1, 0, m)
+    array[1:, 1:m + 1] = rng.uniform(0, 1, (n, m))
+    array[1:, 0] = array[1:, 1:m + 1] @ rng.uniform(0, 1, m) + offset
+    array[1:, m + 1:] = np.eye(n)
+    return array
+
+
+class PrecisionTest(LoggingTest):
+
+    def test_tolerance(self):
+        self.assertEqual(tolerance(np.float64), EPSILON)
+        self.assertGreater(tolerance(np.float32), 1e-3)
+        self.assertLess(tolerance(np.float32), 1e-2)
+        self.assertTrue(eq(np.float32(1), np.float32(1.0001)))
+        self.assertFalse(eq(1., 1.0001))
+        T = Tableau(np.eye(2), dtype=np.float32)
+        self.assertEqual(T.M.dtype, np.float32)
+        self.assertEqual(T.epsilon, tolerance(np.float32))
+
+    def test_homework(self):
+        for tableau in [Tableau, RevisedTableau]:
+            for T in homework_tableaus(tableau):
+                p = MixedPrecision(T.M.copy())
+                solved = p.solve(tableau)
+                Simplex(T).solve()
+                self.assertEqual(p.low.epsilon, tolerance(np.float32))
+                self.assertEqual(solved, T.optimal)
+                if solved:
+                    self.assertAlmostEqual(p.tableau.z, T.z)
+
+    def test_from_basis(self):
+        array = np.array([[0., -6., -5., -3., -7., 0., 0., 0.],
+                          [50., 1., 1., 0., 3., 1., 0., 0.],
+                          [150., 2., 1., 2., 1., 0., 1., 0.],
+                          [80., 1., 1., 1., 4., 0., 0., 1.]])
+        T = Tableau(array.copy())
+        T.pivot(1, 1)
+        T.pivot(2, 3)
+        arr = from_basis(array, T.basis)
+        self.assertAlmostEqual(np.abs(arr - T.M).max(), 0)
+
+    def test_cleanup(self):
+        # The cleanup solve recovers full precision from the float32 basis
+        array = random_lp()
+        T = Tableau(array.copy())
+        Simplex(T).solve()
+        p = MixedPrecision(array)
+        self.assertTrue(p.solve())
+        self.assertLess(abs(p.tableau.z - T.z), 1e-9)
+        self.assertLess(p.cleanup_iters, p.iters)
+
+    def test_max_iters(self):
+        # The cleanup solve continues from where the float32 solve stopped
+        array = random_lp()
+        T = Tableau(array.copy())
+        s = Simplex(T)
+        s.solve()
+        for tableau in [Tableau, RevisedTableau]:
+            p = MixedPrecision(array)
+            self.assertTrue(p.solve(tableau, max_iters=12))
+            self.assertLess(p.iters, s.iters)
+            self.assertLess(abs(p.tableau.z - T.z), 1e-9)
+
+    def test_revised_dtype(self):
+        p = MixedPrecision(random_lp())
+        self.assertTrue(p.solve(RevisedTableau))
+        self.assertEqual(p.low._factors[0].dtype, np.float32)
+        self.assertEqual(p.low.b.dtype, np.float32)
+        self.assertEqual(p.low._multipliers().dtype, np.float32)
+        self.assertEqual(p.tableau._factors[0].dtype, np.float64)
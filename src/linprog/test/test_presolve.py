@@ -0,0 +1,88 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog import Tableau, Simplex
+from linprog.presolve import Presolve
+
+
+class PresolveTest(LoggingTest):
+
+    def check(self, array):
+        '''
+        Solves array with and without presolve and compares the results.
+        '''
+        p = Presolve(array)
+        solved = p.solve()
+        T = Tableau(np.array(array))
+        Simplex(T).solve()
+        self.assertEqual(solved, T.optimal)
+        if solved:
+            self.assertAlmostEqual(p.z, T.z)
+            A, b, c = array[1:, 1:], array[1:, 0], array[0, 1:]
+            self.assertAlmostEqual(np.abs(A @ p.x - b).max(), 0)
+            self.assertTrue(np.all(p.x >= 0))
+            self.assertAlmostEqual(c @ p.x - array[0, 0], p.z)
+        return p
+
+    def test_homework(self):
+        for T in homework_tableaus():
+            self.check(T.M.copy())
+
+    def test_reductions(self):
+        array = np.array([[0., -1., -2., -4., 3., -1., 0., 0., 0.],
+                          # Singleton row fixes x1 = 2
+                          [4., 2., 0., 0., 0., 0., 0., 0., 0.],
+                          [10., 1., 1., 2., 1., 0., 1., 0., 0.],
+                          # Duplicate of the row above
+                          [20., 2., 2., 4., 2., 0., 2., 0., 0.],
+                          # Forced row fixes x4 = 0
+                          [0., 0., 0., 0., 1., 0., 0., 0., 0.],
+                          [6., 0., 1., 0., 0., 1., 0., 1., 0.],
+                          [5., 0., 0., 1., 0., 0., 0., 0., 1.]])
+        # Without presolve, the duplicate row leaves Phase 0 unable to
+        # find a basis
+        p = Presolve(array)
+        self.assertTrue(p.solve())
+        self.assertEqual(p.rows.sum() - 1, 3)
+        self.assertAlmostEqual(p.z, -24)
+        x = [2., 0., 4., 0., 6., 0., 0., 1.]
+        self.assertAlmostEqual(np.abs(p.x - x).max(), 0)
+
+    def test_dominated_cols(self):
+        # Column 2 is twice column 1 at less than twice the cost
+        array = np.array([[0., -1., -3., 0.],
+                          [4., 1., 2., 1.]])
+        p = self.check(array)
+        self.assertEqual(p.x[0], 0)
+
+    def test_infeasible(self):
+        # The duplicate row asks for a different b
+        array = np.array([[0., -1., -1., 0.],
+                          [4., 1., 1., 1.],
+                          [9., 2., 2., 2.]])
+        p = Presolve(array)
+        self.assertTrue(p.infeasible)
+        self.assertFalse(p.solve())
+        # The singleton row asks for x < 0
+        p = Presolve(np.array([[0., 1., 1.],
+                               [-1., 1., 0.],
+                               [1., 1., 1.]]))
+        self.assertTrue(p.infeasible)
+
+    def test_random(self):
+        rng = np.random.RandomState(0)
+        for _ in range(50):
+            n, m = rng.randint(2, 6), rng.randint(2, 6)
+            array = np.zeros((n + 1, n + m + 1))
+            array[0, 1:m + 1] = rng.uniform(-1, 1, m)
+            array[1:, 0] = rng.uniform(-1, 1, n)
+            array[1:, 1:m + 1] = rng.uniform(-1, 1, (n, m))
+            array[1:, m + 1:] = np.eye(n)
+            array[-1, 1:] = np.abs(array[-1, 1:])
+            self.check(array)
@@ -0,0 +1,74 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog import Simplex, Tableau, RevisedTableau
+from linprog.pricing import (Dantzig, Bland, SteepestEdge, Devex,
+                             PartialPricing)
+
+
+def scaled_lp(n, m, seed=0):
+    '''
+    A feasible LP with rows and columns scaled over several orders of
+    magnitude, as bench/problems.py makes it.
+    '''
+    rng = np.random.RandomState(seed)
+    A = rng.uniform(0, 1, (n, m))
+    b = A @ rng.uniform(0, 1, m) + rng.uniform(0, 1, n)
+    c = rng.uniform(-1, 0, m)
+    rng = np.random.RandomState(seed)
+    rows = 10 ** rng.uniform(-3, 3, n)
+    cols = 10 ** rng.uniform(-3, 3, m)
+    array = np.zeros((n + 1, n + m + 1))
+    array[0, 1:m + 1] = c * cols
+    array[1:, 0] = b * rows
+    array[1:, 1:m + 1] = A * rows[:, np.newaxis] * cols
+    array[1:, m + 1:] = np.eye(n)
+    return array
+
+
+class PricingTest(LoggingTest):
+
+    rules = [Dantzig, Bland, SteepestEdge, Devex, lambda: PartialPricing(2)]
+
+    def test_homework(self):
+        for tableau in [Tableau, RevisedTableau]:
+            expected = homework_tableaus(tableau)
+            for T in expected:
+                Simplex(T).solve()
+            for rule in self.rules:
+                found = homework_tableaus(tableau)
+                for T, M in zip(expected, found):
+                    Simplex(M, pricing=rule()).solve()
+                    self.assertEqual(T.optimal, M.optimal)
+                    self.assertEqual(T.infeasible, M.infeasible)
+                    if T.optimal:
+                        self.assertAlmostEqual(T.z, M.z)
+
+    def test_partial_pricing(self):
+        T = Tableau(np.array([[0., -1., -3., 2., -2., 0.],
+                              [1., 1., 1., 1., 1., 1.]]))
+        pricing = PartialPricing(2)
+        self.assertEqual(pricing.choose(T), 1)
+        pricing.start = 2
+        self.assertEqual(pricing.choose(T), 3)
+        # Wraps around past the end of c
+        T = Tableau(np.array([[0., -1., -3., 2., 2., 0.],
+                              [1., 1., 1., 1., 1., 1.]]))
+        self.assertEqual(pricing.choose(T), 0)
+
+    def test_scaled(self):
+        # A roundoff level c of a basic column must not make it enter
+        array = scaled_lp(200, 400)
+        found = []
+        for rule in [SteepestEdge, Devex]:
+            T = Tableau(array.copy())
+            Simplex(T, pricing=rule(), max_iters=1000).solve()
+            self.assertTrue(T.optimal)
+            found.append(T.z)
+        self.assertLess(abs(found[1] - found[0]), 1e-3 * abs(found[0]))
@@ -0,0 +1,130 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import io
+import numpy as np
+from linprog.test import LoggingTest
+from linprog import Tableau, Simplex
+from linprog.bounded import BoundedTableau
+from linprog.reader import read_mps, read_lp
+
+# max 3 x + 2 y + z - 1 subject to
+#   c1: x + y + z <= 4
+#   c2: x + 3 y >= 2
+#   c3: 1 <= x - z <= 3 (a range)
+# with 0 <= x <= 2, y >= -1 and z free.
+# The optimum is x = 2, y = 3, z = -1, with an objective of 10.
+MPS = '''\
+NAME          example
+* A comment
+OBJSENSE
+    MAX
+ROWS
+ N  obj
+ L  c1
+ G  c2
+ G  c3
+ N  free
+COLUMNS
+    x         obj       3.0        c1        1.0
+    x         c2        1.0        c3        1.0
+    MARKER    'MARKER'  'INTORG'
+    y         obj       2.0        c1        1.0
+    y         c2        3.0        free      5.0
+    MARKER    'MARKER'  'INTEND'
+    z         obj       1.0        c1        1.0
+    z         c3        -1.0
+RHS
+    RHS       c1        4.0        c2        2.0
+    RHS       c3        1.0        obj       1.0
+RANGES
+    RNG       c3        2.0
+BOUNDS
+ UP BND       x         2.0
+ LO BND       y         -1.0
+ FR BND       z
+ENDATA
+'''
+
+LP = '''\
+\\ The same LP
+Maximize
+ obj: 3 x + 2 y
+      + z - 1
+Subject To
+ c1: x + y + z <= 4
+ c2: x + 3 y >= 2
+ c3: 1 <= x - z <= 3
+Bounds
+ x <= 2
+ y >= -1
+ z free
+End
+'''
+
+
+class ReaderTest(LoggingTest):
+
+    def check(self, p):
+        self.assertListEqual(p.columns, ['x', 'y', 'z'])
+        self.assertTrue(p.maximize)
+        # 4 rows (the range is two) and an upper bound row, and z split
+        self.assertTupleEqual(p.array.shape, (6, 10))
+        T = Tableau(np.array(p.array))
+        Simplex(T).solve()
+        self.assertTrue(T.optimal)
+        self.assertAlmostEqual(p.objective(T.z), 10)
+        x = p.postsolve(T.x)
+        self.assertAlmostEqual(np.abs(x - [2, 3, -1]).max(), 0)
+
+    def test_mps(self):
+        p = read_mps(io.StringIO(MPS))
+        self.assertListEqual(p.rows, ['c1', 'c2', 'c3'])
+        self.check(p)
+
+    def test_lp(self):
+        p = read_lp(io.StringIO(LP))
+        self.assertListEqual(p.rows, ['c1', 'c2', 'c3'])
+        self.check(p)
+        self.assertAlmostEqual(
+            np.abs(p.array - read_mps(io.StringIO(MPS)).array).max(), 0)
+
+    def test_sparse(self):
+        for read, text in [(read_mps, MPS), (read_lp, LP)]:
+            dense = read(io.StringIO(text)).array
+            sparse = read(io.StringIO(text), sparse=True).array
+            self.assertAlmostEqual(np.abs(sparse.toarray() - dense).max(), 0)
+
+    def test_bounds(self):
+        # The bound on x is left to BoundedTableau instead of a row
+        for read, text in [(read_mps, MPS), (read_lp, LP)]:
+            p = read(io.StringIO(text), bounds_as_rows=False)
+            self.assertTupleEqual(p.array.shape, (5, 9))
+            self.assertListEqual(list(p.column_upper),
+                                 [2.] + [np.inf] * 7)
+            T = BoundedTableau(p.array, upper=p.column_upper)
+            Simplex(T).solve()
+            self.assertTrue(T.optimal)
+            self.assertAlmostEqual(p.objective(T.z), 10)
+            x = p.postsolve(T.x)
+            self.assertAlmostEqual(np.abs(x - [2, 3, -1]).max(), 0)
+        self.assertIsNone(read_mps(io.StringIO(MPS)).column_upper)
+
+    def test_lp_statements(self):
+        # Unnamed constraints, constants, and a statement across lines
+        p = read_lp(io.StringIO('minimize\n'
+                                '- x - 2 y + 3\n'
+                                'st\n'
+                                'x + y\n'
+                                '+ 1 <= 5\n'
+                                '-x+y>=-2\n'
+                                'end\n'))
+        self.assertListEqual(p.rows, ['R0', 'R1'])
+        self.assertFalse(p.maximize)
+        expected = np.array([[-3., -1., -2., 0., 0.],
+                             [4., 1., 1., 1., 0.],
+                             [2., 1., -1., 0., 1.]])
+        self.assertAlmostEqual(np.abs(p.array - expected).max(), 0)
@@ -0,0 +1,59 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from unittest import mock
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog.test.test_tableau import error
+from linprog import Tableau, RevisedTableau, Simplex
+from linprog import revised
+from linprog.revised import lu_factor, lu_solve
+
+
+class RevisedTableauTest(LoggingTest):
+
+    def test_lu(self):
+        rng = np.random.RandomState(0)
+        A = rng.uniform(-1, 1, (6, 6))
+        v = rng.uniform(-1, 1, 6)
+        for scipy in [True, False]:
+            with mock.patch.object(revised, '_lu_factor',
+                                   revised._lu_factor if scipy else None):
+                factors = lu_factor(A)
+            self.assertAlmostEqual(error(A @ lu_solve(factors, v), v), 0)
+            self.assertAlmostEqual(
+                error(A.T @ lu_solve(factors, v, True), v), 0)
+            V = rng.uniform(-1, 1, (6, 3))
+            self.assertAlmostEqual(error(A @ lu_solve(factors, V), V), 0)
+        A[:, 2] = A[:, 1]
+        with self.assertRaises(np.linalg.LinAlgError):
+            lu_factor(A)
+
+    def test_pivot(self):
+        array = np.array([[0., -6., -5., -3., -7., 0., 0., 0.],
+                          [50., 1., 1., 0., 3., 1., 0., 0.],
+                          [150., 2., 1., 2., 1., 0., 1., 0.],
+                          [80., 1., 1., 1., 4., 0., 0., 1.],
+                          [9., 0., 0., 0., 0., 0., 0., 1.]])
+        T = Tableau(array.copy())
+        R = RevisedTableau(array.copy(), refactor_every=2)
+        for pivot in [(1, 1), (2, 3), (3, 2)]:
+            T.pivot(*pivot)
+            R.pivot(*pivot)
+            self.assertAlmostEqual(np.abs(T.M - R.M).sum(), 0)
+            self.assertEqual(error(T.basis, R.basis), 0)
+
+    def test_simplex(self):
+        revised = homework_tableaus(RevisedTableau)
+        for T, R in zip(homework_tableaus(), revised):
+            Simplex(T).solve()
+            Simplex(R).solve()
+            self.assertEqual(T.optimal, R.optimal)
+            self.assertEqual(T.infeasible, R.infeasible)
+            if T.optimal:
+                self.assertAlmostEqual(T.z, R.z)
+                self.assertAlmostEqual(np.abs(T.x - R.x).sum(), 0)
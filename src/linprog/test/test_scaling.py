@@ -0,0 +1,55 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog import Tableau, Simplex
+from linprog.scaling import Scaling
+
+
+class ScalingTest(LoggingTest):
+
+    def test_homework(self):
+        for T in homework_tableaus():
+            array = T.M.copy()
+            s = Scaling(array)
+            # The identity columns survive scaling
+            self.assertTrue(np.all(Tableau(s.array).basis == T.basis))
+            solved = s.solve()
+            Simplex(T).solve()
+            self.assertEqual(solved, T.optimal)
+            if solved:
+                # x may be a different optimal solution
+                self.assertAlmostEqual(s.z, T.z)
+                self.assertAlmostEqual(
+                    np.abs(array[1:, 1:] @ s.x - array[1:, 0]).max(), 0)
+                self.assertTrue(np.all(s.x >= 0))
+
+    def test_badly_scaled(self):
+        rng = np.random.RandomState(0)
+        n, m = 10, 20
+        A = rng.uniform(0, 1, (n, m))
+        array = np.zeros((n + 1, n + m + 1))
+        array[0, 1:m + 1] = rng.uniform(-1, 0, m)
+        array[1:, 0] = A @ rng.uniform(0, 1, m) + 1
+        array[1:, 1:m + 1] = A
+        array[1:, m + 1:] = np.eye(n)
+        T = Tableau(array.copy())
+        Simplex(T).solve()
+        rows = 10 ** rng.uniform(-3, 3, n)
+        cols = 10 ** rng.uniform(-3, 3, m)
+        array[1:, :m + 1] *= rows[:, np.newaxis]
+        array[:, 1:m + 1] *= cols
+        s = Scaling(array)
+        # Magnitudes of A are brought within a small range
+        A = np.abs(s.array[1:, 1:])
+        self.assertLess(A.max() / A[A > 0].min(), 1e3)
+        self.assertTrue(np.all(np.log2(s.rows) % 1 == 0))
+        self.assertTrue(s.solve())
+        self.assertAlmostEqual(s.z, T.z)
+        x = s.x[:m] * cols
+        self.assertAlmostEqual(np.abs(x - T.x[:m]).max(), 0)
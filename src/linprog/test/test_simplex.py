@@ -8,8 +8,63 @@ import numpy as np
 import logging
 import sys
 from linprog.test import LoggingTest
-from linprog import Tableau
+from linprog import Tableau, RevisedTableau
 from linprog import Simplex
+from linprog.simplex import MaxIterationsReachedError, BLAND, PERTURB
+
+
+def homework_tableaus(tableau=Tableau):
+    '''
+    The homework problems, each built with the given tableau class.
+    '''
+    # From HW2 #
+    M1 = tableau(np.array([0., -1, -2, -1, 0, 0,
+                           4, 1, 1, 1, 1, 0,
+                           0, 1, -1, 0, 0, 1]).reshape(3, 6))
+    # From HW3 #
+    M2 = tableau(np.array([0., -1, 1, 2, -1, 0, 0,
+                           4, 2, 3, 0, -3, 1, 0,
+                           -2, -1, 0, -1, 0, 0, 1,
+                           1, 1, 2, 0, -2, 0, 0]).reshape(4, 7))
+    M3 = tableau(np.array([-6., -1, 1, -1, 0,
+                           8, 2, -2, -6, 0,
+                           6, 2, 3, -2, 1]).reshape(3, 5))
+    # From HW4 #
+    M4 = tableau(np.array([0., -1, 1, -1, 2, 0, 0,
+                           4, 2, 3, -3, 0, 1, 0,
+                           2, 1, 0, 0, 1, 0, -1,
+                           1, 1, 2, -2, 0, 0, 0]).reshape(4, 7))
+    M5 = tableau(np.array([3., 1, 0, 0, 1, 0,
+                           -1, 1, 1, 0, -1, 0,
+                           -4, -1, 0, 1, -1, 0,
+                           1, 1, 0, 0, 0, 1]).reshape(4, 6))
+    # From HW5 #
+    M6 = tableau(np.array([0., 0, 2, 0, 0,
+                           -3, -1, -1, 1, 0,
+                           -1, 0, -1, 0, 1]).reshape(3, 5))
+    # From HW6 #
+    M7 = tableau(np.array([0., 0, -1, -1, -1, 0,
+                           10, 1, 1, 1, 1, 0,
+                           5, 0, 1, 1, 1 / 6, 1]).reshape(3, 6))
+    M8 = tableau(np.array([0., 10, 5, 0, 0, 0,
+                           1, 1, 1, -1, 0, 0,
+                           1, 1, 1, 0, -1, 0,
+                           1, 1, 1 / 6, 0, 0, -1]).reshape(4, 6))
+    # From HW7 #
+    M9 = tableau(np.array([395., 0, 0, 0, 7, 3, 1, 1,
+                           -5, 0, 1, 0, 7, 0, -1, 2,
+                           55, 1, 0, 0, -4, 1, 1, -2,
+                           30, 0, 0, 1, 1, -1, 0, 1]).reshape(4, 8))
+    M10 = tableau(np.array([0., -6, -5, -3, -7, 0, 0, 0,
+                            50, 1, 1, 0, 3, 1, 0, 0,
+                            150, 2, 1, 2, 1, 0, 1, 0,
+                            80, 1, 1, 1, 4, 0, 0, 1,
+                            9, 0, 0, 0, 0, 0, 0, 1]).reshape(5, 8))
+    M11 = tableau(np.array([0., -6, -5, -3, -7, 0, 0, 0,
+                            50, 1, 1, 0, 3, 1, 0, 0,
+                            165, 2, 1, 2, 1, 0, 1, 0,
+                            80, 1, 1, 1, 4, 0, 0, 1]).reshape(4, 8))
+    return [M1, M2, M3, M4, M5, M6, M7, M8, M9, M10, M11]
 
 
 class SimplexTest(LoggingTest):
@@ -20,54 +75,7 @@ class SimplexTest(LoggingTest):
     logger.setLevel(logging.DEBUG)
 
     def test_simplex(self):
-        # From HW2 #
-        M1 = Tableau(np.array([0., -1, -2, -1, 0, 0,
-                               4, 1, 1, 1, 1, 0,
-                               0, 1, -1, 0, 0, 1]).reshape(3, 6))
-        # From HW3 #
-        M2 = Tableau(np.array([0., -1, 1, 2, -1, 0, 0,
-                               4, 2, 3, 0, -3, 1, 0,
-                               -2, -1, 0, -1, 0, 0, 1,
-                               1, 1, 2, 0, -2, 0, 0]).reshape(4, 7))
-        M3 = Tableau(np.array([-6., -1, 1, -1, 0,
-                               8, 2, -2, -6, 0,
-                               6, 2, 3, -2, 1]).reshape(3, 5))
-        # From HW4 #
-        M4 = Tableau(np.array([0., -1, 1, -1, 2, 0, 0,
-                               4, 2, 3, -3, 0, 1, 0,
-                               2, 1, 0, 0, 1, 0, -1,
-                               1, 1, 2, -2, 0, 0, 0]).reshape(4, 7))
-        M5 = Tableau(np.array([3., 1, 0, 0, 1, 0,
-                               -1, 1, 1, 0, -1, 0,
-                               -4, -1, 0, 1, -1, 0,
-                               1, 1, 0, 0, 0, 1]).reshape(4, 6))
-        # From HW5 #
-        M6 = Tableau(np.array([0., 0, 2, 0, 0,
-                               -3, -1, -1, 1, 0,
-                               -1, 0, -1, 0, 1]).reshape(3, 5))
-        # From HW6 #
-        M7 = Tableau(np.array([0., 0, -1, -1, -1, 0,
-                               10, 1, 1, 1, 1, 0,
-                               5, 0, 1, 1, 1 / 6, 1]).reshape(3, 6))
-        M8 = Tableau(np.array([0., 10, 5, 0, 0, 0,
-                               1, 1, 1, -1, 0, 0,
-                               1, 1, 1, 0, -1, 0,
-                               1, 1, 1 / 6, 0, 0, -1]).reshape(4, 6))
-        # From HW7 #
-        M9 = Tableau(np.array([395., 0, 0, 0, 7, 3, 1, 1,
-                               -5, 0, 1, 0, 7, 0, -1, 2,
-                               55, 1, 0, 0, -4, 1, 1, -2,
-                               30, 0, 0, 1, 1, -1, 0, 1]).reshape(4, 8))
-        M10 = Tableau(np.array([0., -6, -5, -3, -7, 0, 0, 0,
-                                50, 1, 1, 0, 3, 1, 0, 0,
-                                150, 2, 1, 2, 1, 0, 1, 0,
-                                80, 1, 1, 1, 4, 0, 0, 1,
-                                9, 0, 0, 0, 0, 0, 0, 1]).reshape(5, 8))
-        M11 = Tableau(np.array([0., -6, -5, -3, -7, 0, 0, 0,
-                                50, 1, 1, 0, 3, 1, 0, 0,
-                                165, 2, 1, 2, 1, 0, 1, 0,
-                                80, 1, 1, 1, 4, 0, 0, 1]).reshape(4, 8))
-        tableaus = [M1, M2, M3, M4, M5, M6, M7, M8, M9, M10, M11]
+        tableaus = homework_tableaus()
         for i, M in enumerate(tableaus):
             print("Tableau:", M, sep="\n")
             s = Simplex(M)
@@ -78,3 +86,39 @@ class SimplexTest(LoggingTest):
             print(s.iters, " iterations to solve.")
             print("Optimal!" if M.optimal else "Infeasible!")
             print('{:=^75}'.format(''))
+
+    def test_anticycling(self):
+        # Beale's example, which cycles with Dantzig's rule and ties broken
+        # by the first row
+        beale = np.array([[0., 0., 0., 0., -.75, 20., -.5, 6.],
+                          [0., 1., 0., 0., .25, -8., -1., 9.],
+                          [0., 0., 1., 0., .5, -12., -.5, 3.],
+                          [1., 0., 0., 1., 0., 0., 1., 0.]])
+        for tableau in [Tableau, RevisedTableau]:
+            s = Simplex(tableau(beale.copy()), max_iters=100)
+            with self.assertRaises(MaxIterationsReachedError):
+                s.solve()
+            self.assertEqual(s.degenerate, s.iters)
+            for anticycling in [BLAND, PERTURB]:
+                T = tableau(beale.copy())
+                s = Simplex(T, max_iters=100, anticycling=anticycling,
+                            stall=10, seed=0)
+                self.assertTrue(s.solve())
+                self.assertAlmostEqual(T.z, -1.25)
+                self.assertGreater(s.stalls, 0)
+                self.assertFalse(T.bland)
+        with self.assertRaises(ValueError):
+            Simplex(Tableau(beale.copy()), anticycling='lexicographic')
+
+    def test_perturbation(self):
+        # Perturbing from the first degenerate pivot on, and removing the
+        # perturbation afterwards, finds the same optima
+        for T, M in zip(homework_tableaus(), homework_tableaus()):
+            c = M.c.copy()
+            Simplex(T).solve()
+            Simplex(M, anticycling=PERTURB, stall=1, seed=0).solve()
+            self.assertEqual(T.optimal, M.optimal)
+            if T.optimal:
+                self.assertAlmostEqual(T.z, M.z)
+                self.assertAlmostEqual(c @ M.x + M.z, c @ T.x + T.z)
+                self.assertTrue(np.all(M.c[M.basis - 1] == 0))
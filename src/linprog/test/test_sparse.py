@@ -0,0 +1,74 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import unittest
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog.test.test_tableau import error
+from linprog import Tableau, Simplex
+
+try:
+    from linprog.sparse import SparseTableau
+except ImportError:
+    SparseTableau = None
+
+
+@unittest.skipIf(SparseTableau is None, 'scipy is not installed')
+class SparseTableauTest(LoggingTest):
+
+    def test_pivot(self):
+        array = np.array([[0., -6., -5., -3., -7., 0., 0., 0.],
+                          [50., 1., 1., 0., 3., 1., 0., 0.],
+                          [150., 2., 1., 2., 1., 0., 1., 0.],
+                          [80., 1., 1., 1., 4., 0., 0., 1.],
+                          [9., 0., 0., 0., 0., 0., 0., 1.]])
+        T = Tableau(array.copy())
+        S = SparseTableau(array.copy())
+        self.assertEqual(error(T.basis, S.basis), 0)
+        for pivot in [(1, 1), (2, 3), (3, 2)]:
+            T.pivot(*pivot)
+            S.pivot(*pivot)
+            self.assertAlmostEqual(np.abs(T.M - S.M.toarray()).sum(), 0)
+            self.assertEqual(error(T.basis, S.basis), 0)
+
+    def test_simplex(self):
+        sparse = homework_tableaus(SparseTableau)
+        for T, S in zip(homework_tableaus(), sparse):
+            Simplex(T).solve()
+            Simplex(S).solve()
+            self.assertEqual(T.optimal, S.optimal)
+            self.assertEqual(T.infeasible, S.infeasible)
+            if T.optimal:
+                self.assertAlmostEqual(T.z, S.z)
+                self.assertAlmostEqual(np.abs(T.x - S.x).sum(), 0)
+
+    def test_random(self):
+        # Sparse LPs, many with negative b, solve as the dense tableau does
+        rng = np.random.RandomState(0)
+        n, m = 15, 30
+        optimal = 0
+        for _ in range(10):
+            array = np.zeros((n + 1, n + m + 1))
+            A = rng.uniform(-0.5, 1, (n, m)) * (rng.uniform(0, 1, (n, m)) <
+                                                0.2)
+            # The last row bounds the sum of x
+            A[-1] = 1
+            array[0, 1:m + 1] = rng.uniform(-1, 0, m)
+            array[1:, 0] = rng.uniform(-0.2, 1, n)
+            array[-1, 0] = 5
+            array[1:, 1:m + 1] = A
+            array[1:, m + 1:] = np.eye(n)
+            T, S = Tableau(array.copy()), SparseTableau(array.copy())
+            s, t = Simplex(T), Simplex(S)
+            s.solve()
+            t.solve()
+            self.assertEqual(s.iters, t.iters)
+            self.assertEqual(T.optimal, S.optimal)
+            self.assertEqual(T.infeasible, S.infeasible)
+            self.assertAlmostEqual(np.abs(T.M - S.M.toarray()).max(), 0)
+            optimal += T.optimal
+        self.assertGreater(optimal, 5)
@@ -0,0 +1,52 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import json
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog import Tableau, Simplex, RevisedTableau
+from linprog.stats import Stats, OPERATIONS
+from linprog.trace import PHASES
+
+
+class StatsTest(LoggingTest):
+
+    def test_off_by_default(self):
+        T = homework_tableaus()[0]
+        s = Simplex(T)
+        s.solve()
+        self.assertIsNone(s.stats)
+
+    def test_stats(self):
+        for tableau in (Tableau, RevisedTableau):
+            for T in homework_tableaus(tableau):
+                s = Simplex(T, stats=True, trace=True)
+                s.solve()
+                stats = s.stats
+                self.assertEqual(sum(stats.iters.values()), s.iters)
+                self.assertEqual(sum(stats.degenerate.values()), s.degenerate)
+                records = s.trace.records
+                for phase, name in enumerate(PHASES):
+                    self.assertEqual(stats.pivots[name],
+                                     sum((records['phase'] == phase) &
+                                         (records['row'] > 0)))
+                for name in OPERATIONS:
+                    self.assertGreaterEqual(stats.seconds[name], 0)
+                if s.iters:
+                    self.assertGreater(stats.seconds['pivot'], 0)
+                # The timing wrappers are removed after the solve
+                self.assertNotIn('pivot', T.__dict__)
+                self.assertNotIn('_ratio_row', T.__dict__)
+
+    def test_export(self):
+        stats = Stats(memory=True)
+        for T in homework_tableaus():
+            Simplex(T, stats=stats).solve()
+        d = json.loads(stats.to_json())
+        self.assertEqual(d, json.loads(json.dumps(stats.to_dict())))
+        self.assertGreater(sum(d['iters'].values()), 0)
+        self.assertGreater(d['peak_memory'], 0)
+        self.assertIn('primal', str(stats))
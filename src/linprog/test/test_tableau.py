@@ -7,6 +7,7 @@ Created on May 21, 2016
 import numpy as np
 from linprog.test import LoggingTest
 from linprog import Tableau
+from linprog.tableau import eq, harris
 
 
 def error(X, Y):
@@ -66,13 +67,15 @@ class TableauTest(LoggingTest):
                               [8., 0., -1., 0., -7., 0., 1., 0.],
                               [71., 1., 1., 1., 4., 0., 0., 0.],
                               [9., 0., 0., 0., 0., 0., 0., 1.]]))
-        T2 = Tableau(np.array([[69., 0., 1., -14., 0., 17., 0., 0.],
+        T2 = Tableau(np.array([[363., 0., 1., 0., 14., 3., 0., 0.],
                                [21., 0., 0., 1., 1., -1., 0., 0.],
-                               [155., 0., -1., 7., 0., -7., 1., 0.],
-                               [-13., 1., 1., -3., 0., 4., 0., 0.],
+                               [8., 0., -1., 0., -7., 0., 1., 0.],
+                               [50., 1., 1., 0., 3., 1., 0., 0.],
                                [9., 0., 0., 0., 0., 0., 0., 1.]]))
+        self.assertTupleEqual(T.get_dual_simplex_pivot(), (1, 3))
         T.dual_simplex_pivot()
         self.assertAlmostEqual(error(T.M, T2.M), 0)
+        self.assertTrue(T.optimal)
 
     def test_subproblem_pivot(self):
         T = Tableau(np.array([[69., 0., 1., -14., 0., 17., 0., 0.],
@@ -90,3 +93,90 @@ class TableauTest(LoggingTest):
         T.subproblem_pivot()
         self.assertAlmostEqual(error(T.M, T2.M), 0)
         self.assertTrue(T.optimal)
+
+    def test_subproblem_pivot_unbounded(self):
+        # Row 1 can be raised along column 3 without leaving row 2, so the
+        # subproblem is unbounded and the pivot is taken in row 1
+        T = Tableau(np.array([[0., 0., 0., -1.],
+                              [-1., 1., 0., -1.],
+                              [1., 0., 1., -1.]]))
+        self.assertTupleEqual(T.get_subproblem_pivot(), (1, 3))
+        T.subproblem_pivot()
+        self.assertTrue(T.canonical)
+
+    def test_subproblem_pivot_unbounded_column(self):
+        # Column 3 is a rounding residue, column 4 is bounded by row 2,
+        # and the subproblem is unbounded along column 5
+        T = Tableau(np.array([[0., 0., 0., 0., 0., 0.],
+                              [-1., 1., 0., -1e-12, -1., -1.],
+                              [1., 0., 1., 0., 1., -1.]]))
+        self.assertTupleEqual(T.get_subproblem_pivot(), (1, 5))
+        T.subproblem_pivot()
+        self.assertTrue(T.canonical)
+
+    def test_status(self):
+        # Optimal
+        T = Tableau(np.array([[3., 0., 1., 0.],
+                              [1., 1., 2., 0.],
+                              [2., 0., 1., 1.]]))
+        self.assertEqual(error(T.basis, [1, 3]), 0)
+        self.assertTrue(T.canonical)
+        self.assertTrue(T.optimal)
+        self.assertFalse(T.infeasible)
+        self.assertFalse(T.unbounded)
+        # Unbounded: column 2 improves and has no positive entries
+        T = Tableau(np.array([[0., 0., -1., 0.],
+                              [1., 1., -2., 0.],
+                              [2., 0., 0., 1.]]))
+        self.assertTrue(T.canonical)
+        self.assertTrue(T.unbounded)
+        self.assertFalse(T.optimal)
+        # Infeasible: second row has b < 0 and no negative entries
+        T = Tableau(np.array([[0., 0., 1., 0.],
+                              [1., 1., 2., 0.],
+                              [-2., 0., 1., 1.]]))
+        self.assertFalse(T.canonical)
+        self.assertTrue(T.infeasible)
+        # A 1 in the c row does not make a column basic
+        T = Tableau(np.array([[0., 1., 0.],
+                              [1., 0., 1.]]))
+        self.assertEqual(error(T.basis, [2]), 0)
+
+    def test_basis_tracking(self):
+        T = Tableau(np.array([[0., -6., -5., -3., -7., 0., 0., 0.],
+                              [50., 1., 1., 0., 3., 1., 0., 0.],
+                              [150., 2., 1., 2., 1., 0., 1., 0.],
+                              [80., 1., 1., 1., 4., 0., 0., 1.]]))
+        self.assertEqual(error(T.basis, [5, 6, 7]), 0)
+        T.pivot(1, 1)
+        self.assertEqual(error(T.basis, [1, 6, 7]), 0)
+        T.pivot(2, 3)
+        self.assertEqual(error(T.basis, [1, 3, 7]), 0)
+        tracked = T.basis.copy()
+        self.assertEqual(error(T.rebuild_basis(), tracked), 0)
+        self.assertEqual(error(T.x, [50., 0., 25., 0., 0., 0., 5.]), 0)
+
+    def test_tolerance(self):
+        self.assertTrue(eq(1., 1. + 1e-8))
+        self.assertFalse(eq(1., 1. + 1e-8, 1e-9))
+        # b is within the default epsilon of 0, but not within 1e-9
+        array = np.array([[0., 1., 0.],
+                          [-1e-8, 1., 1.]])
+        self.assertTrue(Tableau(array.copy()).canonical)
+        self.assertFalse(Tableau(array.copy(), epsilon=1e-9).canonical)
+        # Relative to the largest magnitude in A
+        T = Tableau(array * 100, epsilon=1e-9, relative=True)
+        self.assertAlmostEqual(T.epsilon, 1e-7)
+
+    def test_harris(self):
+        # Rows 1 and 2 tie within epsilon, and Harris' test picks the one
+        # with the larger pivot element
+        array = np.array([[0., -1., 0., 0.],
+                          [1., 1., 1., 0.],
+                          [2. + 1e-9, 2., 0., 1.]])
+        self.assertTupleEqual(Tableau(array.copy()).get_simplex_pivot(),
+                              (1, 1))
+        T = Tableau(array.copy(), harris=True)
+        self.assertTupleEqual(T.get_simplex_pivot(), (2, 1))
+        self.assertEqual(harris(np.array([1., 2.]), np.array([np.inf] * 2),
+                                np.ones(2)), None)
@@ -0,0 +1,43 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog.test.test_simplex import homework_tableaus
+from linprog import Tableau, Simplex, RevisedTableau
+from linprog.trace import Trace, PRIMAL, PHASES
+
+
+class TraceTest(LoggingTest):
+
+    def test_off_by_default(self):
+        s = Simplex(homework_tableaus()[0])
+        s.solve()
+        self.assertIsNone(s.trace)
+
+    def test_trace(self):
+        for tableau in (Tableau, RevisedTableau):
+            for T in homework_tableaus(tableau):
+                s = Simplex(T, trace=True)
+                s.solve()
+                records = s.trace.records
+                self.assertEqual(len(records), s.iters)
+                pivoted = records[records['row'] > 0]
+                if T.optimal and len(pivoted):
+                    self.assertAlmostEqual(pivoted['z'][-1], T.z)
+                primal = records[records['phase'] == PRIMAL]
+                # Primal simplex pivots never increase z
+                self.assertTrue(np.all(np.diff(primal['z']) <= 1e-7))
+
+    def test_records(self):
+        trace = Trace(capacity=1)
+        trace.record(PRIMAL, (1, 2), 3.)
+        trace.record(PRIMAL, None, 3.)
+        self.assertEqual(len(trace), 2)
+        self.assertEqual(trace.records['column'].tolist(), [2, 0])
+        self.assertIn(PHASES[PRIMAL], str(trace))
+        trace.clear()
+        self.assertEqual(len(trace), 0)
@@ -0,0 +1,61 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+
+import numpy as np
+from linprog.test import LoggingTest
+from linprog import Tableau, Simplex
+from linprog.warmstart import WarmStart
+
+
+class WarmStartTest(LoggingTest):
+
+    array = np.array([[0., -6., -5., -3., -7., 0., 0., 0.],
+                      [50., 1., 1., 0., 3., 1., 0., 0.],
+                      [150., 2., 1., 2., 1., 0., 1., 0.],
+                      [80., 1., 1., 1., 4., 0., 0., 1.]])
+
+    def cold(self, array):
+        T = Tableau(array.copy())
+        Simplex(T).solve()
+        return T
+
+    def test_set_b(self):
+        w = WarmStart(self.array)
+        self.assertTrue(w.solve())
+        b = np.array([50., 165., 80.])
+        w.set_b(b)
+        self.assertTrue(w.solve())
+        array = self.array.copy()
+        array[1:, 0] = b
+        T = self.cold(array)
+        self.assertAlmostEqual(w.tableau.z, T.z)
+        self.assertAlmostEqual(np.abs(w.tableau.x - T.x).sum(), 0)
+
+    def test_set_c(self):
+        w = WarmStart(self.array)
+        w.solve()
+        c = np.array([-1., -8., -3., -2., 0., 0., 0.])
+        w.set_c(c)
+        self.assertTrue(w.tableau.canonical)
+        self.assertTrue(w.solve())
+        array = self.array.copy()
+        array[0, 1:] = c
+        self.assertAlmostEqual(w.tableau.z, self.cold(array).z)
+
+    def test_add_constraint(self):
+        w = WarmStart(self.array)
+        w.solve()
+        a = np.array([0., 0., 0., 1., 0., 0., 0.])
+        w.add_constraint(a, 9.)
+        self.assertTrue(w.solve())
+        array = np.array([[0., -6., -5., -3., -7., 0., 0., 0., 0.],
+                          [50., 1., 1., 0., 3., 1., 0., 0., 0.],
+                          [150., 2., 1., 2., 1., 0., 1., 0., 0.],
+                          [80., 1., 1., 1., 4., 0., 0., 1., 0.],
+                          [9., 0., 0., 0., 1., 0., 0., 0., 1.]])
+        T = self.cold(array)
+        self.assertAlmostEqual(w.tableau.z, T.z)
+        self.assertAlmostEqual(np.abs(w.tableau.x - T.x).sum(), 0)
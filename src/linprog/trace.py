@@ -0,0 +1,59 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+
+A structured record of the pivots Simplex takes. Enable it with
+Simplex(tableau, trace=True) instead of turning on DEBUG logging; nothing
+is recorded, and nothing is logged per pivot, when it is off.
+'''
+import numpy as np
+
+BASIS = 0
+DUAL = 1
+SUBPROBLEM = 2
+PRIMAL = 3
+
+PHASES = ('basis', 'dual', 'subproblem', 'primal')
+
+
+class Trace:
+    '''
+    One record per iteration in a compact structured array, with fields
+    phase (one of BASIS, DUAL, SUBPROBLEM, PRIMAL), row and column of the
+    pivot (both 0 if the iteration did not pivot), and z, the objective
+    value of the basic solution after the iteration.
+    '''
+
+    dtype = np.dtype([('phase', 'i1'), ('row', 'i4'), ('column', 'i4'),
+                      ('z', 'f8')])
+
+    def __init__(self, capacity=64):
+        self._records = np.zeros(capacity, dtype=self.dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __str__(self):
+        return '\n'.join('%s %s %s %s %s' % (i, PHASES[phase], row, column, z)
+                         for i, (phase, row, column, z)
+                         in enumerate(self.records.tolist(), 1))
+
+    @property
+    def records(self):
+        return self._records[:self._size]
+
+    def record(self, phase, pivot, z):
+        '''
+        Appends a record. pivot is a (row, column) pair or None.
+        '''
+        if self._size == len(self._records):
+            self._records = np.resize(self._records,
+                                      max(2 * self._size, 1))
+        row, column = pivot or (0, 0)
+        self._records[self._size] = (phase, row, column, z)
+        self._size += 1
+
+    def clear(self):
+        self._size = 0
@@ -0,0 +1,107 @@
+'''
+Created on Oct 18, 2026
+
+@author: Gudmundur Heimisson
+'''
+import numpy as np
+import logging
+from linprog.simplex import solve_counted
+from linprog.tableau import Tableau
+
+_logger = logging.getLogger(__name__)
+
+
+class WarmStart:
+    '''
+    Solves an LP repeatedly as its b or c change or constraints are added,
+    restarting each solve from the basis the last one ended with.
+
+    A copy of the original array is kept so that the current tableau can
+    be recomputed from the basis after a change. A change to b, or an
+    added constraint, leaves c >= 0 but may make b negative, so Simplex
+    restores feasibility with dual simplex pivots. A change to c leaves
+    the tableau canonical, so Simplex continues with primal pivots.
+    If the last solve did not end with a full basis, the next solve
+    starts from scratch.
+    '''
+
+    def __init__(self, array, max_iters=10000, **kwargs):
+        '''
+        max_iters and any further keyword arguments, such as pricing, set
+        up the Simplex of every solve.
+        '''
+        self.original = np.array(array, dtype=float)
+        self.tableau = Tableau(self.original.copy())
+        self.max_iters = max_iters
+        self.kwargs = kwargs
+        self.iters = 0
+
+    def solve(self):
+        '''
+        Solves from the current tableau, and returns true if it is optimal.
+        The iterations taken are left in iters.
+        '''
+        return solve_counted(self, 'iters', self.tableau,
+                             max_iters=self.max_iters, **self.kwargs)
+
+    def _warm_basis(self):
+        '''
+        Returns the basis to warm start from, or None if there is no full
+        basis, in which case the tableau is reset to the original.
+        '''
+        basis = self.tableau.basis
+        if not np.all(basis):
+            _logger.debug("No basis to warm start from")
+            self.tableau = Tableau(self.original.copy())
+            return None
+        return basis
+
+    def _multipliers(self, basis, B):
+        return np.linalg.solve(B.T, self.original[0, basis])
+
+    def set_b(self, b):
+        '''
+        Replaces b in the original problem.
+        '''
+        self.original[1:, 0] = b
+        basis = self._warm_basis()
+        if basis is None:
+            return
+        B = self.original[1:, basis]
+        arr = self.tableau.M
+        arr[1:, 0] = np.linalg.solve(B, self.original[1:, 0])
+        arr[0, 0] = (self.original[0, 0] -
+                     self._multipliers(basis, B) @ self.original[1:, 0])
+        self.tableau._reset_status()
+
+    def set_c(self, c):
+        '''
+        Replaces c in the original problem.
+        '''
+        self.original[0, 1:] = c
+        basis = self._warm_basis()
+        if basis is None:
+            return
+        B = self.original[1:, basis]
+        arr = self.tableau.M
+        arr[0, :] = (self.original[0, :] -
+                     self._multipliers(basis, B) @ self.original[1:, :])
+        arr[0, basis] = 0
+        self.tableau._reset_status()
+
+    def add_constraint(self, a, b):
+        '''
+        Adds the constraint ax <= b, where a has an entry for each column
+        of A, with a new slack column.
+        '''
+        n, m = self.original.shape
+        row = np.r_[b, a, 1.]
+        self.original = np.r_[np.c_[self.original, np.zeros(n)],
+                              row.reshape(1, m + 1)]
+        basis = self._warm_basis()
+        if basis is None:
+            return
+        arr = np.c_[self.tableau.M, np.zeros(n)]
+        # Express the new row in terms of the current basis
+        row = row - row[basis] @ arr[1:, :]
+        self.tableau = Tableau(np.r_[arr, row.reshape(1, m + 1)])